@@ -96,6 +96,8 @@ async def lifespan(app: FastAPI):
     yield
     # Shutdown
     logger.info("🏰 Shutting down Tavern Simulator API...")
+    if app_state.economy:
+        app_state.economy.save_snapshot()
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -131,7 +133,7 @@ async def initialize_systems():
         
         # Initialize other systems
         app_state.agent_manager = AgentManager()
-        app_state.economy = TavernEconomySystem()
+        app_state.economy = TavernEconomySystem(persistence_dir="data/economy")
         app_state.narrative = NarrativeEngine(economy_system=app_state.economy)
         app_state.simulator = TavernSimulator()
         app_state.gsap_renderer = GSAPRenderer()
@@ -178,7 +178,7 @@ class EnhancedDashboard:
             self._render_narrative_metrics(narrative)
         
         # Full-width charts
-        self._render_trend_charts()
+        self._render_trend_charts(economy)
     
     def _render_economic_metrics(self, economy):
         """Render economic metrics with animated charts"""
@@ -302,9 +302,12 @@ class EnhancedDashboard:
         except Exception as e:
             st.error(f"❌ Narrative metrics error: {e}")
     
-    def _render_trend_charts(self):
+    def _render_trend_charts(self, economy=None):
         """Render trend charts for historical data"""
-        if PLOTLY_AVAILABLE:
+        time_series = getattr(economy, 'time_series', None)
+        if PLOTLY_AVAILABLE and time_series is not None and time_series.metrics():
+            self._render_recorded_trends(time_series)
+        elif PLOTLY_AVAILABLE:
             # Generate sample trend data
             dates = pd.date_range(start=datetime.now() - timedelta(days=7), end=datetime.now(), freq='H')
 
@@ -357,6 +360,40 @@ class EnhancedDashboard:
             </div>
             """, unsafe_allow_html=True)
     
+    def _render_recorded_trends(self, time_series, resolution: str = "minute", hours: int = 24):
+        """Render price, reputation and supply trends recorded by the economy"""
+        since = (datetime.now() - timedelta(hours=hours)).timestamp()
+
+        fig_trends = go.Figure()
+        trend_lines = [
+            ("reputation:tavern", "Reputation", "#4CAF50"),
+            ("supply_quality", "Supply Quality", "#ff6b6b")
+        ]
+        trend_lines += [(metric, metric.split(":", 1)[1].title() + " Price", None)
+                        for metric in time_series.metrics("price:")]
+
+        for metric, label, color in trend_lines:
+            times, values = time_series.query(metric, resolution=resolution, start=since)
+            if len(times) == 0:
+                continue
+            fig_trends.add_trace(go.Scatter(
+                x=[datetime.fromtimestamp(t) for t in times], y=values, mode='lines', name=label,
+                line=dict(color=color) if color else None,
+                yaxis='y' if not metric.startswith("price:") else 'y2'
+            ))
+
+        fig_trends.update_layout(
+            title=f"📈 Economic Trends (Last {hours} Hours)",
+            xaxis_title="Time",
+            yaxis=dict(title="Score (0-100)"),
+            yaxis2=dict(title="Price (gold)", overlaying='y', side='right'),
+            height=400,
+            paper_bgcolor="rgba(0,0,0,0)",
+            plot_bgcolor="rgba(40,20,10,0.3)"
+        )
+
+        st.plotly_chart(fig_trends, use_container_width=True)
+
     def render_agent_monitoring(self, narrative):
         """Render agent monitoring dashboard"""
         st.markdown("""
@@ -0,0 +1,232 @@
+"""
+Background simulation for the Warhammer Fantasy Tavern Simulator
+Runs turns on a worker thread at a set rate and publishes immutable snapshots for a UI to show
+"""
+
+import threading
+import time
+from dataclasses import dataclass, replace
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from .character import Character
+from .event import Interaction
+from .session_log import LogRecord
+
+PUBLISH_INTERVAL = 0.05      # Seconds between batches of turns (and snapshots)
+MAX_TURNS_PER_BATCH = 500    # Keeps a batch short even when the worker falls behind
+GRAPH_PATRON_LIMIT = 400     # Relationship edges are left out of snapshots of bigger crowds
+RECENT_INTERACTIONS = 20
+
+@dataclass(frozen=True)
+class PatronSnapshot:
+    """A patron's changing stats at snapshot time
+
+    character is the live object, for the fields that never change during a
+    session (appearance, backstory, skills); everything else is copied.
+    """
+    name: str
+    faction: str
+    health: int
+    wealth: int
+    drunk_level: int
+    drunk: bool
+    mood: str
+    character: Character
+
+@dataclass(frozen=True)
+class TavernSnapshot:
+    """Everything the tavern panels show, copied at one moment"""
+    name: str
+    description: str
+    location: str
+    atmosphere: str
+    atmosphere_description: str
+    tension_level: int
+    reputation: int
+    occupancy: int
+    capacity: int
+    current_events: Tuple[str, ...]
+
+@dataclass(frozen=True)
+class SimulationSnapshot:
+    """State of a simulator after some turn, safe to read from another thread
+
+    graph_key changes whenever the relationships or the crowd do, so views
+    can skip redrawing. relationship_edges is None when the crowd is too
+    big to draw. log_records are the log entries since the previous
+    snapshot its consumer saw, ending before log_cursor.
+    """
+    turn: int
+    session_start_time: datetime
+    tavern: Optional[TavernSnapshot]
+    patrons: Tuple[PatronSnapshot, ...]
+    available_characters: Tuple[str, ...]
+    graph_key: Tuple
+    relationship_edges: Optional[Tuple[Tuple[str, str, int], ...]]
+    recent_interactions: Tuple[Interaction, ...]
+    interaction_count: int
+    log_records: Tuple[LogRecord, ...]
+    log_cursor: Optional[int]
+    turns_per_second: float = 0.0
+
+def take_snapshot(simulator, log_cursor: Optional[int] = None, previous: SimulationSnapshot = None) -> SimulationSnapshot:
+    """Copy what the UI shows out of a simulator
+
+    Log records are only read when log_cursor is given. Relationship edges
+    are reused from previous when nothing they depend on changed.
+    """
+    records: Tuple[LogRecord, ...] = ()
+    if log_cursor is not None:
+        read, log_cursor = simulator.read_log(log_cursor)
+        records = tuple(read)
+
+    tavern = simulator.current_tavern
+    # Counted and tailed without pulling a loaded session's whole history in from disk
+    recent = tuple(simulator.recent_interactions(RECENT_INTERACTIONS))
+    interaction_count = simulator.interaction_count()
+    if tavern is None:
+        return SimulationSnapshot(
+            turn=simulator.turn_counter, session_start_time=simulator.session_start_time, tavern=None,
+            patrons=(), available_characters=tuple(simulator.available_characters), graph_key=(None,),
+            relationship_edges=(), recent_interactions=recent,
+            interaction_count=interaction_count, log_records=records, log_cursor=log_cursor
+        )
+
+    characters = tavern.characters
+    patrons = tuple(
+        PatronSnapshot(c.name, c.faction.value, c.health, c.wealth, c.drunk_level, c.is_drunk(), c.current_mood, c)
+        for c in characters
+    )
+    graph_key = (id(tavern), tavern.relationships.version, characters.version)
+    if previous is not None and previous.graph_key == graph_key:
+        edges = previous.relationship_edges
+    elif len(characters) > GRAPH_PATRON_LIMIT:
+        edges = None
+    else:
+        names = [c.name for c in characters]
+        edges = tuple(tavern.relationships.undirected_edges(names, include_neutral=len(names) <= 5))
+
+    return SimulationSnapshot(
+        turn=simulator.turn_counter,
+        session_start_time=simulator.session_start_time,
+        tavern=TavernSnapshot(
+            name=tavern.name, description=tavern.description, location=tavern.location,
+            atmosphere=tavern.atmosphere.value, atmosphere_description=tavern.atmosphere_description,
+            tension_level=tavern.tension_level, reputation=tavern.reputation,
+            occupancy=tavern.current_occupancy, capacity=tavern.capacity,
+            current_events=tuple(tavern.current_events)
+        ),
+        patrons=patrons,
+        available_characters=tuple(name for name in simulator.available_characters if not characters.has_name(name)),
+        graph_key=graph_key,
+        relationship_edges=edges,
+        recent_interactions=recent,
+        interaction_count=interaction_count,
+        log_records=records,
+        log_cursor=log_cursor
+    )
+
+class AutoRunner:
+    """Advances a simulator on a worker thread at a steady number of turns per second
+
+    Each batch runs the turns due since the last one (fast-forwarded) while
+    holding `lock`, then publishes a snapshot. Anyone else touching the
+    simulator while the runner is going must hold the lock too. The UI
+    polls for the newest snapshot at its own pace; log records of snapshots
+    it never saw are carried into the next one it gets, so none are lost.
+    While running, the runner owns the log cursor: its consumer reads the
+    log only through snapshots.
+    """
+
+    def __init__(self, simulator, turns_per_second: float = 5.0, lock: threading.RLock = None):
+        self.simulator = simulator
+        self.turns_per_second = turns_per_second
+        self.lock = lock or threading.RLock()
+        self.error: Optional[BaseException] = None
+
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._publish_lock = threading.Lock()
+        self._latest: Optional[SimulationSnapshot] = None
+        self._pending_records: List[LogRecord] = []
+        self._log_cursor = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def set_rate(self, turns_per_second: float):
+        self.turns_per_second = max(0.0, float(turns_per_second))
+
+    def start(self, log_cursor: int = 0):
+        """Start running turns; log records from log_cursor on are published"""
+        if self.running:
+            return
+        self.error = None
+        self._stop.clear()
+        self._log_cursor = log_cursor
+        self._thread = threading.Thread(target=self._run, name="tavern-simulation", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = None):
+        """Stop after the current batch and wait for the worker to finish"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def reset_log(self, log_cursor: int):
+        """Publish log records from log_cursor on, dropping any not yet polled
+
+        For a log view that started over (after the log was cleared, say).
+        """
+        with self.lock, self._publish_lock:
+            self._log_cursor = log_cursor
+            self._pending_records = []
+            if self._latest is not None:
+                self._latest = replace(self._latest, log_cursor=None)
+
+    def poll(self) -> Optional[SimulationSnapshot]:
+        """Newest snapshot published since the last poll (with every log record since then), if any"""
+        with self._publish_lock:
+            snapshot, self._latest = self._latest, None
+            records, self._pending_records = self._pending_records, []
+        if snapshot is None:
+            return None
+        return replace(snapshot, log_records=tuple(records))
+
+    def _publish(self, snapshot: SimulationSnapshot):
+        with self._publish_lock:
+            self._latest = snapshot
+            self._pending_records.extend(snapshot.log_records)
+
+    def _run(self):
+        last = time.monotonic()
+        due = 0.0
+        previous = None
+        rate_start, rate_turns = last, 0
+        try:
+            while not self._stop.wait(PUBLISH_INTERVAL):
+                now = time.monotonic()
+                due = min(due + (now - last) * self.turns_per_second, MAX_TURNS_PER_BATCH)
+                last = now
+                turns = int(due)
+                if not turns:
+                    continue
+                due -= turns
+
+                rate_turns += turns
+                with self.lock:
+                    self.simulator.advance_turns(turns)
+                    snapshot = take_snapshot(self.simulator, self._log_cursor, previous)
+                    elapsed = time.monotonic() - rate_start
+                    snapshot = replace(snapshot, turns_per_second=rate_turns / elapsed if elapsed > 0 else 0.0)
+                    # Still under the lock, so reset_log cannot slip in between reading and publishing
+                    self._log_cursor = snapshot.log_cursor
+                    self._publish(snapshot)
+                if elapsed > 2.0:
+                    rate_start, rate_turns = time.monotonic(), 0
+                previous = snapshot
+        except Exception as e:
+            self.error = e
@@ -0,0 +1,166 @@
+"""
+Headless batch simulation runner for the Warhammer Fantasy Tavern Simulator
+Shards independent taverns across a process pool and collects compact per-turn metrics
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Dict, Optional, Sequence
+
+import numpy as np
+
+from .tavern_simulator import TavernSimulator
+
+@dataclass
+class TavernRunMetrics:
+    """Per-turn metrics of one headless tavern run"""
+    tavern_index: int
+    seed: int
+    tavern_name: str
+    n_characters: int
+    tension: np.ndarray               # int16 tension level after each turn
+    brawls: np.ndarray                # int16 brawls started during each turn
+    interactions: np.ndarray          # int16 interactions performed during each turn
+    relationship_delta: np.ndarray    # int16 net relationship change during each turn
+
+    @property
+    def total_brawls(self) -> int:
+        return int(self.brawls.sum())
+
+@dataclass
+class BatchResult:
+    """Metrics and throughput of a batch run"""
+    runs: List[TavernRunMetrics]
+    n_turns: int
+    workers: int
+    elapsed: float
+    seed: int
+    turns_per_sec: float = field(init=False)
+
+    def __post_init__(self):
+        total_turns = len(self.runs) * self.n_turns
+        self.turns_per_sec = total_turns / self.elapsed if self.elapsed > 0 else 0.0
+
+    def tension_matrix(self) -> np.ndarray:
+        """(n_taverns, n_turns) tension levels"""
+        return np.stack([run.tension for run in self.runs]) if self.runs else np.empty((0, self.n_turns))
+
+    def summary(self) -> Dict:
+        tension = self.tension_matrix()
+        return {
+            "taverns": len(self.runs),
+            "turns": self.n_turns,
+            "workers": self.workers,
+            "elapsed": self.elapsed,
+            "turns_per_sec": self.turns_per_sec,
+            "mean_tension": float(tension.mean()) if tension.size else 0.0,
+            "brawls_per_tavern": float(np.mean([run.total_brawls for run in self.runs])) if self.runs else 0.0
+        }
+
+def tavern_seed(batch_seed: int, tavern_index: int) -> int:
+    """Independent, reproducible seed for one tavern of a batch"""
+    return int(np.random.SeedSequence(batch_seed, spawn_key=(tavern_index,)).generate_state(1)[0])
+
+def simulate_tavern(tavern_index: int, n_turns: int, batch_seed: int) -> TavernRunMetrics:
+    """Run one tavern headlessly and record its per-turn metrics"""
+    seed = tavern_seed(batch_seed, tavern_index)
+    simulator = TavernSimulator(seed=seed, snapshot_spacing=None)
+    tavern = simulator.generate_new_tavern()
+
+    tension = np.zeros(n_turns, dtype=np.int16)
+    brawls = np.zeros(n_turns, dtype=np.int16)
+    interactions = np.zeros(n_turns, dtype=np.int16)
+    relationship_delta = np.zeros(n_turns, dtype=np.int16)
+
+    history = simulator.interaction_history
+    for turn in range(n_turns):
+        brawls_before = tavern.brawl_count
+
+        simulator.advance_turns(1)
+
+        tension[turn] = tavern.tension_level
+        brawls[turn] = tavern.brawl_count - brawls_before
+        interactions[turn] = len(history)
+        relationship_delta[turn] = sum(i.relationship_change for i in history)
+
+        # Only the aggregates above are kept, so memory stays flat however long the run
+        history.clear()
+        simulator.event_history.clear()
+        simulator.compact_log.clear()
+
+    return TavernRunMetrics(
+        tavern_index=tavern_index,
+        seed=seed,
+        tavern_name=tavern.name,
+        n_characters=len(tavern.characters),
+        tension=tension,
+        brawls=brawls,
+        interactions=interactions,
+        relationship_delta=relationship_delta
+    )
+
+def _run_shard(tavern_indices: Sequence[int], n_turns: int, batch_seed: int) -> List[TavernRunMetrics]:
+    return [simulate_tavern(index, n_turns, batch_seed) for index in tavern_indices]
+
+def run_batch(n_taverns: int, n_turns: int, seed: int = 0,
+              max_workers: Optional[int] = None, shards_per_worker: int = 4) -> BatchResult:
+    """Simulate n_taverns independent taverns for n_turns each
+
+    Taverns are split into contiguous shards (a few per worker, to balance load
+    while keeping pickling overhead low). With max_workers=1 everything runs in
+    the current process, which is handy for profiling.
+    """
+    if n_taverns < 0 or n_turns < 0:
+        raise ValueError("n_taverns and n_turns must be non-negative")
+
+    workers = max_workers or os.cpu_count() or 1
+    start = time.perf_counter()
+
+    if workers == 1 or n_taverns <= 1:
+        runs = _run_shard(range(n_taverns), n_turns, seed)
+        workers = 1
+    else:
+        n_shards = max(1, min(n_taverns, workers * shards_per_worker))
+        shards = [chunk.tolist() for chunk in np.array_split(np.arange(n_taverns), n_shards)]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_run_shard, shard, n_turns, seed) for shard in shards]
+            runs = [run for future in futures for run in future.result()]
+
+    return BatchResult(runs=runs, n_turns=n_turns, workers=workers,
+                       elapsed=time.perf_counter() - start, seed=seed)
+
+def measure_scaling(n_taverns: int, n_turns: int, seed: int = 0,
+                    worker_counts: Sequence[int] = None) -> Dict[int, float]:
+    """Turns/sec for each worker count, to see how the batch scales across cores"""
+    if worker_counts is None:
+        cpus = os.cpu_count() or 1
+        worker_counts = sorted({1, *(2 ** i for i in range(1, cpus.bit_length()) if 2 ** i <= cpus), cpus})
+    return {
+        workers: run_batch(n_taverns, n_turns, seed, max_workers=workers).turns_per_sec
+        for workers in worker_counts
+    }
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Headless batch tavern simulation")
+    parser.add_argument("--taverns", type=int, default=100)
+    parser.add_argument("--turns", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--scaling", action="store_true", help="report turns/sec per worker count")
+    args = parser.parse_args()
+
+    if args.scaling:
+        for workers, rate in measure_scaling(args.taverns, args.turns, args.seed).items():
+            print(f"{workers:>3} workers: {rate:,.0f} turns/sec")
+        return
+
+    result = run_batch(args.taverns, args.turns, args.seed, max_workers=args.workers)
+    for key, value in result.summary().items():
+        print(f"{key}: {value}")
+
+if __name__ == "__main__":
+    main()
@@ -3,9 +3,129 @@ Character class for the Warhammer Fantasy Tavern Simulator
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
 import random
 from .enums import Faction, CharacterClass, Skill, RelationshipType
+from .patron_state import PATRON_FIELDS, PatronField
+
+# Skills every character starts from, before class and faction modifiers
+BASE_SKILLS = {
+    Skill.COMBAT: 5,
+    Skill.DIPLOMACY: 5,
+    Skill.INTIMIDATION: 5,
+    Skill.DECEPTION: 5,
+    Skill.PERCEPTION: 5,
+    Skill.KNOWLEDGE: 5,
+    Skill.TRADE: 5,
+    Skill.STEALTH: 5,
+    Skill.MAGIC: 1,
+    Skill.FAITH: 3,
+    Skill.LEADERSHIP: 3,
+    Skill.SURVIVAL: 5,
+    Skill.CRAFTING: 3,
+    Skill.PERFORMANCE: 3,
+    Skill.GAMBLING: 3
+}
+
+CLASS_SKILL_MODIFIERS = {
+    CharacterClass.WARRIOR: {
+        Skill.COMBAT: 5, Skill.INTIMIDATION: 3, Skill.LEADERSHIP: 2
+    },
+    CharacterClass.ROGUE: {
+        Skill.STEALTH: 5, Skill.DECEPTION: 4, Skill.PERCEPTION: 3
+    },
+    CharacterClass.WIZARD: {
+        Skill.MAGIC: 8, Skill.KNOWLEDGE: 5, Skill.PERCEPTION: 2
+    },
+    CharacterClass.PRIEST: {
+        Skill.FAITH: 6, Skill.DIPLOMACY: 4, Skill.LEADERSHIP: 3
+    },
+    CharacterClass.MERCHANT: {
+        Skill.TRADE: 6, Skill.DIPLOMACY: 4, Skill.DECEPTION: 2
+    },
+    CharacterClass.CRAFTSMAN: {
+        Skill.CRAFTING: 6, Skill.TRADE: 3, Skill.KNOWLEDGE: 2
+    },
+    CharacterClass.NOBLE: {
+        Skill.LEADERSHIP: 4, Skill.DIPLOMACY: 4, Skill.KNOWLEDGE: 2
+    },
+    CharacterClass.PEASANT: {
+        Skill.SURVIVAL: 4, Skill.CRAFTING: 2, Skill.TRADE: 1
+    },
+    CharacterClass.SOLDIER: {
+        Skill.COMBAT: 4, Skill.INTIMIDATION: 2, Skill.SURVIVAL: 2
+    },
+    CharacterClass.SCOUT: {
+        Skill.SURVIVAL: 5, Skill.STEALTH: 4, Skill.PERCEPTION: 4
+    },
+    CharacterClass.BARD: {
+        Skill.PERFORMANCE: 6, Skill.DIPLOMACY: 4, Skill.KNOWLEDGE: 3
+    },
+    CharacterClass.SCHOLAR: {
+        Skill.KNOWLEDGE: 6, Skill.MAGIC: 2, Skill.PERCEPTION: 2
+    },
+    CharacterClass.HUNTER: {
+        Skill.SURVIVAL: 5, Skill.COMBAT: 3, Skill.STEALTH: 3
+    },
+    CharacterClass.SAILOR: {
+        Skill.SURVIVAL: 4, Skill.COMBAT: 2, Skill.TRADE: 2
+    },
+    CharacterClass.INNKEEPER: {
+        Skill.DIPLOMACY: 4, Skill.TRADE: 3, Skill.PERCEPTION: 3
+    },
+    CharacterClass.WITCH_HUNTER: {
+        Skill.COMBAT: 4, Skill.FAITH: 5, Skill.INTIMIDATION: 4
+    },
+    CharacterClass.CULTIST: {
+        Skill.MAGIC: 4, Skill.DECEPTION: 5, Skill.STEALTH: 3
+    }
+}
+
+FACTION_SKILL_MODIFIERS = {
+    Faction.EMPIRE: {
+        Skill.DIPLOMACY: 2, Skill.TRADE: 2, Skill.LEADERSHIP: 1
+    },
+    Faction.DWARF: {
+        Skill.COMBAT: 2, Skill.CRAFTING: 3, Skill.INTIMIDATION: 1
+    },
+    Faction.HIGH_ELF: {
+        Skill.MAGIC: 3, Skill.KNOWLEDGE: 2, Skill.DIPLOMACY: 1
+    },
+    Faction.WOOD_ELF: {
+        Skill.SURVIVAL: 3, Skill.STEALTH: 2, Skill.PERCEPTION: 2
+    },
+    Faction.BRETONNIAN: {
+        Skill.COMBAT: 2, Skill.LEADERSHIP: 2, Skill.FAITH: 1
+    },
+    Faction.HALFLING: {
+        Skill.STEALTH: 2, Skill.TRADE: 2, Skill.SURVIVAL: 1
+    },
+    Faction.TILEAN: {
+        Skill.TRADE: 3, Skill.DECEPTION: 2, Skill.DIPLOMACY: 1
+    },
+    Faction.KISLEV: {
+        Skill.SURVIVAL: 3, Skill.COMBAT: 2, Skill.INTIMIDATION: 1
+    },
+    Faction.NORSE: {
+        Skill.COMBAT: 3, Skill.SURVIVAL: 2, Skill.INTIMIDATION: 2
+    }
+}
+
+def _derive_skills(character_class: CharacterClass, faction: Faction) -> Dict[Skill, int]:
+    skills = dict(BASE_SKILLS)
+    for skill, modifier in CLASS_SKILL_MODIFIERS.get(character_class, {}).items():
+        skills[skill] += modifier
+    for skill, modifier in FACTION_SKILL_MODIFIERS.get(faction, {}).items():
+        skills[skill] += modifier
+    # Ensure skills are within valid range (1-20)
+    return {skill: max(1, min(20, value)) for skill, value in skills.items()}
+
+# Default skills of every (class, faction) pair, derived once at import
+DEFAULT_SKILL_TABLE: Dict[Tuple[CharacterClass, Faction], Mapping[Skill, int]] = {
+    (character_class, faction): MappingProxyType(_derive_skills(character_class, faction))
+    for character_class in CharacterClass for faction in Faction
+}
 
 @dataclass
 class Character:
@@ -59,130 +179,15 @@ class Character:
     
     def initialize_default_skills(self):
         """Initialize default skill values based on character class and faction"""
-        # Base skills for all characters
-        base_skills = {
-            Skill.COMBAT: 5,
-            Skill.DIPLOMACY: 5,
-            Skill.INTIMIDATION: 5,
-            Skill.DECEPTION: 5,
-            Skill.PERCEPTION: 5,
-            Skill.KNOWLEDGE: 5,
-            Skill.TRADE: 5,
-            Skill.STEALTH: 5,
-            Skill.MAGIC: 1,
-            Skill.FAITH: 3,
-            Skill.LEADERSHIP: 3,
-            Skill.SURVIVAL: 5,
-            Skill.CRAFTING: 3,
-            Skill.PERFORMANCE: 3,
-            Skill.GAMBLING: 3
-        }
-        
-        # Modify based on character class
-        class_modifiers = self.get_class_skill_modifiers()
-        for skill, modifier in class_modifiers.items():
-            base_skills[skill] += modifier
-        
-        # Modify based on faction
-        faction_modifiers = self.get_faction_skill_modifiers()
-        for skill, modifier in faction_modifiers.items():
-            base_skills[skill] += modifier
-        
-        # Ensure skills are within valid range (1-20)
-        for skill in base_skills:
-            base_skills[skill] = max(1, min(20, base_skills[skill]))
-        
-        self.skills = base_skills
+        self.skills = dict(DEFAULT_SKILL_TABLE[(self.character_class, self.faction)])
     
     def get_class_skill_modifiers(self) -> Dict[Skill, int]:
         """Get skill modifiers based on character class"""
-        modifiers = {
-            CharacterClass.WARRIOR: {
-                Skill.COMBAT: 5, Skill.INTIMIDATION: 3, Skill.LEADERSHIP: 2
-            },
-            CharacterClass.ROGUE: {
-                Skill.STEALTH: 5, Skill.DECEPTION: 4, Skill.PERCEPTION: 3
-            },
-            CharacterClass.WIZARD: {
-                Skill.MAGIC: 8, Skill.KNOWLEDGE: 5, Skill.PERCEPTION: 2
-            },
-            CharacterClass.PRIEST: {
-                Skill.FAITH: 6, Skill.DIPLOMACY: 4, Skill.LEADERSHIP: 3
-            },
-            CharacterClass.MERCHANT: {
-                Skill.TRADE: 6, Skill.DIPLOMACY: 4, Skill.DECEPTION: 2
-            },
-            CharacterClass.CRAFTSMAN: {
-                Skill.CRAFTING: 6, Skill.TRADE: 3, Skill.KNOWLEDGE: 2
-            },
-            CharacterClass.NOBLE: {
-                Skill.LEADERSHIP: 4, Skill.DIPLOMACY: 4, Skill.KNOWLEDGE: 2
-            },
-            CharacterClass.PEASANT: {
-                Skill.SURVIVAL: 4, Skill.CRAFTING: 2, Skill.TRADE: 1
-            },
-            CharacterClass.SOLDIER: {
-                Skill.COMBAT: 4, Skill.INTIMIDATION: 2, Skill.SURVIVAL: 2
-            },
-            CharacterClass.SCOUT: {
-                Skill.SURVIVAL: 5, Skill.STEALTH: 4, Skill.PERCEPTION: 4
-            },
-            CharacterClass.BARD: {
-                Skill.PERFORMANCE: 6, Skill.DIPLOMACY: 4, Skill.KNOWLEDGE: 3
-            },
-            CharacterClass.SCHOLAR: {
-                Skill.KNOWLEDGE: 6, Skill.MAGIC: 2, Skill.PERCEPTION: 2
-            },
-            CharacterClass.HUNTER: {
-                Skill.SURVIVAL: 5, Skill.COMBAT: 3, Skill.STEALTH: 3
-            },
-            CharacterClass.SAILOR: {
-                Skill.SURVIVAL: 4, Skill.COMBAT: 2, Skill.TRADE: 2
-            },
-            CharacterClass.INNKEEPER: {
-                Skill.DIPLOMACY: 4, Skill.TRADE: 3, Skill.PERCEPTION: 3
-            },
-            CharacterClass.WITCH_HUNTER: {
-                Skill.COMBAT: 4, Skill.FAITH: 5, Skill.INTIMIDATION: 4
-            },
-            CharacterClass.CULTIST: {
-                Skill.MAGIC: 4, Skill.DECEPTION: 5, Skill.STEALTH: 3
-            }
-        }
-        return modifiers.get(self.character_class, {})
+        return dict(CLASS_SKILL_MODIFIERS.get(self.character_class, {}))
     
     def get_faction_skill_modifiers(self) -> Dict[Skill, int]:
         """Get skill modifiers based on faction"""
-        modifiers = {
-            Faction.EMPIRE: {
-                Skill.DIPLOMACY: 2, Skill.TRADE: 2, Skill.LEADERSHIP: 1
-            },
-            Faction.DWARF: {
-                Skill.COMBAT: 2, Skill.CRAFTING: 3, Skill.INTIMIDATION: 1
-            },
-            Faction.HIGH_ELF: {
-                Skill.MAGIC: 3, Skill.KNOWLEDGE: 2, Skill.DIPLOMACY: 1
-            },
-            Faction.WOOD_ELF: {
-                Skill.SURVIVAL: 3, Skill.STEALTH: 2, Skill.PERCEPTION: 2
-            },
-            Faction.BRETONNIAN: {
-                Skill.COMBAT: 2, Skill.LEADERSHIP: 2, Skill.FAITH: 1
-            },
-            Faction.HALFLING: {
-                Skill.STEALTH: 2, Skill.TRADE: 2, Skill.SURVIVAL: 1
-            },
-            Faction.TILEAN: {
-                Skill.TRADE: 3, Skill.DECEPTION: 2, Skill.DIPLOMACY: 1
-            },
-            Faction.KISLEV: {
-                Skill.SURVIVAL: 3, Skill.COMBAT: 2, Skill.INTIMIDATION: 1
-            },
-            Faction.NORSE: {
-                Skill.COMBAT: 3, Skill.SURVIVAL: 2, Skill.INTIMIDATION: 2
-            }
-        }
-        return modifiers.get(self.faction, {})
+        return dict(FACTION_SKILL_MODIFIERS.get(self.faction, {}))
     
     def initialize_default_phrases(self):
         """Initialize default greeting and faction-specific phrases"""
@@ -228,6 +233,16 @@ class Character:
         new_value = max(-3, min(3, int(current) + change))
         self.relationships[other_character] = RelationshipType(new_value)
     
+    def bind_relationships(self, matrix):
+        """Move relationships into a tavern's shared matrix and view them from there"""
+        from .relationship_matrix import RelationshipView
+        if isinstance(self.relationships, RelationshipView) and self.relationships.matrix is matrix:
+            return
+        for other, relationship in list(self.relationships.items()):
+            matrix.set(self.name, other, int(relationship))
+        matrix.ensure(self.name)
+        self.relationships = RelationshipView(matrix, self.name)
+    
     def get_relationship(self, other_character: str) -> RelationshipType:
         """Get relationship status with another character"""
         return self.relationships.get(other_character, RelationshipType.NEUTRAL)
@@ -317,15 +332,16 @@ class Character:
             wealth=data.get('wealth', 50),
             drunk_level=data.get('drunk_level', 0),
             greeting_phrases=data.get('greeting_phrases', []),
-            faction_specific_phrases=data.get('faction_specific_phrases', [])
+            faction_specific_phrases=data.get('faction_specific_phrases', []),
+            skills={Skill(skill): value for skill, value in data.get('skills', {}).items()}
         )
 
-        # Restore skills
-        if 'skills' in data:
-            character.skills = {Skill(skill): value for skill, value in data['skills'].items()}
-
         # Restore relationships
         if 'relationships' in data:
             character.relationships = {name: RelationshipType(rel) for name, rel in data['relationships'].items()}
 
         return character
+
+# Stats that a tavern can move into its PatronState arrays
+for _field_name in PATRON_FIELDS:
+    setattr(Character, _field_name, PatronField(_field_name))
@@ -0,0 +1,78 @@
+"""
+Character roster for the Warhammer Fantasy Tavern Simulator
+"""
+
+from collections.abc import Sequence
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional
+
+from .character import Character
+
+class CharacterRoster(Sequence):
+    """Read-only, ordered view of the characters in a tavern
+
+    Behaves like the list it replaces (indexing, slicing, iteration,
+    random.sample) and keeps a name index next to it, so name lookups and
+    membership tests don't scan. Only the owning Tavern changes it, through
+    _insert and _discard, which keep the list and the index in step.
+    """
+
+    def __init__(self, characters: Iterable[Character] = ()):
+        self._order: List[Character] = []
+        self._by_name: Dict[str, Character] = {}
+        self.version = 0   # Bumped whenever someone enters or leaves
+        for character in characters:
+            self._insert(character)
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __getitem__(self, index):
+        # Slices come back as plain lists, as they did before
+        return self._order[index]
+
+    def __iter__(self) -> Iterator[Character]:
+        return iter(self._order)
+
+    def __contains__(self, character) -> bool:
+        name = getattr(character, "name", None)
+        return name is not None and self._by_name.get(name) is character
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, CharacterRoster):
+            return self._order == other._order
+        if isinstance(other, list):
+            return self._order == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(self._order)
+
+    def get(self, name: str) -> Optional[Character]:
+        return self._by_name.get(name)
+
+    def has_name(self, name: str) -> bool:
+        return name in self._by_name
+
+    @property
+    def by_name(self) -> Mapping[str, Character]:
+        """Read-only name -> character mapping"""
+        return MappingProxyType(self._by_name)
+
+    def _insert(self, character: Character) -> bool:
+        if character.name in self._by_name:
+            return False
+        self._by_name[character.name] = character
+        self._order.append(character)
+        self.version += 1
+        return True
+
+    def _discard(self, character: Character) -> bool:
+        if character not in self:
+            return False
+        del self._by_name[character.name]
+        # Leaving is rare next to lookups, so a scan is fine here
+        position = next(i for i, member in enumerate(self._order) if member is character)
+        del self._order[position]
+        self.version += 1
+        return True
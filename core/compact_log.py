@@ -0,0 +1,160 @@
+"""
+Compact event recording for fast-forwarded turns in the Warhammer Fantasy Tavern Simulator
+Events are stored as integer codes in preallocated arrays and only turned into text when read
+"""
+
+import time
+from datetime import datetime
+from enum import IntEnum
+from typing import Dict, Iterator, List, Tuple
+
+import numpy as np
+
+from .enums import InteractionType
+from .event import Event, Interaction
+from .dice_system import render_outcome_description
+
+class LogKind(IntEnum):
+    """Kinds of session log records"""
+    TURN = 0
+    INTERACTION = 1
+    REFUSAL = 2
+    EVENT = 3
+    RUMOR_NEW = 4
+    RUMOR_SPREAD = 5
+    MESSAGE = 6  # Free-form text, never stored compactly
+
+FLAG_SUCCESS = 1
+FLAG_CRITICAL_SUCCESS = 2
+FLAG_CRITICAL_FAILURE = 4
+
+INTERACTION_TYPES = list(InteractionType)
+INTERACTION_CODES = {interaction_type: i for i, interaction_type in enumerate(INTERACTION_TYPES)}
+
+# actor/target index into names, text/detail index into texts (except interactions,
+# where detail is the description template variant)
+RECORD_DTYPE = np.dtype([
+    ("timestamp", np.float64),
+    ("turn", np.int32),
+    ("kind", np.int8),
+    ("code", np.int8),
+    ("flags", np.uint8),
+    ("actor", np.int16),
+    ("target", np.int16),
+    ("text", np.int32),
+    ("detail", np.int32)
+])
+
+class CompactEventLog:
+    """Append-only record array with interned names and strings"""
+
+    def __init__(self, capacity: int = 4096):
+        self.records = np.zeros(capacity, dtype=RECORD_DTYPE)
+        self.count = 0
+        self.names: List[str] = []
+        self.texts: List[str] = []
+        self._name_ids: Dict[str, int] = {}
+        self._text_ids: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return self.count
+
+    def clear(self):
+        self.count = 0
+
+    def _name_id(self, name: str) -> int:
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self.names)
+            self.names.append(name)
+        return name_id
+
+    def _text_id(self, text: str) -> int:
+        text_id = self._text_ids.get(text)
+        if text_id is None:
+            text_id = self._text_ids[text] = len(self.texts)
+            self.texts.append(text)
+        return text_id
+
+    def _append(self, turn: int, kind: LogKind, code: int = 0, flags: int = 0,
+                actor: int = -1, target: int = -1, text: int = -1, detail: int = -1):
+        if self.count == len(self.records):
+            grown = np.zeros(len(self.records) * 2, dtype=RECORD_DTYPE)
+            grown[:self.count] = self.records
+            self.records = grown
+        self.records[self.count] = (time.time(), turn, kind, code, flags, actor, target, text, detail)
+        self.count += 1
+
+    def record_turn(self, turn: int):
+        self._append(turn, LogKind.TURN)
+
+    def record_interaction(self, turn: int, interaction: Interaction, critical_success: bool, critical_failure: bool):
+        flags = (FLAG_SUCCESS if interaction.success else 0) \
+            | (FLAG_CRITICAL_SUCCESS if critical_success else 0) \
+            | (FLAG_CRITICAL_FAILURE if critical_failure else 0)
+        self._append(turn, LogKind.INTERACTION, INTERACTION_CODES[interaction.interaction_type], flags,
+                     self._name_id(interaction.initiator), self._name_id(interaction.target),
+                     detail=interaction.outcome_variant)
+
+    def record_refusal(self, turn: int, initiator: str, target: str):
+        self._append(turn, LogKind.REFUSAL, actor=self._name_id(initiator), target=self._name_id(target))
+
+    def record_event(self, turn: int, event: Event):
+        self._append(turn, LogKind.EVENT, text=self._text_id(event.title), detail=self._text_id(event.description))
+
+    def record_rumor(self, turn: int, rumor: str, spread: bool = False):
+        self._append(turn, LogKind.RUMOR_SPREAD if spread else LogKind.RUMOR_NEW, text=self._text_id(rumor))
+
+    def kinds(self) -> np.ndarray:
+        """Kind codes of all records, for counting without rendering"""
+        return self.records["kind"][:self.count]
+
+    def render_message(self, index: int) -> str:
+        """Log text of one record, without the timestamp"""
+        return self._render_row(self.records[index].tolist())
+
+    def _render_row(self, row: tuple) -> str:
+        _, turn, kind, code, flags, actor, target, text, detail = row
+
+        if kind == LogKind.TURN:
+            return f"Turn {turn} completed"
+        if kind == LogKind.INTERACTION:
+            description = render_outcome_description(
+                self.names[actor], self.names[target], INTERACTION_TYPES[code],
+                bool(flags & FLAG_SUCCESS), bool(flags & FLAG_CRITICAL_SUCCESS),
+                bool(flags & FLAG_CRITICAL_FAILURE), detail
+            )
+            return f"Interaction: {description}"
+        if kind == LogKind.REFUSAL:
+            return f"{self.names[actor]} refuses to interact with {self.names[target]}"
+        if kind == LogKind.EVENT:
+            return f"Event: {self.texts[text]} - {self.texts[detail]}"
+        if kind == LogKind.RUMOR_SPREAD:
+            return f"Rumor spreads: {self.texts[text]}"
+        return f"New rumor: {self.texts[text]}"
+
+    def render(self, index: int) -> str:
+        """Log line of one record in the session log format"""
+        return self.render_range(index, index + 1)[0]
+
+    def render_range(self, start: int = 0, end: int = None) -> List[str]:
+        """Log lines of records start..end, formatting each distinct second once"""
+        end = self.count if end is None else min(end, self.count)
+        lines = []
+        last_second, stamp = None, ""
+        for row in self.records[start:end].tolist():
+            second = int(row[0])
+            if second != last_second:
+                last_second = second
+                stamp = datetime.fromtimestamp(second).strftime("%H:%M:%S")
+            lines.append(f"[{stamp}] {self._render_row(row)}")
+        return lines
+
+    def render_all(self) -> List[str]:
+        return self.render_range()
+
+    def iter_entries(self) -> Iterator[Tuple[float, int, LogKind, Tuple[str, ...], str]]:
+        """(timestamp, turn, kind, actors, message) of every record, rendering the text"""
+        for row in self.records[:self.count].tolist():
+            actors = tuple(self.names[i] for i in (row[5], row[6]) if i >= 0)
+            yield row[0], row[1], LogKind(row[2]), actors, self._render_row(row)
@@ -3,11 +3,14 @@ Dice rolling and interaction system for the Warhammer Fantasy Tavern Simulator
 """
 
 import random
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union
 from dataclasses import dataclass
+import numpy as np
 from .enums import Skill, InteractionType, RelationshipType
 from .character import Character
 from .event import Interaction
+from .faction_relations import FACTION_INDEX, DEFAULT_RELATIONS_PATH, load_faction_modifier_table
+from .text_templates import TEMPLATES
 
 @dataclass
 class DiceResult:
@@ -24,19 +27,59 @@ class DiceResult:
         crit_text = " (Critical!)" if self.critical_success else " (Fumble!)" if self.critical_failure else ""
         return f"Roll: {self.roll} + {self.modifier} = {self.total} vs {self.difficulty} {'SUCCESS' if self.success else 'FAILURE'}{crit_text}"
 
+@dataclass
+class BatchDiceResult:
+    """Results of many skill checks resolved at once, one array element per check"""
+    rolls: np.ndarray
+    modifiers: np.ndarray
+    totals: np.ndarray
+    difficulties: np.ndarray
+    success: np.ndarray
+    critical_success: np.ndarray
+    critical_failure: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.rolls)
+    
+    def __getitem__(self, index: int) -> DiceResult:
+        """Single check as a regular DiceResult"""
+        return DiceResult(
+            roll=int(self.rolls[index]),
+            modifier=int(self.modifiers[index]),
+            total=int(self.totals[index]),
+            difficulty=int(self.difficulties[index]),
+            success=bool(self.success[index]),
+            critical_success=bool(self.critical_success[index]),
+            critical_failure=bool(self.critical_failure[index])
+        )
+    
+    def success_rate(self) -> float:
+        return float(self.success.mean()) if len(self) else 0.0
+
+ArrayLike = Union[int, List[int], np.ndarray]
+
 class DiceSystem:
     """Handles all dice rolling and skill checks in the simulator"""
     
-    def __init__(self):
+    def __init__(self, rng: random.Random = None, np_rng: np.random.Generator = None):
+        self.rng = rng if rng is not None else random
+        self._np_rng = np_rng
         self.dice_sides = 20  # Using d20 system
         self.critical_success_threshold = 20
         self.critical_failure_threshold = 1
     
+    @property
+    def np_rng(self) -> np.random.Generator:
+        """NumPy generator for batch rolls, seeded from the scalar RNG on first use"""
+        if self._np_rng is None:
+            self._np_rng = np.random.default_rng(self.rng.getrandbits(64))
+        return self._np_rng
+    
     def roll_dice(self, sides: int = None) -> int:
         """Roll a dice with specified number of sides"""
         if sides is None:
             sides = self.dice_sides
-        return random.randint(1, sides)
+        return self.rng.randint(1, sides)
     
     def roll_multiple_dice(self, count: int, sides: int = None) -> List[int]:
         """Roll multiple dice"""
@@ -44,6 +87,13 @@ class DiceSystem:
             sides = self.dice_sides
         return [self.roll_dice(sides) for _ in range(count)]
     
+    def roll_dice_batch(self, count: int, sides: int = None) -> np.ndarray:
+        """Roll many dice at once as an int8/int16 array"""
+        if sides is None:
+            sides = self.dice_sides
+        dtype = np.int8 if sides < 128 else np.int16
+        return self.np_rng.integers(1, sides + 1, size=count, dtype=dtype)
+    
     def skill_check(self, character: Character, skill: Skill, difficulty: int = 10, modifier: int = 0) -> DiceResult:
         """Perform a skill check for a character"""
         roll = self.roll_dice()
@@ -71,6 +121,56 @@ class DiceSystem:
             critical_failure=critical_failure
         )
     
+    def batch_skill_check(self, skill_values: ArrayLike, modifiers: ArrayLike = 0,
+                          difficulties: ArrayLike = 10) -> BatchDiceResult:
+        """Resolve many skill checks in one call
+        
+        Arguments broadcast against each other like NumPy arrays; the rules match
+        skill_check, including natural 20s always succeeding and natural 1s
+        always failing.
+        """
+        skill_values, modifiers, difficulties = np.broadcast_arrays(
+            np.asarray(skill_values, dtype=np.int16),
+            np.asarray(modifiers, dtype=np.int16),
+            np.asarray(difficulties, dtype=np.int16)
+        )
+        rolls = self.roll_dice_batch(skill_values.size).reshape(skill_values.shape)
+        total_modifiers = skill_values + modifiers
+        totals = rolls + total_modifiers
+        
+        critical_success = rolls == self.critical_success_threshold
+        critical_failure = rolls == self.critical_failure_threshold
+        success = ((totals >= difficulties) | critical_success) & ~critical_failure
+        
+        return BatchDiceResult(
+            rolls=rolls,
+            modifiers=total_modifiers,
+            totals=totals,
+            difficulties=np.array(difficulties),
+            success=success,
+            critical_success=critical_success,
+            critical_failure=critical_failure
+        )
+    
+    def batch_opposed_check(self, skill_values1: ArrayLike, skill_values2: ArrayLike,
+                            modifiers1: ArrayLike = 0, modifiers2: ArrayLike = 0
+                            ) -> Tuple[BatchDiceResult, BatchDiceResult, np.ndarray]:
+        """Resolve many opposed checks; returns both sides and whether side 1 won"""
+        result1 = self.batch_skill_check(skill_values1, modifiers1, 0)
+        result2 = self.batch_skill_check(skill_values2, modifiers2, 0)
+        
+        crit1, crit2 = result1.critical_success, result2.critical_success
+        fumble1, fumble2 = result1.critical_failure, result2.critical_failure
+        
+        # Same precedence as opposed_check: criticals first, then fumbles, then totals
+        char1_wins = np.select(
+            [crit1 & ~crit2, crit2 & ~crit1, fumble1 & ~fumble2, fumble2 & ~fumble1],
+            [True, False, False, True],
+            default=result1.totals > result2.totals
+        )
+        
+        return result1, result2, char1_wins
+    
     def opposed_check(self, char1: Character, skill1: Skill, char2: Character, skill2: Skill) -> Tuple[DiceResult, DiceResult, bool]:
         """Perform an opposed skill check between two characters"""
         result1 = self.skill_check(char1, skill1, difficulty=0)  # No fixed difficulty for opposed checks
@@ -91,11 +191,26 @@ class DiceSystem:
         
         return result1, result2, char1_wins
 
+def render_outcome_description(initiator: str, target: str, interaction_type: InteractionType, success: bool,
+                               critical_success: bool, critical_failure: bool, variant: int) -> str:
+    """Text for an interaction outcome from its template variant"""
+    description = TEMPLATES.outcome_templates(interaction_type, success)[variant].render(initiator=initiator, target=target)
+    
+    if critical_success:
+        description += TEMPLATES.critical_success_suffix
+    elif critical_failure:
+        description += TEMPLATES.critical_failure_suffix
+    
+    return description
+
 class InteractionSystem:
     """Handles character interactions and their outcomes"""
     
-    def __init__(self, dice_system: DiceSystem):
+    def __init__(self, dice_system: DiceSystem, rng: random.Random = None,
+                 faction_relations_path: str = DEFAULT_RELATIONS_PATH):
         self.dice_system = dice_system
+        self.rng = rng if rng is not None else dice_system.rng
+        self.faction_modifiers = load_faction_modifier_table(faction_relations_path)
         self.interaction_difficulties = self._initialize_difficulties()
         self.interaction_skills = self._initialize_interaction_skills()
     
@@ -168,40 +283,15 @@ class InteractionSystem:
     
     def get_faction_interaction_modifier(self, faction1, faction2) -> int:
         """Get interaction modifier based on faction relationships"""
-        # Simplified faction relationships
-        faction_relations = {
-            ("Empire", "Dwarf"): 2,
-            ("Empire", "High Elf"): 1,
-            ("Empire", "Bretonnian"): 1,
-            ("Dwarf", "High Elf"): -1,
-            ("High Elf", "Wood Elf"): -2,
-            ("Empire", "Kislev"): 2,
-            ("Norse", "Empire"): -3,
-            ("Norse", "Dwarf"): -2,
-            ("Cultist", "*"): -5,  # Cultists are generally distrusted
-            ("Witch Hunter", "Cultist"): -10
-        }
-        
-        # Check direct relationship
-        key1 = (faction1.value, faction2.value)
-        key2 = (faction2.value, faction1.value)
-        
-        if key1 in faction_relations:
-            return faction_relations[key1]
-        elif key2 in faction_relations:
-            return faction_relations[key2]
-        
-        # Check wildcard relationships
-        for (f1, f2), modifier in faction_relations.items():
-            if f2 == "*" and f1 == faction1.value:
-                return modifier
-            elif f1 == "*" and f2 == faction1.value:
-                return modifier
-        
-        return 0  # Neutral by default
+        return int(self.faction_modifiers[FACTION_INDEX[faction1], FACTION_INDEX[faction2]])
     
-    def perform_interaction(self, initiator: Character, target: Character, interaction_type: InteractionType) -> Interaction:
-        """Perform an interaction between two characters"""
+    def perform_interaction(self, initiator: Character, target: Character, interaction_type: InteractionType,
+                            describe: bool = True) -> Interaction:
+        """Perform an interaction between two characters
+        
+        With describe=False the outcome text is left empty and only the chosen
+        template variant is kept, so it can be rendered later if needed.
+        """
         # Get the skill used for this interaction
         skill_used = self.interaction_skills.get(interaction_type, Skill.DIPLOMACY)
         
@@ -227,7 +317,11 @@ class InteractionSystem:
         result = self.dice_system.skill_check(initiator, skill_used, base_difficulty, modifier)
         
         # Generate outcome description
-        outcome_description = self.generate_outcome_description(initiator, target, interaction_type, result)
+        outcome_variant = self.choose_outcome_variant(interaction_type, result.success)
+        outcome_description = render_outcome_description(
+            initiator.name, target.name, interaction_type, result.success,
+            result.critical_success, result.critical_failure, outcome_variant
+        ) if describe else ""
         
         # Calculate relationship change
         relationship_change = self.calculate_relationship_change(interaction_type, result)
@@ -247,7 +341,8 @@ class InteractionSystem:
             modifier=result.modifier,
             success=result.success,
             outcome_description=outcome_description,
-            relationship_change=relationship_change
+            relationship_change=relationship_change,
+            outcome_variant=outcome_variant
         )
         
         return interaction
@@ -281,60 +376,21 @@ class InteractionSystem:
     
     def generate_outcome_description(self, initiator: Character, target: Character, interaction_type: InteractionType, result: DiceResult) -> str:
         """Generate a description of the interaction outcome"""
-        success_templates = {
-            InteractionType.CONVERSATION: [
-                f"{initiator.name} engages {target.name} in pleasant conversation.",
-                f"{initiator.name} and {target.name} share an enjoyable chat.",
-                f"{initiator.name} finds common ground with {target.name}."
-            ],
-            InteractionType.TRADE: [
-                f"{initiator.name} successfully negotiates a deal with {target.name}.",
-                f"{initiator.name} and {target.name} reach a mutually beneficial agreement.",
-                f"{initiator.name} convinces {target.name} to make a trade."
-            ],
-            InteractionType.INTIMIDATION: [
-                f"{initiator.name} successfully intimidates {target.name}.",
-                f"{target.name} backs down from {initiator.name}'s threatening presence.",
-                f"{initiator.name}'s menacing demeanor cows {target.name}."
-            ],
-            InteractionType.GAMBLING: [
-                f"{initiator.name} wins against {target.name} in a game of chance.",
-                f"{initiator.name} outplays {target.name} at the gambling table.",
-                f"{initiator.name} takes {target.name}'s coins in a lucky game."
-            ]
-        }
-        
-        failure_templates = {
-            InteractionType.CONVERSATION: [
-                f"{initiator.name} fails to connect with {target.name}.",
-                f"The conversation between {initiator.name} and {target.name} turns awkward.",
-                f"{initiator.name} says something that offends {target.name}."
-            ],
-            InteractionType.TRADE: [
-                f"{initiator.name} fails to convince {target.name} to make a deal.",
-                f"{target.name} rejects {initiator.name}'s trade proposal.",
-                f"Negotiations between {initiator.name} and {target.name} break down."
-            ],
-            InteractionType.INTIMIDATION: [
-                f"{target.name} stands firm against {initiator.name}'s threats.",
-                f"{initiator.name} fails to intimidate {target.name}.",
-                f"{target.name} laughs off {initiator.name}'s attempt at intimidation."
-            ],
-            InteractionType.GAMBLING: [
-                f"{initiator.name} loses to {target.name} in a game of chance.",
-                f"{target.name} outplays {initiator.name} at the gambling table.",
-                f"{initiator.name} loses coins to {target.name} in an unlucky game."
-            ]
-        }
-        
-        templates = success_templates if result.success else failure_templates
-        interaction_templates = templates.get(interaction_type, [f"{initiator.name} interacts with {target.name}."])
-        
-        description = random.choice(interaction_templates)
-        
-        if result.critical_success:
-            description += " The outcome exceeds all expectations!"
-        elif result.critical_failure:
-            description += " Things go terribly wrong!"
-        
-        return description
+        variant = self.choose_outcome_variant(interaction_type, result.success)
+        return render_outcome_description(initiator.name, target.name, interaction_type, result.success,
+                                          result.critical_success, result.critical_failure, variant)
+    
+    def choose_outcome_variant(self, interaction_type: InteractionType, success: bool) -> int:
+        """Pick which description template an outcome uses"""
+        return self.rng.randrange(len(TEMPLATES.outcome_templates(interaction_type, success)))
+    
+    def describe_interaction(self, interaction: Interaction) -> str:
+        """Description of an interaction, rendering it if it was recorded without one"""
+        if interaction.outcome_description:
+            return interaction.outcome_description
+        return render_outcome_description(
+            interaction.initiator, interaction.target, interaction.interaction_type, interaction.success,
+            interaction.dice_roll == self.dice_system.critical_success_threshold,
+            interaction.dice_roll == self.dice_system.critical_failure_threshold,
+            interaction.outcome_variant
+        )
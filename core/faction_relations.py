@@ -0,0 +1,56 @@
+"""
+Faction interaction modifiers for the Warhammer Fantasy Tavern Simulator
+Relations are read from a data file and compiled once into a dense Faction x Faction table
+"""
+
+import json
+import os
+from functools import lru_cache
+from typing import List, Tuple
+
+import numpy as np
+
+from .enums import Faction
+
+DEFAULT_RELATIONS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "faction_relations.json")
+WILDCARD = "*"
+
+# Row/column of each faction in the modifier table
+FACTION_INDEX = {faction: i for i, faction in enumerate(Faction)}
+
+def load_faction_relations(path: str = DEFAULT_RELATIONS_PATH) -> List[Tuple[str, str, int]]:
+    """Read (faction, faction, modifier) entries in file order"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return [(entry["factions"][0], entry["factions"][1], int(entry["modifier"])) for entry in data["relations"]]
+
+def resolve_faction_modifier(relations: List[Tuple[str, str, int]], faction1: str, faction2: str) -> int:
+    """Modifier for faction1 interacting with faction2 under the lookup rules
+
+    An explicit pair (in either order) wins over a wildcard; wildcards only
+    match on the initiating faction. Only used to build the table.
+    """
+    for f1, f2, modifier in relations:
+        if (f1, f2) == (faction1, faction2):
+            return modifier
+    for f1, f2, modifier in relations:
+        if (f2, f1) == (faction1, faction2):
+            return modifier
+    for f1, f2, modifier in relations:
+        if (f2 == WILDCARD and f1 == faction1) or (f1 == WILDCARD and f2 == faction1):
+            return modifier
+    return 0
+
+def build_faction_modifier_table(relations: List[Tuple[str, str, int]]) -> np.ndarray:
+    """Dense table indexed by FACTION_INDEX, wildcards expanded"""
+    table = np.zeros((len(FACTION_INDEX), len(FACTION_INDEX)), dtype=np.int8)
+    for faction1, i in FACTION_INDEX.items():
+        for faction2, j in FACTION_INDEX.items():
+            table[i, j] = resolve_faction_modifier(relations, faction1.value, faction2.value)
+    table.flags.writeable = False
+    return table
+
+@lru_cache(maxsize=None)
+def load_faction_modifier_table(path: str = DEFAULT_RELATIONS_PATH) -> np.ndarray:
+    """Compiled table for a relations file, built once per path"""
+    return build_faction_modifier_table(load_faction_relations(path))
@@ -0,0 +1,131 @@
+"""
+Procedural patron generation for the Warhammer Fantasy Tavern Simulator
+Builds any number of lore-consistent background characters from the tables in data/patron_tables.json
+"""
+
+import json
+import os
+import random
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from .character import Character
+from .enums import CharacterClass, Faction
+from .weighted_sampler import WeightedSampler
+
+DEFAULT_TABLES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "patron_tables.json")
+
+ROMAN_NUMERALS = [(10, "X"), (9, "IX"), (5, "V"), (4, "IV"), (1, "I")]
+
+@lru_cache(maxsize=None)
+def load_patron_tables(path: str = DEFAULT_TABLES_PATH) -> Dict[str, Any]:
+    """Read a patron tables file, once per path"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def _roman(number: int) -> str:
+    # Only used for name suffixes, so large numbers just repeat X
+    result = []
+    for value, numeral in ROMAN_NUMERALS:
+        count, number = divmod(number, value)
+        result.append(numeral * count)
+    return "".join(result)
+
+class _FactionTables:
+    """One faction's tables, with its weighted choices prepared"""
+
+    def __init__(self, faction: Faction, data: Dict[str, Any]):
+        self.faction = faction
+        self.ages = tuple(data["ages"])
+        self.class_sampler = WeightedSampler({CharacterClass(name): w for name, w in data["classes"].items()})
+        self.given_names = data["given_names"]
+        self.surnames = data["surnames"]
+        self.origins = data["origins"]
+
+class PatronGenerator:
+    """Streams procedurally generated patrons
+
+    Faction, class, gender, name, looks and history are drawn from the tables;
+    skills are the usual class and faction defaults. Names are unique
+    within a generator (and never clash with reserved_names): a repeated name
+    gets an epithet, then a numeral. The same seed yields the same patrons.
+    """
+
+    def __init__(self, seed: Optional[int] = None, rng: random.Random = None,
+                 tables_path: str = DEFAULT_TABLES_PATH, reserved_names: Iterable[str] = ()):
+        self.rng = rng if rng is not None else random.Random(seed)
+        tables = load_patron_tables(tables_path)
+        self.tables = tables
+
+        self.faction_sampler = WeightedSampler({Faction(name): data["weight"] for name, data in tables["factions"].items()})
+        self.factions = {Faction(name): _FactionTables(Faction(name), data) for name, data in tables["factions"].items()}
+        self.gender_sampler = WeightedSampler(tables["genders"])
+        self.wealth_ranges = {
+            key if key == "default" else CharacterClass(key): tuple(value)
+            for key, value in tables["wealth"].items()
+        }
+
+        self._used_names = set(reserved_names)
+        self._name_counts: Dict[str, int] = {}
+
+    def __iter__(self) -> Iterator[Character]:
+        return self.iter_patrons()
+
+    def iter_patrons(self, count: Optional[int] = None) -> Iterator[Character]:
+        """Yield count patrons, or patrons without end when count is None"""
+        while count is None or count > 0:
+            yield self.generate_patron()
+            if count is not None:
+                count -= 1
+
+    def generate(self, count: int) -> List[Character]:
+        return list(islice(self.iter_patrons(), count))
+
+    def generate_patron(self) -> Character:
+        rng = self.rng
+        tables = self.tables
+        faction = self.faction_sampler.sample(rng)
+        faction_tables = self.factions[faction]
+        character_class = faction_tables.class_sampler.sample(rng)
+        gender = self.gender_sampler.sample(rng)
+        name = self._unique_name(
+            f"{rng.choice(faction_tables.given_names[gender])} {rng.choice(faction_tables.surnames)}"
+        )
+        origin = rng.choice(faction_tables.origins)
+        fields = {"faction": faction.value, "class": character_class.value.lower(), "origin": origin}
+
+        appearance = rng.choice(tables["appearance_templates"]).format(
+            build=rng.choice(tables["builds"]), hair=rng.choice(tables["hair"]),
+            garb=rng.choice(tables["garb"]), **fields
+        )
+        low, high = self.wealth_ranges.get(character_class, self.wealth_ranges["default"])
+
+        return Character(
+            name=name,
+            faction=faction,
+            character_class=character_class,
+            age=rng.randint(*faction_tables.ages),
+            gender=gender,
+            appearance=appearance[0].upper() + appearance[1:],
+            distinctive_features=rng.choice(tables["features"]),
+            backstory=rng.choice(tables["backstories"]).format(**fields),
+            motivation=rng.choice(tables["motivations"]),
+            personality_traits=rng.sample(tables["traits"], 2),
+            likes=rng.sample(tables["likes"], 2),
+            dislikes=rng.sample(tables["dislikes"], 2),
+            wealth=rng.randint(low, high)
+        )
+
+    def _unique_name(self, name: str) -> str:
+        if name not in self._used_names:
+            self._used_names.add(name)
+            return name
+
+        candidate = f"{name} {self.rng.choice(self.tables['epithets'])}"
+        while candidate in self._used_names:
+            count = self._name_counts.get(name, 1) + 1
+            self._name_counts[name] = count
+            candidate = f"{name} {_roman(count)}"
+        self._used_names.add(candidate)
+        return candidate
@@ -0,0 +1,147 @@
+"""
+Structure-of-arrays patron state for the Warhammer Fantasy Tavern Simulator
+Crowded taverns keep their patrons' changing stats in NumPy columns so per-turn updates run vectorized
+"""
+
+from typing import Dict, List
+
+import numpy as np
+
+from .faction_relations import FACTION_INDEX
+
+# Character attributes that live in the arrays while a character is bound
+PATRON_FIELDS = ("health", "wealth", "drunk_level", "current_mood")
+
+DRUNK_THRESHOLD = 3      # Character.is_drunk: drunk_level above this
+NEUTRAL_MOOD = "neutral"
+
+class PatronField:
+    """Descriptor that stores a Character attribute in its PatronState when bound"""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        state = instance.__dict__.get("_patron_state")
+        if state is None:
+            return instance.__dict__[self.name]
+        return state.get(instance.__dict__["_patron_row"], self.name)
+
+    def __set__(self, instance, value):
+        state = instance.__dict__.get("_patron_state")
+        if state is None:
+            instance.__dict__[self.name] = value
+        else:
+            state.set(instance.__dict__["_patron_row"], self.name, value)
+
+class PatronState:
+    """Health, wealth, drunkenness, mood and faction of bound characters as columns
+
+    Row i belongs to characters[i]. Characters read and write their row
+    through PatronField descriptors; removing a character copies its row back
+    into the object and moves the last row into the gap.
+    """
+
+    def __init__(self, np_rng: np.random.Generator, capacity: int = 64):
+        self.np_rng = np_rng
+        self.count = 0
+        self.characters: List = []
+        self.moods: List[str] = [NEUTRAL_MOOD, "drunk"]
+        self._mood_codes: Dict[str, int] = {mood: i for i, mood in enumerate(self.moods)}
+        self.health = np.zeros(capacity, dtype=np.int16)
+        self.wealth = np.zeros(capacity, dtype=np.int32)
+        self.drunk_level = np.zeros(capacity, dtype=np.int8)
+        self.mood = np.zeros(capacity, dtype=np.int16)
+        self.faction = np.zeros(capacity, dtype=np.int8)   # FACTION_INDEX codes
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _columns(self) -> List[str]:
+        return ["health", "wealth", "drunk_level", "mood", "faction"]
+
+    def _grow(self):
+        for column in self._columns():
+            old = getattr(self, column)
+            grown = np.zeros(len(old) * 2, dtype=old.dtype)
+            grown[:self.count] = old[:self.count]
+            setattr(self, column, grown)
+
+    def _mood_code(self, mood: str) -> int:
+        code = self._mood_codes.get(mood)
+        if code is None:
+            code = self._mood_codes[mood] = len(self.moods)
+            self.moods.append(mood)
+        return code
+
+    def get(self, row: int, name: str):
+        if name == "current_mood":
+            return self.moods[self.mood[row]]
+        return int(getattr(self, name)[row])
+
+    def set(self, row: int, name: str, value):
+        if name == "current_mood":
+            self.mood[row] = self._mood_code(value)
+        else:
+            getattr(self, name)[row] = value
+
+    def bind(self, character):
+        """Move a character's stats into a new row and view them from there"""
+        current = character.__dict__.get("_patron_state")
+        if current is self:
+            return
+        if current is not None:
+            current.release(character)
+
+        if self.count == len(self.health):
+            self._grow()
+        row = self.count
+        values = {name: character.__dict__.pop(name) for name in PATRON_FIELDS}
+        self.health[row] = values["health"]
+        self.wealth[row] = values["wealth"]
+        self.drunk_level[row] = values["drunk_level"]
+        self.mood[row] = self._mood_code(values["current_mood"])
+        self.faction[row] = FACTION_INDEX[character.faction]
+        self.characters.append(character)
+        self.count += 1
+        character.__dict__["_patron_state"] = self
+        character.__dict__["_patron_row"] = row
+
+    def release(self, character):
+        """Copy a character's row back into the object and free the row"""
+        if character.__dict__.get("_patron_state") is not self:
+            return
+        row = character.__dict__.pop("_patron_row")
+        values = {name: self.get(row, name) for name in PATRON_FIELDS}
+        del character.__dict__["_patron_state"]
+        character.__dict__.update(values)
+
+        last = self.count - 1
+        if row != last:
+            for column in self._columns():
+                array = getattr(self, column)
+                array[row] = array[last]
+            moved = self.characters[last]
+            self.characters[row] = moved
+            moved.__dict__["_patron_row"] = row
+        self.characters.pop()
+        self.count -= 1
+
+    def drunk_count(self) -> int:
+        """Number of bound characters for whom is_drunk() holds"""
+        return int(np.count_nonzero(self.drunk_level[:self.count] > DRUNK_THRESHOLD))
+
+    def sober_up(self):
+        """Character.sober_up for every bound character at once"""
+        drunk_level = self.drunk_level[:self.count]
+        np.maximum(drunk_level - 1, 0, out=drunk_level)
+        self.mood[:self.count][drunk_level <= DRUNK_THRESHOLD] = self._mood_codes[NEUTRAL_MOOD]
+
+    def injure(self, chance: float, min_damage: int, max_damage: int, min_health: int, rows=None):
+        """Hurt each bound character (or those in rows) with the given chance, leaving at least min_health"""
+        rows = np.arange(self.count) if rows is None else np.asarray(rows, dtype=np.intp)
+        hit = rows[self.np_rng.random(len(rows)) < chance]
+        damage = self.np_rng.integers(min_damage, max_damage + 1, size=len(hit), dtype=np.int16)
+        self.health[hit] = np.maximum(min_health, self.health[hit] - damage)
@@ -0,0 +1,216 @@
+"""
+Dense relationship storage for the Warhammer Fantasy Tavern Simulator
+"""
+
+from collections.abc import MutableMapping
+from typing import Dict, List, Optional, Sequence, Tuple, Any
+
+import numpy as np
+
+from .enums import RelationshipType
+
+MIN_RELATIONSHIP = int(RelationshipType.HATRED)
+MAX_RELATIONSHIP = int(RelationshipType.LOYALTY)
+
+class RelationshipMatrix:
+    """Directed relationships between characters as one int8 matrix
+
+    Row i holds how character i feels about everyone else. Names get an index
+    the first time they are referenced and keep it, so characters who leave
+    and come back find their relationships where they left them.
+    """
+
+    def __init__(self, capacity: int = 16):
+        self.index: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.values = np.zeros((capacity, capacity), dtype=np.int8)
+        self.version = 0   # Bumped whenever a stored value changes, for caches built from the values
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def ensure(self, name: str) -> int:
+        """Index of a name, adding it (and growing the matrix) if needed"""
+        idx = self.index.get(name)
+        if idx is not None:
+            return idx
+
+        idx = len(self.names)
+        if idx == len(self.values):
+            grown = np.zeros((idx * 2, idx * 2), dtype=np.int8)
+            grown[:idx, :idx] = self.values
+            self.values = grown
+        self.index[name] = idx
+        self.names.append(name)
+        return idx
+
+    def get(self, name: str, other: str) -> int:
+        """How name feels about other; neutral for unknown names"""
+        idx = self.index.get(name)
+        other_idx = self.index.get(other)
+        if idx is None or other_idx is None:
+            return 0
+        return int(self.values[idx, other_idx])
+
+    def set(self, name: str, other: str, value: int):
+        value = max(MIN_RELATIONSHIP, min(MAX_RELATIONSHIP, int(value)))
+        idx, other_idx = self.ensure(name), self.ensure(other)
+        if self.values[idx, other_idx] != value:
+            self.values[idx, other_idx] = value
+            self.version += 1
+
+    def modify(self, name: str, other: str, change: int) -> int:
+        """Apply a change, clamped to the relationship range; returns the new value"""
+        idx, other_idx = self.ensure(name), self.ensure(other)
+        old = int(self.values[idx, other_idx])
+        value = max(MIN_RELATIONSHIP, min(MAX_RELATIONSHIP, old + change))
+        if value != old:
+            self.values[idx, other_idx] = value
+            self.version += 1
+        return value
+
+    def row(self, name: str) -> Dict[str, int]:
+        """Non-neutral relationships held by one character"""
+        idx = self.index.get(name)
+        if idx is None:
+            return {}
+        row = self.values[idx, :len(self.names)]
+        return {self.names[j]: int(row[j]) for j in np.flatnonzero(row)}
+
+    def indices(self, names: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Indices of names (all names by default), -1 for names not in the matrix
+
+        Unlike ensure, this never adds names, so queries leave the matrix as it was.
+        """
+        if names is None:
+            return np.arange(len(self.names))
+        index = self.index
+        return np.array([index.get(name, -1) for name in names], dtype=np.intp)
+
+    def submatrix(self, names: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Relationships among the given names (all names by default), in that order
+
+        Names not in the matrix are neutral towards everyone and everyone towards them.
+        """
+        idx = self.indices(names)
+        known = idx >= 0
+        if known.all():
+            return self.values[np.ix_(idx, idx)]
+        result = np.zeros((len(idx), len(idx)), dtype=self.values.dtype)
+        result[np.ix_(known, known)] = self.values[np.ix_(idx[known], idx[known])]
+        return result
+
+    def undirected_edges(self, names: Sequence[str], include_neutral: bool = False) -> List[Tuple[str, str, int]]:
+        """(a, b, value) for each pair of names with a relationship either way
+
+        a comes before b in names; the value is a's regard for b, or b's for a
+        when a is neutral. With include_neutral every pair is listed.
+        """
+        regard = self.submatrix(names)
+        upper = np.triu(regard, 1)
+        weights = np.where(upper != 0, upper, np.triu(regard.T, 1))
+        if include_neutral:
+            rows, cols = np.triu_indices(len(names), 1)
+        else:
+            rows, cols = np.nonzero(weights)
+        return [(names[i], names[j], int(weights[i, j])) for i, j in zip(rows.tolist(), cols.tolist())]
+
+    def to_nested_dict(self, names: Sequence[str]) -> Dict[str, Dict[str, int]]:
+        """{name: {other: value}} for every ordered pair of distinct names"""
+        rows = self.submatrix(names).tolist()
+        return {
+            name: {other: rows[i][j] for j, other in enumerate(names) if j != i}
+            for i, name in enumerate(names)
+        }
+
+    def most_hated(self, names: Optional[Sequence[str]] = None, n: int = 5) -> List[Tuple[str, int]]:
+        """Names with the lowest summed regard from the others, worst first"""
+        names = list(self.names) if names is None else list(names)
+        regard = self.submatrix(names).sum(axis=0, dtype=np.int32)
+        order = np.argsort(regard, kind="stable")[:n]
+        return [(names[i], int(regard[i])) for i in order]
+
+    def faction_averages(self, factions: Dict[str, Any]) -> Dict[Tuple[Any, Any], float]:
+        """Mean relationship from members of one faction towards another
+
+        factions maps character name to faction; pairs of a character with
+        itself are left out of the averages.
+        """
+        names = list(factions.keys())
+        groups = list(dict.fromkeys(factions.values()))
+        if not names:
+            return {}
+
+        group_index = {group: i for i, group in enumerate(groups)}
+        membership = np.zeros((len(names), len(groups)), dtype=np.float64)
+        membership[np.arange(len(names)), [group_index[factions[name]] for name in names]] = 1.0
+
+        sums = membership.T @ self.submatrix(names).astype(np.float64) @ membership
+        sizes = membership.sum(axis=0)
+        counts = np.outer(sizes, sizes) - np.diag(sizes)
+
+        return {
+            (groups[a], groups[b]): float(sums[a, b] / counts[a, b])
+            for a in range(len(groups)) for b in range(len(groups)) if counts[a, b] > 0
+        }
+
+    def hostility_clusters(self, names: Optional[Sequence[str]] = None,
+                           threshold: int = int(RelationshipType.DISLIKE)) -> List[List[str]]:
+        """Groups linked by hostility at or below threshold in either direction"""
+        names = list(self.names) if names is None else list(names)
+        sub = self.submatrix(names)
+        hostile = (sub <= threshold) | (sub.T <= threshold)
+        np.fill_diagonal(hostile, False)
+
+        labels = np.full(len(names), -1, dtype=np.intp)
+        clusters = []
+        for start in np.flatnonzero(hostile.any(axis=1)):
+            if labels[start] >= 0:
+                continue
+            labels[start] = len(clusters)
+            members, frontier = [start], [start]
+            while frontier:
+                reached = np.flatnonzero(hostile[frontier].any(axis=0) & (labels < 0))
+                labels[reached] = len(clusters)
+                members.extend(reached.tolist())
+                frontier = reached.tolist()
+            clusters.append([names[i] for i in sorted(members)])
+        return clusters
+
+class RelationshipView(MutableMapping):
+    """Dict-like view of one character's row, standing in for Character.relationships"""
+
+    def __init__(self, matrix: RelationshipMatrix, owner: str):
+        self.matrix = matrix
+        self.owner = owner
+
+    def __getitem__(self, other: str) -> RelationshipType:
+        value = self.matrix.get(self.owner, other)
+        if value == 0:
+            raise KeyError(other)
+        return RelationshipType(value)
+
+    def get(self, other: str, default=None):
+        # Fast path for the hot lookup in Character.get_relationship
+        value = self.matrix.get(self.owner, other)
+        return RelationshipType(value) if value != 0 else default
+
+    def __setitem__(self, other: str, relationship: RelationshipType):
+        self.matrix.set(self.owner, other, int(relationship))
+
+    def __delitem__(self, other: str):
+        if self.matrix.get(self.owner, other) == 0:
+            raise KeyError(other)
+        self.matrix.set(self.owner, other, 0)
+
+    def __iter__(self):
+        return iter(self.matrix.row(self.owner))
+
+    def __len__(self) -> int:
+        return len(self.matrix.row(self.owner))
+
+    def __repr__(self) -> str:
+        return repr({name: RelationshipType(value) for name, value in self.matrix.row(self.owner).items()})
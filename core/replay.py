@@ -0,0 +1,208 @@
+"""
+Deterministic replay for the Warhammer Fantasy Tavern Simulator
+Sessions are journaled as the commands issued between turns plus a compact record per turn, with
+periodic state snapshots to restart from, so any past turn can be replayed or forked
+"""
+
+import bisect
+import functools
+import io
+import pickle
+import zlib
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+# One row per simulated turn. rng_check fingerprints the shared RNG after the
+# turn, so a replay that drifts from the original is noticed at once.
+TURN_DTYPE = np.dtype([
+    ("turn", np.int32),
+    ("tension", np.int16),
+    ("brawls", np.int32),
+    ("interactions", np.int64),   # Interaction history length after the turn
+    ("events", np.int64),         # Event history length after the turn
+    ("auto_events", np.bool_),
+    ("rng_check", np.uint32)
+])
+
+def rng_fingerprint(rng) -> int:
+    return hash(rng.getstate()) & 0xFFFFFFFF
+
+def _external(key: str):
+    """Placeholder for a shared object in pickled state; never called"""
+    raise RuntimeError(f"Unresolved external reference {key!r}")
+
+class _StatePickler(pickle.Pickler):
+    """Pickler that leaves the shared random sources out, by name
+
+    Only the types of the external objects get a custom reduction, so the
+    rest of the state pickles at C speed.
+    """
+
+    def __init__(self, file, externals: Dict[str, Any]):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        keys = {id(obj): key for key, obj in externals.items() if obj is not None}
+
+        def reduce(obj):
+            key = keys.get(id(obj))
+            return (_external, (key,)) if key is not None else obj.__reduce_ex__(pickle.HIGHEST_PROTOCOL)
+
+        self.dispatch_table = {type(obj): reduce for obj in externals.values() if obj is not None}
+
+class _StateUnpickler(pickle.Unpickler):
+    def __init__(self, file, externals: Dict[str, Any]):
+        super().__init__(file)
+        self._externals = externals
+
+    def find_class(self, module, name):
+        if module == __name__ and name == _external.__name__:
+            return self._externals.__getitem__
+        return super().find_class(module, name)
+
+def pack_state(state: Dict[str, Any], externals: Dict[str, Any]) -> bytes:
+    """Pickle and compress simulator state, referring to the objects in externals by key"""
+    buffer = io.BytesIO()
+    _StatePickler(buffer, externals).dump(state)
+    # Mostly-empty relationship matrices make large taverns compress very well
+    return zlib.compress(buffer.getvalue(), 1)
+
+def unpack_state(payload: bytes, externals: Dict[str, Any]) -> Dict[str, Any]:
+    """Unpickle simulator state, wiring the given objects in for their keys"""
+    return _StateUnpickler(io.BytesIO(zlib.decompress(payload)), externals).load()
+
+@dataclass(frozen=True)
+class Snapshot:
+    """Simulator state at the end of a turn"""
+    turn: int
+    payload: bytes
+    rng_state: tuple
+    np_rng_state: Optional[dict]    # None while the NumPy generator has not been created
+    interactions: int
+    events: int
+
+def recorded(method):
+    """Journal calls of a simulator method made from outside the simulator
+
+    Calls made while another recorded call or a turn is running, and calls
+    made during a replay, are consequences of what is already journaled and
+    are not recorded again.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        journal = self.journal
+        if journal is None or journal.replaying or journal.depth:
+            return method(self, *args, **kwargs)
+        journal.record_command(self.turn_counter, name, args, kwargs)
+        journal.depth += 1
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            journal.depth -= 1
+    return wrapper
+
+class SimulationJournal:
+    """Commands, per-turn records and snapshots of one simulator's session
+
+    Commands are tagged with the turn they followed. A snapshot is taken
+    every `spacing` turns; replaying to a turn restores the nearest snapshot
+    at or before it and runs the journaled commands and turns forward from
+    there. Wider spacing stores fewer snapshots but replays further.
+
+    At most `max_snapshots` are kept (None keeps all, and memory grows with
+    the session). Past that the oldest is dropped, along with the commands
+    and turn records only it could replay, so first_turn moves forward.
+    """
+
+    def __init__(self, spacing: int = 50, capacity: int = 256, max_snapshots: Optional[int] = 64):
+        if spacing < 1:
+            raise ValueError("snapshot spacing must be at least 1")
+        if max_snapshots is not None and max_snapshots < 1:
+            raise ValueError("max_snapshots must be at least 1")
+        self.spacing = spacing
+        self.max_snapshots = max_snapshots
+        self.commands: List[Tuple[str, tuple, dict]] = []
+        self._command_turns: List[int] = []
+        self.turns = np.zeros(capacity, dtype=TURN_DTYPE)
+        self.turn_count = 0
+        self.snapshots: List[Snapshot] = []
+        self.replaying = False
+        self.depth = 0
+
+    @property
+    def first_turn(self) -> int:
+        """Earliest turn that can be replayed to"""
+        return self.snapshots[0].turn if self.snapshots else 0
+
+    def record_command(self, turn: int, name: str, args: tuple, kwargs: dict):
+        self._command_turns.append(turn)
+        self.commands.append((name, args, kwargs))
+
+    def commands_at(self, turn: int) -> List[Tuple[str, tuple, dict]]:
+        """Commands issued after the given turn, in order"""
+        start = bisect.bisect_left(self._command_turns, turn)
+        end = bisect.bisect_right(self._command_turns, turn, start)
+        return self.commands[start:end]
+
+    def record_turn(self, turn: int, tension: int, brawls: int, interactions: int, events: int,
+                    auto_events: bool, rng_check: int):
+        if self.turn_count == len(self.turns):
+            grown = np.zeros(len(self.turns) * 2, dtype=TURN_DTYPE)
+            grown[:self.turn_count] = self.turns
+            self.turns = grown
+        self.turns[self.turn_count] = (turn, tension, brawls, interactions, events, auto_events, rng_check)
+        self.turn_count += 1
+
+    def turn_record(self, turn: int) -> np.void:
+        index = turn - self.first_turn - 1
+        if not 0 <= index < self.turn_count:
+            raise KeyError(turn)
+        return self.turns[index]
+
+    def turn_records(self) -> np.ndarray:
+        """Records of every journaled turn, oldest first"""
+        return self.turns[:self.turn_count]
+
+    def snapshot_due(self, turn: int) -> bool:
+        return turn % self.spacing == 0
+
+    def add_snapshot(self, snapshot: Snapshot):
+        self.snapshots.append(snapshot)
+        if self.max_snapshots is not None and len(self.snapshots) > self.max_snapshots:
+            self._drop_oldest_snapshot()
+
+    def _drop_oldest_snapshot(self):
+        old_first = self.first_turn
+        del self.snapshots[0]
+        dropped = min(self.turn_count, self.first_turn - old_first)
+        self.turns[:self.turn_count - dropped] = self.turns[dropped:self.turn_count]
+        self.turn_count -= dropped
+        cut = bisect.bisect_left(self._command_turns, self.first_turn)
+        del self.commands[:cut], self._command_turns[:cut]
+
+    def snapshot_before(self, turn: int) -> Snapshot:
+        """Latest snapshot taken at or before a turn"""
+        index = bisect.bisect_right([s.turn for s in self.snapshots], turn) - 1
+        if index < 0:
+            raise ValueError(f"No snapshot at or before turn {turn}")
+        return self.snapshots[index]
+
+    def truncate(self, turn: int):
+        """Forget everything journaled after a turn"""
+        cut = bisect.bisect_left(self._command_turns, turn)
+        del self.commands[cut:], self._command_turns[cut:]
+        self.turn_count = max(0, min(self.turn_count, turn - self.first_turn))
+        self.snapshots = [s for s in self.snapshots if s.turn <= turn]
+
+    def branch(self, turn: int) -> 'SimulationJournal':
+        """Copy of the journal up to a turn, for a fork to continue from"""
+        journal = SimulationJournal(self.spacing, max(1, len(self.turns)), self.max_snapshots)
+        journal.commands = list(self.commands)
+        journal._command_turns = list(self._command_turns)
+        journal.turns[:self.turn_count] = self.turns[:self.turn_count]
+        journal.turn_count = self.turn_count
+        journal.snapshots = list(self.snapshots)   # Snapshots are immutable, so they can be shared
+        journal.truncate(turn)
+        return journal
@@ -0,0 +1,175 @@
+"""
+Rumor diffusion for the Warhammer Fantasy Tavern Simulator
+Rumors travel along the tavern's social graph, with who-knows-what kept as bitsets
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .enums import RelationshipType
+from .relationship_matrix import RelationshipMatrix
+
+WORD_BITS = 64
+
+class SocialGraph:
+    """Directed gossip edges in CSR form over relationship matrix indices
+
+    Row i lists the patrons that patron i passes gossip to, with the chance
+    of passing it on in a given turn.
+    """
+
+    def __init__(self, indptr: np.ndarray, indices: np.ndarray, chances: np.ndarray):
+        self.indptr = indptr
+        self.indices = indices
+        self.chances = chances
+        self.sources = np.repeat(np.arange(len(indptr) - 1), np.diff(indptr))
+
+    @property
+    def edge_count(self) -> int:
+        return len(self.indices)
+
+    def neighbours(self, i: int) -> np.ndarray:
+        return self.indices[self.indptr[i]:self.indptr[i + 1]]
+
+    @classmethod
+    def from_edges(cls, n: int, sources: np.ndarray, targets: np.ndarray, chances: np.ndarray) -> 'SocialGraph':
+        """CSR from an edge list; repeated edges keep their highest chance"""
+        order = np.lexsort((-chances, targets, sources))
+        sources, targets, chances = sources[order], targets[order], chances[order]
+        keep = np.ones(len(sources), dtype=bool)
+        keep[1:] = (sources[1:] != sources[:-1]) | (targets[1:] != targets[:-1])
+        sources, targets, chances = sources[keep], targets[keep], chances[keep]
+        indptr = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(sources, minlength=n), out=indptr[1:])
+        return cls(indptr, targets.astype(np.intp), chances)
+
+class RumorNetwork:
+    """Which patrons know which rumors, spreading a step at a time
+
+    Rumors occupy slots (bits) of a per-patron bitset; rows are the
+    patrons' relationship matrix indices, so knowledge survives leaving and
+    returning. Each step every gossip edge fires with its chance and the
+    listener learns everything the speaker knew at the start of the step.
+    When all slots are taken the oldest rumor is forgotten.
+
+    Patrons gossip with everyone they regard at least as an acquaintance
+    (friends more eagerly) and with their table companions.
+    """
+
+    def __init__(self, relationships: RelationshipMatrix, np_rng: np.random.Generator,
+                 max_rumors: int = 64, base_chance: float = 0.15, regard_chance: float = 0.1,
+                 companion_chance: float = 0.1):
+        self.relationships = relationships
+        self.np_rng = np_rng
+        self.words = max(1, -(-max_rumors // WORD_BITS))
+        self.max_rumors = self.words * WORD_BITS
+        self.base_chance = base_chance
+        self.regard_chance = regard_chance
+        self.companion_chance = companion_chance
+
+        self.rumors: List[Optional[str]] = [None] * self.max_rumors
+        self.subjects: List[Tuple[str, ...]] = [()] * self.max_rumors
+        self.slots: Dict[str, int] = {}
+        self._next_slot = 0
+        self.known = np.zeros((16, self.words), dtype=np.uint64)
+
+    def _ensure_rows(self, n: int):
+        if n > len(self.known):
+            grown = np.zeros((max(n, len(self.known) * 2), self.words), dtype=np.uint64)
+            grown[:len(self.known)] = self.known
+            self.known = grown
+
+    def _bit(self, slot: int) -> Tuple[int, np.uint64]:
+        return slot // WORD_BITS, np.uint64(1) << np.uint64(slot % WORD_BITS)
+
+    def add_rumor(self, rumor: str, sources: Sequence[str] = (), subjects: Sequence[str] = ()) -> int:
+        """Start tracking a rumor, known at first by sources; returns its slot"""
+        slot = self.slots.get(rumor)
+        if slot is None:
+            slot = self._next_slot
+            self._next_slot = (slot + 1) % self.max_rumors
+            old = self.rumors[slot]
+            if old is not None:
+                del self.slots[old]
+            word, bit = self._bit(slot)
+            self.known[:, word] &= ~bit
+            self.rumors[slot] = rumor
+            self.subjects[slot] = tuple(subjects)
+            self.slots[rumor] = slot
+        for name in sources:
+            self.learn(name, rumor)
+        return slot
+
+    def learn(self, name: str, rumor: str):
+        slot = self.slots.get(rumor)
+        if slot is None:
+            return
+        row = self.relationships.ensure(name)
+        self._ensure_rows(row + 1)
+        word, bit = self._bit(slot)
+        self.known[row, word] |= bit
+
+    def knows(self, name: str, rumor: str) -> bool:
+        slot, row = self.slots.get(rumor), self.relationships.index.get(name)
+        if slot is None or row is None or row >= len(self.known):
+            return False
+        word, bit = self._bit(slot)
+        return bool(self.known[row, word] & bit)
+
+    def knowers(self, rumor: str, names: Sequence[str] = None) -> List[str]:
+        """Names (among names, all known patrons by default) who know a rumor"""
+        names = list(self.relationships.names) if names is None else list(names)
+        return [name for name in names if self.knows(name, rumor)]
+
+    def reach(self, names: Sequence[str]) -> Dict[str, int]:
+        """How many of names know each tracked rumor"""
+        rows = self._rows(names)
+        counts = self._bit_counts(self.known[rows])
+        return {rumor: int(counts[slot]) for slot, rumor in enumerate(self.rumors) if rumor is not None}
+
+    def _rows(self, names: Sequence[str]) -> np.ndarray:
+        """Matrix rows of the names the matrix knows; the others know no rumors and have no ties"""
+        rows = self.relationships.indices(names)
+        self._ensure_rows(len(self.relationships))
+        return rows[rows >= 0]
+
+    @staticmethod
+    def _bit_counts(bitsets: np.ndarray) -> np.ndarray:
+        """Per-slot number of set bits over the rows of a (rows, words) array"""
+        bits = np.unpackbits(bitsets.astype("<u8").view(np.uint8).reshape(len(bitsets), 8 * bitsets.shape[1]), axis=1, bitorder="little")
+        return bits.sum(axis=0)
+
+    def build_graph(self, names: Sequence[str], companions: Sequence[Tuple[str, str]] = ()) -> SocialGraph:
+        """Gossip edges among the patrons present"""
+        rows = self._rows(names)
+        n = len(self.relationships)
+        regard = self.relationships.values[np.ix_(rows, rows)]
+        src, dst = np.nonzero(regard >= int(RelationshipType.ACQUAINTANCE))
+        chances = self.base_chance + self.regard_chance * (regard[src, dst].astype(np.float64) - 1)
+        sources, targets = rows[src], rows[dst]
+
+        if companions:
+            index = self.relationships.index
+            pairs = np.array([(index[a], index[b]) for a, b in companions
+                              if a in index and b in index], dtype=np.intp).reshape(-1, 2)
+            sources = np.concatenate([sources, pairs[:, 0], pairs[:, 1]])
+            targets = np.concatenate([targets, pairs[:, 1], pairs[:, 0]])
+            chances = np.concatenate([chances, np.full(2 * len(pairs), self.companion_chance)])
+        return SocialGraph.from_edges(n, sources, targets, chances)
+
+    def step(self, graph: SocialGraph) -> Dict[str, int]:
+        """One turn of gossip; returns how many patrons newly learned each rumor"""
+        if graph.edge_count == 0:
+            return {}
+        self._ensure_rows(len(graph.indptr) - 1)
+        fired = self.np_rng.random(graph.edge_count) < graph.chances
+        speakers, listeners = graph.sources[fired], graph.indices[fired]
+        if len(speakers) == 0:
+            return {}
+
+        before = self.known.copy()
+        np.bitwise_or.at(self.known, listeners, before[speakers])
+        touched = np.unique(listeners)
+        counts = self._bit_counts(self.known[touched] & ~before[touched])
+        return {self.rumors[slot]: int(counts[slot]) for slot in np.flatnonzero(counts)}
@@ -0,0 +1,206 @@
+"""
+Session log store for the Warhammer Fantasy Tavern Simulator
+Keeps the newest records in a fixed-size ring buffer and spills older ones to JSON-lines segments
+"""
+
+import json
+import re
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterator, List, Optional, Tuple, Union
+
+from .compact_log import LogKind
+
+CLOCK_PREFIX = re.compile(r"^\[(\d{2}):(\d{2}):(\d{2})\] ")
+
+@dataclass
+class LogRecord:
+    """One session log entry"""
+    seq: int
+    timestamp: float
+    turn: int
+    kind: LogKind
+    message: str
+    actors: Tuple[str, ...] = field(default_factory=tuple)
+
+    def render(self) -> str:
+        """Line in the session log format"""
+        return f"[{time.strftime('%H:%M:%S', time.localtime(self.timestamp))}] {self.message}"
+
+    def to_dict(self) -> dict:
+        return {
+            'seq': self.seq,
+            'timestamp': self.timestamp,
+            'turn': self.turn,
+            'kind': self.kind.name,
+            'message': self.message,
+            'actors': list(self.actors)
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'LogRecord':
+        return cls(
+            seq=data['seq'],
+            timestamp=data['timestamp'],
+            turn=data['turn'],
+            kind=LogKind[data['kind']],
+            message=data['message'],
+            actors=tuple(data.get('actors', ()))
+        )
+
+class SessionLog:
+    """Bounded session log with cursor-based reads
+
+    Every record gets a sequence number; a reader keeps the sequence number
+    after the last record it saw (its cursor) and asks only for what came
+    since. The newest `capacity` records stay in memory. Older ones are
+    written to `spill_dir` in segments of `segment_size` records when a spill
+    directory is configured, and dropped otherwise.
+    """
+
+    def __init__(self, capacity: int = 10000, spill_dir: Optional[str] = None, segment_size: int = 2000):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.segment_size = segment_size
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        if self.spill_dir:
+            self.spill_dir.mkdir(parents=True, exist_ok=True)
+
+        self._ring: List[Optional[LogRecord]] = [None] * capacity
+        self.next_seq = 0
+        self.first_seq = 0            # Oldest record still readable (memory or disk)
+        self._memory_floor = 0        # Records before this were never in the ring
+        self._spill_buffer: List[LogRecord] = []
+        # (first_seq, last_seq, source); source is a segment file or a loader callable
+        self._segments: List[Tuple[int, int, Union[Path, Callable[[], List[LogRecord]]]]] = []
+
+    def __len__(self) -> int:
+        return self.next_seq - self.first_seq
+
+    @property
+    def memory_start(self) -> int:
+        """Sequence number of the oldest record held in the ring buffer"""
+        return max(self.first_seq, self._memory_floor, self.next_seq - self.capacity)
+
+    def append(self, message: str, kind: LogKind = LogKind.MESSAGE, turn: int = 0,
+               actors: Tuple[str, ...] = (), timestamp: Optional[float] = None) -> LogRecord:
+        record = LogRecord(
+            seq=self.next_seq,
+            timestamp=time.time() if timestamp is None else timestamp,
+            turn=turn,
+            kind=kind,
+            message=message,
+            actors=tuple(actors)
+        )
+        slot = record.seq % self.capacity
+        evicted = self._ring[slot]
+        if evicted is not None and evicted.seq >= self.first_seq:
+            self._evict(evicted)
+        self._ring[slot] = record
+        self.next_seq += 1
+        return record
+
+    def append_line(self, line: str, kind: LogKind = LogKind.MESSAGE, turn: int = 0,
+                    day: Optional[datetime] = None) -> LogRecord:
+        """Append an already rendered "[HH:MM:SS] message" line, keeping its clock time"""
+        match = CLOCK_PREFIX.match(line)
+        if not match:
+            return self.append(line, kind, turn)
+        hour, minute, second = (int(part) for part in match.groups())
+        day = day or datetime.now()
+        timestamp = day.replace(hour=hour, minute=minute, second=second, microsecond=0).timestamp()
+        return self.append(line[match.end():], kind, turn, timestamp=timestamp)
+
+    def _evict(self, record: LogRecord):
+        if self.spill_dir is None:
+            self.first_seq = record.seq + 1
+            return
+        self._spill_buffer.append(record)
+        if len(self._spill_buffer) >= self.segment_size:
+            self._write_segment()
+
+    def _write_segment(self):
+        if not self._spill_buffer:
+            return
+        first, last = self._spill_buffer[0].seq, self._spill_buffer[-1].seq
+        path = self.spill_dir / f"log_{first:010d}.jsonl"
+        with open(path, 'w', encoding='utf-8') as f:
+            for record in self._spill_buffer:
+                f.write(json.dumps(record.to_dict(), ensure_ascii=False) + "\n")
+        self._segments.append((first, last, path))
+        self._spill_buffer = []
+
+    def flush(self):
+        """Write spilled records still held in memory to disk"""
+        if self.spill_dir is not None:
+            self._write_segment()
+
+    def attach_archive(self, first_seq: int, next_seq: int,
+                       segments: List[Tuple[int, int, Callable[[], List[LogRecord]]]]):
+        """Start from records stored elsewhere
+
+        The newest `capacity` records are read into memory right away; older
+        ones are read through their loaders only when asked for.
+        """
+        self.clear()
+        self.first_seq = first_seq
+        self.next_seq = next_seq
+        self._memory_floor = max(first_seq, next_seq - self.capacity)
+        self._segments = []
+        for first, last, source in segments:
+            if last >= self._memory_floor:
+                for record in self._read_segment(source):
+                    if record.seq >= self._memory_floor:
+                        self._ring[record.seq % self.capacity] = record
+            if first < self._memory_floor:
+                self._segments.append((first, last, source))
+
+    def _read_segment(self, source) -> List[LogRecord]:
+        if callable(source):
+            return source()
+        with open(source, 'r', encoding='utf-8') as f:
+            return [LogRecord.from_dict(json.loads(line)) for line in f if line.strip()]
+
+    def iter_range(self, start: int = 0, end: Optional[int] = None) -> Iterator[LogRecord]:
+        """Records with start <= seq < end, oldest first, reading spilled segments as needed"""
+        start = max(start, self.first_seq)
+        end = self.next_seq if end is None else min(end, self.next_seq)
+        memory_start = self.memory_start
+
+        if start < memory_start:
+            for first, last, source in self._segments:
+                if last < start or first >= end:
+                    continue
+                for record in self._read_segment(source):
+                    if start <= record.seq < end:
+                        yield record
+            for record in self._spill_buffer:
+                if start <= record.seq < end:
+                    yield record
+
+        for seq in range(max(start, memory_start), end):
+            yield self._ring[seq % self.capacity]
+
+    def read_since(self, cursor: int = 0, limit: Optional[int] = None) -> Tuple[List[LogRecord], int]:
+        """Records from cursor on (at most limit of them) and the cursor to use next time"""
+        end = None if limit is None else max(cursor, self.first_seq) + limit
+        records = list(self.iter_range(cursor, end))
+        next_cursor = records[-1].seq + 1 if records else max(cursor, self.first_seq)
+        return records, next_cursor
+
+    def lines(self) -> List[str]:
+        """Rendered lines of the newest `capacity` records"""
+        return [record.render() for record in self.iter_range(self.next_seq - self.capacity)]
+
+    def clear(self):
+        """Forget every record; sequence numbers keep counting so old cursors stay valid"""
+        self._ring = [None] * self.capacity
+        self.first_seq = self._memory_floor = self.next_seq
+        self._spill_buffer = []
+        for _, _, source in self._segments:
+            if isinstance(source, Path):
+                source.unlink(missing_ok=True)
+        self._segments = []
@@ -0,0 +1,183 @@
+"""
+Session files for the Warhammer Fantasy Tavern Simulator
+A session is a JSON-lines file: a versioned header followed by state, log and interaction chunks
+"""
+
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .event import Interaction
+from .session_log import LogRecord
+
+FORMAT_NAME = "tavern-session"
+FORMAT_VERSION = 1
+CHUNK_SIZE = 1000
+SESSION_EXTENSION = ".tavern"
+
+# Lines start with their section so a scan can index the file without parsing it
+SECTION_PATTERN = re.compile(rb'^\{"section": "(\w+)"(?:, "first": (\d+), "last": (\d+)|, "count": (\d+))?')
+
+@dataclass
+class SessionIndex:
+    """Byte offsets of the sections in a session file"""
+    version: int = 0
+    state_offset: Optional[int] = None
+    log_chunks: List[Tuple[int, int, int]] = field(default_factory=list)       # (first_seq, last_seq, offset)
+    history_chunks: List[Tuple[int, int]] = field(default_factory=list)        # (count, offset)
+    state_end: int = 0   # End of the last complete state line; anything after it belongs to no save
+
+class SessionFile:
+    """Reads and writes one session file
+
+    A full save streams every section into a temporary file that replaces the
+    old one. An append save adds the log and interaction chunks recorded since
+    the previous save, followed by a fresh state line. The last state line
+    wins, and it records how much of the log and history belongs to it, so a
+    save torn by a crash falls back to the previous state. Chunks written
+    after the last state line are ignored, and the next append cuts them off.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._index: Optional[SessionIndex] = None
+
+    def write(self, state: Dict[str, Any], log_records: Iterable[LogRecord], interactions: Iterable[Interaction]):
+        """Write a complete session"""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            self._write_line(f, {"section": "header", "format": FORMAT_NAME, "version": FORMAT_VERSION,
+                                 "created": datetime.now().isoformat()})
+            self._write_sections(f, state, log_records, interactions)
+        os.replace(tmp_path, self.path)
+        self._index = None
+
+    def append(self, state: Dict[str, Any], log_records: Iterable[LogRecord], interactions: Iterable[Interaction]):
+        """Append what changed since the last save, first dropping whatever a torn save left after it"""
+        state_end = self.index().state_end
+        with open(self.path, 'r+', encoding='utf-8') as f:
+            f.seek(state_end)
+            f.truncate()
+            self._write_sections(f, state, log_records, interactions)
+        self._index = None
+
+    def _write_sections(self, f, state: Dict[str, Any], log_records: Iterable[LogRecord],
+                        interactions: Iterable[Interaction]):
+        for chunk in _chunks(log_records):
+            self._write_line(f, {"section": "log", "first": chunk[0].seq, "last": chunk[-1].seq,
+                                 "records": [record.to_dict() for record in chunk]})
+        for chunk in _chunks(interactions):
+            self._write_line(f, {"section": "interactions", "count": len(chunk),
+                                 "records": [interaction.to_dict() for interaction in chunk]})
+        self._write_line(f, {"section": "state", **state})
+        f.flush()
+
+    @staticmethod
+    def _write_line(f, data: Dict[str, Any]):
+        f.write(json.dumps(data, ensure_ascii=False) + "\n")
+
+    def index(self) -> SessionIndex:
+        """Scan the file for section offsets (cached until the next write)"""
+        if self._index is not None:
+            return self._index
+
+        index = SessionIndex()
+        offset = 0
+        # Chunks only count once the state line of their save follows them
+        log_chunks, history_chunks = [], []
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Torn write
+                match = SECTION_PATTERN.match(line)
+                if match:
+                    section = match.group(1)
+                    if section == b"header":
+                        index.version = json.loads(line)["version"]
+                        index.state_end = offset + len(line)
+                    elif section == b"state":
+                        index.state_offset = offset
+                        index.state_end = offset + len(line)
+                        index.log_chunks.extend(log_chunks)
+                        index.history_chunks.extend(history_chunks)
+                        log_chunks, history_chunks = [], []
+                    elif section == b"log":
+                        log_chunks.append((int(match.group(2)), int(match.group(3)), offset))
+                    elif section == b"interactions":
+                        history_chunks.append((int(match.group(4)), offset))
+                offset += len(line)
+
+        if index.version == 0:
+            raise ValueError(f"{self.path} is not a {FORMAT_NAME} file")
+        if index.version > FORMAT_VERSION:
+            raise ValueError(f"Session format version {index.version} is newer than supported ({FORMAT_VERSION})")
+        if index.state_offset is None:
+            raise ValueError(f"{self.path} has no saved state")
+        self._index = index
+        return index
+
+    def _read_at(self, offset: int) -> Dict[str, Any]:
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+    def read_state(self) -> Dict[str, Any]:
+        return self._read_at(self.index().state_offset)
+
+    def read_log_range(self, first: int, last: int) -> List[LogRecord]:
+        """Log records with first <= seq <= last"""
+        records = []
+        for chunk_first, chunk_last, offset in self.index().log_chunks:
+            if chunk_last < first or chunk_first > last:
+                continue
+            records.extend(
+                LogRecord.from_dict(data) for data in self._read_at(offset)["records"]
+                if first <= data["seq"] <= last
+            )
+        records.sort(key=lambda record: record.seq)
+        return records
+
+    def log_segments(self, first_seq: int, next_seq: int) -> List[Tuple[int, int, Any]]:
+        """Lazy (first, last, loader) segments covering the saved log, for SessionLog.attach_archive"""
+        segments = []
+        for chunk_first, chunk_last, _ in self.index().log_chunks:
+            first, last = max(chunk_first, first_seq), min(chunk_last, next_seq - 1)
+            if first <= last:
+                segments.append((first, last, lambda first=first, last=last: self.read_log_range(first, last)))
+        return segments
+
+    def read_interactions(self, count: int) -> List[Interaction]:
+        """The first count saved interactions"""
+        interactions = []
+        for _, offset in self.index().history_chunks:
+            if len(interactions) >= count:
+                break
+            interactions.extend(Interaction.from_dict(data) for data in self._read_at(offset)["records"])
+        return interactions[:count]
+
+    def read_interaction_tail(self, count: int, limit: int) -> List[Interaction]:
+        """The last limit of the first count saved interactions, reading only the chunks holding them"""
+        first = max(0, count - limit)
+        interactions = []
+        position = 0
+        for chunk_count, offset in self.index().history_chunks:
+            if position >= count:
+                break
+            if position + chunk_count > first:
+                records = self._read_at(offset)["records"]
+                start, end = max(0, first - position), min(chunk_count, count - position)
+                interactions.extend(Interaction.from_dict(data) for data in records[start:end])
+            position += chunk_count
+        return interactions
+
+def _chunks(items: Iterable[Any], size: int = CHUNK_SIZE) -> Iterator[List[Any]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
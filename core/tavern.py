@@ -3,10 +3,18 @@ Tavern class for the Warhammer Fantasy Tavern Simulator
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterable, Optional, Any
 import random
+
+import numpy as np
+
 from .enums import TavernQuality, AtmosphereType, EventType
 from .character import Character
+from .character_roster import CharacterRoster
+from .patron_state import PatronState
+from .tavern_zones import ZoneMap
+from .relationship_matrix import RelationshipMatrix
+from .text_templates import TEMPLATES
 
 @dataclass
 class Tavern:
@@ -34,7 +42,7 @@ class Tavern:
     room_price: int = 10
     
     # Characters and Events
-    characters: List[Character] = field(default_factory=list)
+    characters: CharacterRoster = field(default_factory=CharacterRoster)
     current_events: List[str] = field(default_factory=list)
     
     # Tension and Mood
@@ -44,39 +52,115 @@ class Tavern:
     # History and Reputation
     reputation: int = 50    # 0-100
     notable_events: List[str] = field(default_factory=list)
+    brawl_count: int = 0
     
     # Time and Weather
     time_of_day: str = "evening"
     weather: str = "clear"
     
+    # Random source (the simulator injects its own for reproducible runs)
+    rng: Any = field(default=random, repr=False, compare=False)
+    
+    # Relationships of everyone who has been in the tavern
+    relationships: RelationshipMatrix = field(default_factory=RelationshipMatrix, repr=False, compare=False)
+    
+    # Patron stats as NumPy columns, for crowded taverns (see use_patron_state)
+    patrons: Optional[PatronState] = field(default=None, repr=False, compare=False)
+    
+    # Areas of the tavern patrons are spread over (see use_zones)
+    zones: Optional[ZoneMap] = field(default=None, repr=False, compare=False)
+    
     def __post_init__(self):
         """Initialize tavern after creation"""
+        if not isinstance(self.characters, CharacterRoster):
+            self.characters = CharacterRoster(self.characters)
         self.current_occupancy = len(self.characters)
+        for character in self.characters:
+            character.bind_relationships(self.relationships)
     
     def add_character(self, character: Character) -> bool:
         """Add a character to the tavern"""
-        if self.current_occupancy < self.capacity:
-            self.characters.append(character)
-            self.current_occupancy += 1
+        if self.current_occupancy < self.capacity and not self.characters.has_name(character.name):
+            self._admit(character)
             self.update_atmosphere()
             return True
         return False
     
+    def add_characters(self, characters: Iterable[Character]) -> int:
+        """Add many characters, updating the atmosphere once; returns how many got in"""
+        added = 0
+        for character in characters:
+            if self.current_occupancy >= self.capacity:
+                break
+            if self.characters.has_name(character.name):
+                continue
+            self._admit(character)
+            added += 1
+        if added:
+            self.update_atmosphere()
+        return added
+    
+    def _admit(self, character: Character):
+        character.bind_relationships(self.relationships)
+        self.characters._insert(character)
+        if self.patrons is not None:
+            self.patrons.bind(character)
+        if self.zones is not None:
+            self.zones.place(character)
+        self.current_occupancy += 1
+    
     def remove_character(self, character: Character) -> bool:
         """Remove a character from the tavern"""
-        if character in self.characters:
-            self.characters.remove(character)
+        if self.characters._discard(character):
+            if self.patrons is not None:
+                self.patrons.release(character)
+            if self.zones is not None:
+                self.zones.remove(character)
             self.current_occupancy -= 1
             self.update_atmosphere()
             return True
         return False
     
+    def use_patron_state(self, np_rng: np.random.Generator = None) -> PatronState:
+        """Keep patron stats in NumPy arrays so per-turn updates run vectorized
+        
+        Random draws for vectorized updates (brawl injuries) come from np_rng,
+        seeded from the tavern's RNG by default, so they differ from the
+        per-character path but stay reproducible.
+        """
+        if self.patrons is None:
+            if np_rng is None:
+                np_rng = np.random.default_rng(self.rng.getrandbits(64))
+            self.patrons = PatronState(np_rng)
+            for character in self.characters:
+                self.patrons.bind(character)
+        return self.patrons
+    
+    def use_zones(self, layout=None) -> ZoneMap:
+        """Spread patrons over zones (bar, main hall, ...) so brawls and encounters stay local"""
+        if self.zones is None:
+            self.zones = ZoneMap(layout)
+            for character in self.characters:
+                self.zones.place(character)
+        return self.zones
+    
+    def drunk_count(self) -> int:
+        """Number of drunk characters present"""
+        if self.patrons is not None:
+            return self.patrons.drunk_count()
+        return sum(1 for c in self.characters if c.is_drunk())
+    
+    def sober_up_characters(self):
+        """Let every character sober up by one step"""
+        if self.patrons is not None:
+            self.patrons.sober_up()
+            return
+        for character in self.characters:
+            character.sober_up()
+    
     def get_character_by_name(self, name: str) -> Optional[Character]:
         """Get a character by name"""
-        for character in self.characters:
-            if character.name == name:
-                return character
-        return None
+        return self.characters.get(name)
     
     def update_atmosphere(self):
         """Update tavern atmosphere based on current conditions"""
@@ -97,7 +181,7 @@ class Tavern:
             self.atmosphere = AtmosphereType.TENSE
         elif self.tension_level > 40:
             self.atmosphere = AtmosphereType.ROWDY
-        elif len([c for c in self.characters if c.is_drunk()]) > len(self.characters) / 2:
+        elif self.drunk_count() > len(self.characters) / 2:
             self.atmosphere = AtmosphereType.FESTIVE
         else:
             self.atmosphere = base_atmosphere
@@ -107,50 +191,7 @@ class Tavern:
     
     def update_atmosphere_description(self):
         """Update the atmosphere description based on current atmosphere"""
-        descriptions = {
-            AtmosphereType.PEACEFUL: [
-                "The tavern is quiet and serene, with soft conversations and gentle music.",
-                "A calm atmosphere pervades the establishment, perfect for quiet contemplation.",
-                "The peaceful ambiance is broken only by the crackling of the fireplace."
-            ],
-            AtmosphereType.LIVELY: [
-                "The tavern buzzes with animated conversations and laughter.",
-                "A vibrant energy fills the air as patrons enjoy their evening.",
-                "The atmosphere is warm and welcoming, with a steady hum of activity."
-            ],
-            AtmosphereType.TENSE: [
-                "An uncomfortable tension hangs in the air, with suspicious glances exchanged.",
-                "The atmosphere is thick with unspoken conflicts and brewing trouble.",
-                "Conversations are hushed and wary, as if everyone expects trouble."
-            ],
-            AtmosphereType.FESTIVE: [
-                "The tavern erupts with celebration, music, and boisterous laughter.",
-                "A party atmosphere dominates, with singing, dancing, and merriment.",
-                "The festive mood is infectious, drawing everyone into the celebration."
-            ],
-            AtmosphereType.GLOOMY: [
-                "A somber mood hangs over the tavern like a dark cloud.",
-                "The atmosphere is heavy with sadness and melancholy.",
-                "Even the flickering candles seem dimmer in the gloomy ambiance."
-            ],
-            AtmosphereType.MYSTERIOUS: [
-                "Shadows dance in the corners, and whispered secrets fill the air.",
-                "An air of mystery and intrigue permeates the establishment.",
-                "Strange figures huddle in dark corners, speaking in hushed tones."
-            ],
-            AtmosphereType.ROWDY: [
-                "The tavern is loud and boisterous, with raised voices and rough laughter.",
-                "A raucous atmosphere prevails, with plenty of drinking and carousing.",
-                "The noise level is high, with patrons becoming increasingly animated."
-            ],
-            AtmosphereType.INTIMATE: [
-                "The tavern has a cozy, intimate feel with quiet conversations.",
-                "Soft lighting and low voices create a personal, private atmosphere.",
-                "The intimate setting encourages deep conversations and close bonds."
-            ]
-        }
-        
-        self.atmosphere_description = random.choice(descriptions.get(self.atmosphere, ["The tavern has an unremarkable atmosphere."]))
+        self.atmosphere_description = self.rng.choice(TEMPLATES.atmospheres.get(self.atmosphere, TEMPLATES.default_atmospheres))
     
     def increase_tension(self, amount: int = 10):
         """Increase tension in the tavern"""
@@ -167,11 +208,11 @@ class Tavern:
     def trigger_brawl_check(self) -> bool:
         """Check if a brawl should be triggered"""
         brawl_chance = (self.tension_level - 50) / 50.0  # 0-1 based on tension above 50
-        drunk_modifier = len([c for c in self.characters if c.is_drunk()]) / len(self.characters) if self.characters else 0
+        drunk_modifier = self.drunk_count() / len(self.characters) if self.characters else 0
         
         final_chance = min(0.8, brawl_chance + drunk_modifier * 0.3)
         
-        if random.random() < final_chance:
+        if self.rng.random() < final_chance:
             self.trigger_brawl()
             return True
         return False
@@ -179,14 +220,27 @@ class Tavern:
     def trigger_brawl(self):
         """Trigger a tavern brawl"""
         self.current_events.append("A brawl has broken out!")
+        self.brawl_count += 1
         self.tension_level = max(0, self.tension_level - 30)  # Tension releases after brawl
         self.reputation = max(0, self.reputation - 10)  # Reputation suffers
-        self.notable_events.append(f"A massive brawl erupted in the tavern at {self.time_of_day}")
+        
+        # With zones, the brawl breaks out in one zone and spills into the neighbouring ones
+        zone = self.zones.pick_zone(self.rng) if self.zones is not None else None
+        if zone is None:
+            self.notable_events.append(f"A massive brawl erupted in the tavern at {self.time_of_day}")
+            involved = self.characters
+        else:
+            self.notable_events.append(f"A massive brawl erupted at the {zone.replace('_', ' ')} at {self.time_of_day}")
+            involved = self.zones.local_group(zone)
         
         # Randomly injure some characters
-        for character in self.characters:
-            if random.random() < 0.3:  # 30% chance of injury
-                character.health = max(10, character.health - random.randint(10, 30))
+        if self.patrons is not None:
+            rows = None if zone is None else [c.__dict__["_patron_row"] for c in involved]
+            self.patrons.injure(chance=0.3, min_damage=10, max_damage=30, min_health=10, rows=rows)
+            return
+        for character in involved:
+            if self.rng.random() < 0.3:  # 30% chance of injury
+                character.health = max(10, character.health - self.rng.randint(10, 30))
     
     def serve_drink(self, character: Character, drink_type: str = "ale") -> bool:
         """Serve a drink to a character"""
@@ -237,6 +291,7 @@ class Tavern:
             'noise_level': self.noise_level,
             'reputation': self.reputation,
             'notable_events': self.notable_events,
+            'brawl_count': self.brawl_count,
             'time_of_day': self.time_of_day,
             'weather': self.weather
         }
@@ -265,13 +320,16 @@ class Tavern:
             noise_level=data.get('noise_level', 30),
             reputation=data.get('reputation', 50),
             notable_events=data.get('notable_events', []),
+            brawl_count=data.get('brawl_count', 0),
             time_of_day=data.get('time_of_day', 'evening'),
             weather=data.get('weather', 'clear')
         )
         
         # Restore characters
         if 'characters' in data:
-            tavern.characters = [Character.from_dict(char_data) for char_data in data['characters']]
+            tavern.characters = CharacterRoster(Character.from_dict(char_data) for char_data in data['characters'])
             tavern.current_occupancy = len(tavern.characters)
+            for character in tavern.characters:
+                character.bind_relationships(tavern.relationships)
         
         return tavern
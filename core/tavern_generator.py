@@ -10,7 +10,8 @@ from .enums import TavernQuality, AtmosphereType
 class TavernGenerator:
     """Generates randomized taverns with Warhammer Fantasy flavor"""
     
-    def __init__(self):
+    def __init__(self, rng: random.Random = None):
+        self.rng = rng if rng is not None else random
         self.tavern_names = self._initialize_tavern_names()
         self.location_types = self._initialize_locations()
         self.description_templates = self._initialize_descriptions()
@@ -154,18 +155,18 @@ class TavernGenerator:
         """Generate a randomized tavern"""
         # Select or generate name
         if name is None:
-            name = random.choice(self.tavern_names)
+            name = self.rng.choice(self.tavern_names)
         
         # Select or generate quality
         if quality is None:
-            quality = random.choice(list(TavernQuality))
+            quality = self.rng.choice(list(TavernQuality))
         
         # Select location
-        location_info = random.choice(self.location_types)
+        location_info = self.rng.choice(self.location_types)
         location = f"{location_info['type']}: {location_info['description']}"
         
         # Generate description based on quality
-        base_description = random.choice(self.description_templates[quality])
+        base_description = self.rng.choice(self.description_templates[quality])
         
         # Add atmospheric details
         atmospheric_details = self._generate_atmospheric_details(quality)
@@ -180,7 +181,7 @@ class TavernGenerator:
             TavernQuality.EXCELLENT: (25, 50)
         }
         min_cap, max_cap = capacity_ranges[quality]
-        capacity = random.randint(min_cap, max_cap)
+        capacity = self.rng.randint(min_cap, max_cap)
         
         # Generate prices based on quality
         base_prices = {
@@ -208,7 +209,8 @@ class TavernGenerator:
             wine_price=prices["wine"],
             food_price=prices["food"],
             room_price=prices["room"],
-            reputation=self._generate_initial_reputation(quality)
+            reputation=self._generate_initial_reputation(quality),
+            rng=self.rng
         )
         
         # Update atmosphere description
@@ -251,7 +253,7 @@ class TavernGenerator:
             ]
         }
         
-        return random.choice(details[quality])
+        return self.rng.choice(details[quality])
     
     def _generate_initial_atmosphere(self) -> AtmosphereType:
         """Generate initial atmosphere type"""
@@ -269,7 +271,7 @@ class TavernGenerator:
         
         # Select based on weights
         total_weight = sum(atmosphere_weights.values())
-        rand_val = random.randint(1, total_weight)
+        rand_val = self.rng.randint(1, total_weight)
         current_weight = 0
         
         for atmosphere, weight in atmosphere_weights.items():
@@ -290,8 +292,8 @@ class TavernGenerator:
         }
         
         min_rep, max_rep = reputation_ranges[quality]
-        return random.randint(min_rep, max_rep)
+        return self.rng.randint(min_rep, max_rep)
     
     def get_random_tavern_name(self) -> str:
         """Get a random tavern name"""
-        return random.choice(self.tavern_names)
+        return self.rng.choice(self.tavern_names)
@@ -2,9 +2,10 @@
 Main simulator class for the Warhammer Fantasy Tavern Simulator
 """
 
+import os
 import random
 import json
-import pickle
+import numpy as np
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 from .character import Character
@@ -14,24 +15,56 @@ from .tavern_generator import TavernGenerator
 from .dice_system import DiceSystem, InteractionSystem
 from .event import Event, EventGenerator, RumorSystem, Interaction
 from .enums import InteractionType, EventType
+from .weighted_sampler import WeightedSampler
+from .patron_generator import PatronGenerator
+from .rumor_network import RumorNetwork, SocialGraph
+from .compact_log import CompactEventLog, LogKind
+from .session_log import SessionLog, LogRecord
+from .session_store import SessionFile, SESSION_EXTENSION
+from .replay import SimulationJournal, Snapshot, recorded, rng_fingerprint, pack_state, unpack_state
+
+# Random interactions are weighted towards peaceful ones
+RANDOM_INTERACTION_WEIGHTS = {
+    InteractionType.CONVERSATION: 30,
+    InteractionType.DRINKING: 20,
+    InteractionType.GAMBLING: 15,
+    InteractionType.STORYTELLING: 10,
+    InteractionType.TRADE: 10,
+    InteractionType.INFORMATION: 8,
+    InteractionType.PERSUASION: 5,
+    InteractionType.INTIMIDATION: 2
+}
 
 class TavernSimulator:
     """Main simulator class that orchestrates all tavern activities"""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None, rng: random.Random = None,
+                 log_capacity: int = 10000, log_spill_dir: Optional[str] = None,
+                 patron_arrays: bool = False, zoned: bool = False, rumor_diffusion: bool = False,
+                 snapshot_spacing: Optional[int] = 50, snapshot_limit: Optional[int] = 64):
+        # Single random source shared by every subsystem, so runs with the same
+        # seed replay identically and simulators never share global state
+        self.seed = seed
+        self.rng = rng if rng is not None else random.Random(seed)
+        
         # Core systems
-        self.dice_system = DiceSystem()
-        self.interaction_system = InteractionSystem(self.dice_system)
+        self.dice_system = DiceSystem(self.rng)
+        self.interaction_system = InteractionSystem(self.dice_system, self.rng)
         self.character_generator = CharacterGenerator()
-        self.tavern_generator = TavernGenerator()
-        self.event_generator = EventGenerator()
-        self.rumor_system = RumorSystem()
+        self._patron_generator: Optional[PatronGenerator] = None
+        self.tavern_generator = TavernGenerator(self.rng)
+        self.event_generator = EventGenerator(self.rng)
+        self.rumor_system = RumorSystem(self.rng)
+        self.interaction_sampler = WeightedSampler(RANDOM_INTERACTION_WEIGHTS)
         
         # Current state
         self.current_tavern: Optional[Tavern] = None
         self.available_characters: Dict[str, Character] = {}
-        self.session_log: List[str] = []
+        self.compact_log = CompactEventLog()
+        self.log_store = SessionLog(capacity=log_capacity, spill_dir=log_spill_dir)
         self.interaction_history: List[Interaction] = []
+        self._session_file: Optional[SessionFile] = None
+        self._save_marks: Optional[Tuple[str, int, int]] = None   # (path, log seq, history length) at last save
         self.event_history: List[Event] = []
         
         # Session tracking
@@ -39,21 +72,48 @@ class TavernSimulator:
         self.turn_counter = 0
         self.auto_events_enabled = True
         
+        # While fast-forwarding, turn events go to compact_log and are only
+        # rendered into the log store when the log is read
+        self.fast_forward = False
+        
+        # Keep patron stats in NumPy arrays (for very crowded taverns)
+        self.patron_arrays = patron_arrays
+        
+        # Spread patrons over tavern zones and keep encounters local
+        self.zoned = zoned
+        
+        # Let rumors travel the social graph every turn
+        self.rumor_diffusion = rumor_diffusion
+        self.rumor_network: Optional[RumorNetwork] = None
+        self._social_graph: Optional[Tuple[tuple, SocialGraph]] = None
+        
         # Initialize with all characters available
         self.reset_characters()
+        
+        # Journal of the session for replay and forks (None turns it off)
+        self.snapshot_spacing = snapshot_spacing
+        self.snapshot_limit = snapshot_limit   # Replay reaches back at most spacing * limit turns
+        self.journal: Optional[SimulationJournal] = None
+        self._start_journal()
     
     def reset_characters(self):
         """Reset all characters to their default state"""
         all_chars = self.character_generator.get_all_characters()
         self.available_characters = {char.name: char for char in all_chars}
     
+    @recorded
     def generate_new_tavern(self, name: str = None) -> Tavern:
         """Generate a new tavern and populate it with random characters"""
         self.current_tavern = self.tavern_generator.generate_tavern(name)
+        if self.patron_arrays:
+            self.current_tavern.use_patron_state(self.dice_system.np_rng)
+        if self.zoned:
+            self.current_tavern.use_zones()
+        self._attach_rumor_network()
         
         # Add random characters to the tavern (5-12 characters)
-        num_characters = random.randint(5, min(12, len(self.available_characters)))
-        selected_chars = random.sample(list(self.available_characters.values()), num_characters)
+        num_characters = self.rng.randint(5, min(12, len(self.available_characters)))
+        selected_chars = self.rng.sample(list(self.available_characters.values()), num_characters)
         
         for char in selected_chars:
             self.current_tavern.add_character(char)
@@ -63,6 +123,7 @@ class TavernSimulator:
         
         return self.current_tavern
     
+    @recorded
     def add_character_to_tavern(self, character_name: str) -> bool:
         """Add a specific character to the current tavern"""
         if not self.current_tavern:
@@ -77,10 +138,36 @@ class TavernSimulator:
         
         success = self.current_tavern.add_character(character)
         if success:
-            self.log_event(f"{character.name} enters the tavern")
+            self.log_event(f"{character.name} enters the tavern", actors=(character.name,))
         
         return success
     
+    @property
+    def patron_generator(self) -> PatronGenerator:
+        """Generator for background patrons, sharing the simulator's RNG"""
+        if self._patron_generator is None:
+            self._patron_generator = PatronGenerator(rng=self.rng, reserved_names=self.available_characters)
+        return self._patron_generator
+    
+    @recorded
+    def add_patrons(self, count: int, grow_capacity: bool = True) -> int:
+        """Fill the current tavern with generated patrons, for crowded taverns and load tests
+        
+        With grow_capacity the tavern is enlarged to fit everyone; otherwise
+        patrons stop coming in once it is full. Returns how many were added.
+        """
+        if not self.current_tavern:
+            return 0
+        
+        tavern = self.current_tavern
+        if grow_capacity:
+            tavern.capacity = max(tavern.capacity, tavern.current_occupancy + count)
+        added = tavern.add_characters(self.patron_generator.iter_patrons(min(count, tavern.capacity - tavern.current_occupancy)))
+        if added:
+            self.log_event(f"A crowd of {added} patrons pours into the tavern")
+        return added
+    
+    @recorded
     def remove_character_from_tavern(self, character_name: str) -> bool:
         """Remove a character from the current tavern"""
         if not self.current_tavern:
@@ -92,10 +179,36 @@ class TavernSimulator:
         
         success = self.current_tavern.remove_character(character)
         if success:
-            self.log_event(f"{character.name} leaves the tavern")
+            self.log_event(f"{character.name} leaves the tavern", actors=(character.name,))
         
         return success
     
+    @recorded
+    def serve_drink(self, character_name: str, drink_type: str = "ale") -> bool:
+        """Serve a drink to a character in the current tavern, if they can pay for it"""
+        if not self.current_tavern:
+            return False
+        
+        character = self.current_tavern.get_character_by_name(character_name)
+        if not character:
+            return False
+        
+        served = self.current_tavern.serve_drink(character, drink_type)
+        if served:
+            self.log_event(f"{character.name} drinks {drink_type}", actors=(character.name,))
+        
+        return served
+    
+    @recorded
+    def adjust_tavern(self, tension_change: int = 0, reputation_change: int = 0):
+        """Shift the current tavern's tension and reputation, e.g. from outside actions"""
+        tavern = self.current_tavern
+        if not tavern:
+            return
+        tavern.tension_level = max(0, min(100, tavern.tension_level + tension_change))
+        tavern.reputation = max(0, min(100, tavern.reputation + reputation_change))
+    
+    @recorded
     def perform_interaction(self, initiator_name: str, target_name: str, interaction_type: InteractionType) -> Optional[Interaction]:
         """Perform an interaction between two characters"""
         if not self.current_tavern:
@@ -108,15 +221,29 @@ class TavernSimulator:
             return None
         
         if not initiator.can_interact_with(target):
-            self.log_event(f"{initiator.name} refuses to interact with {target.name}")
+            if self.fast_forward:
+                self.compact_log.record_refusal(self.turn_counter, initiator.name, target.name)
+            else:
+                self.log_event(f"{initiator.name} refuses to interact with {target.name}",
+                               LogKind.REFUSAL, (initiator.name, target.name))
             return None
         
         # Perform the interaction
-        interaction = self.interaction_system.perform_interaction(initiator, target, interaction_type)
+        interaction = self.interaction_system.perform_interaction(
+            initiator, target, interaction_type, describe=not self.fast_forward
+        )
         
         # Log the interaction
-        self.interaction_history.append(interaction)
-        self.log_event(f"Interaction: {interaction.outcome_description}")
+        self._interaction_history.append(interaction)
+        if self.fast_forward:
+            self.compact_log.record_interaction(
+                self.turn_counter, interaction,
+                interaction.dice_roll == self.dice_system.critical_success_threshold,
+                interaction.dice_roll == self.dice_system.critical_failure_threshold
+            )
+        else:
+            self.log_event(f"Interaction: {interaction.outcome_description}",
+                           LogKind.INTERACTION, (initiator.name, target.name))
         
         # Update tavern tension based on interaction
         if interaction.success:
@@ -131,13 +258,20 @@ class TavernSimulator:
                 self.current_tavern.increase_tension(3)
         
         # Chance for rumor spreading
-        if random.random() < 0.3:
+        if self.rng.random() < 0.3:
             rumor = self.rumor_system.spread_rumor(initiator, target)
             if rumor:
-                self.log_event(f"Rumor spreads: {rumor}")
+                if self.rumor_network is not None:
+                    self.rumor_network.add_rumor(rumor, sources=(initiator.name, target.name),
+                                                 subjects=self.rumor_system.rumor_subjects.get(rumor, ()))
+                if self.fast_forward:
+                    self.compact_log.record_rumor(self.turn_counter, rumor, spread=True)
+                else:
+                    self.log_event(f"Rumor spreads: {rumor}", LogKind.RUMOR_SPREAD)
         
         return interaction
     
+    @recorded
     def trigger_random_event(self) -> Optional[Event]:
         """Trigger a random event in the tavern"""
         if not self.current_tavern:
@@ -150,104 +284,304 @@ class TavernSimulator:
         
         if event:
             # Apply event effects
-            char_dict = {char.name: char for char in self.current_tavern.characters}
-            event.apply_effects(self.current_tavern, char_dict)
+            event.apply_effects(self.current_tavern, self.current_tavern.characters.by_name)
             
             # Log the event
             self.event_history.append(event)
-            self.log_event(f"Event: {event.title} - {event.description}")
+            if self.fast_forward:
+                self.compact_log.record_event(self.turn_counter, event)
+            else:
+                self.log_event(f"Event: {event.title} - {event.description}", LogKind.EVENT)
             
             # Add to current events
             self.current_tavern.current_events.append(event.title)
         
         return event
     
+    @recorded
     def generate_rumor(self) -> Optional[str]:
         """Generate a new rumor"""
         if not self.current_tavern:
             return None
         
-        rumor = self.event_generator.generate_rumor(self.current_tavern.characters)
+        composed = self.event_generator.compose_rumor(self.current_tavern.characters)
+        rumor = composed[0] if composed else None
         if rumor:
-            self.rumor_system.add_rumor(rumor)
-            self.log_event(f"New rumor: {rumor}")
+            self.rumor_system.add_rumor(rumor, composed[1])
+            if self.rumor_network is not None:
+                # Someone starts telling it; the rumor spreads from there
+                characters = self.current_tavern.characters
+                source = characters[int(self.dice_system.np_rng.integers(len(characters)))]
+                self.rumor_network.add_rumor(rumor, sources=(source.name,), subjects=composed[1])
+            if self.fast_forward:
+                self.compact_log.record_rumor(self.turn_counter, rumor)
+            else:
+                self.log_event(f"New rumor: {rumor}", LogKind.RUMOR_NEW)
         
         return rumor
     
     def advance_turn(self):
         """Advance the simulation by one turn"""
+        journal = self.journal
+        if journal is None:
+            self._advance_turn()
+            return
+        
+        journal.depth += 1
+        try:
+            self._advance_turn()
+        finally:
+            journal.depth -= 1
+        if not journal.replaying:
+            self._journal_turn()
+    
+    def _advance_turn(self):
         self.turn_counter += 1
         
         if not self.current_tavern:
             return
         
         # Characters sober up slightly
-        for character in self.current_tavern.characters:
-            character.sober_up()
+        self.current_tavern.sober_up_characters()
         
         # Decrease tension naturally over time
         self.current_tavern.decrease_tension(1)
         
         # Random events
-        if self.auto_events_enabled and random.random() < 0.3:
+        if self.auto_events_enabled and self.rng.random() < 0.3:
             self.trigger_random_event()
         
         # Random rumor generation
-        if random.random() < 0.2:
+        if self.rng.random() < 0.2:
             self.generate_rumor()
         
         # Random character interactions
-        if len(self.current_tavern.characters) >= 2 and random.random() < 0.4:
+        if len(self.current_tavern.characters) >= 2 and self.rng.random() < 0.4:
             self.trigger_random_interaction()
         
-        self.log_event(f"Turn {self.turn_counter} completed")
+        if self.rumor_network is not None:
+            self.diffuse_rumors()
+        
+        if self.fast_forward:
+            self.compact_log.record_turn(self.turn_counter)
+        else:
+            self.log_event(f"Turn {self.turn_counter} completed", LogKind.TURN)
+    
+    def advance_turns(self, n: int):
+        """Fast-forward n turns, recording compact events instead of formatted log lines"""
+        previous = self.fast_forward
+        self.fast_forward = True
+        try:
+            for _ in range(n):
+                self.advance_turn()
+        finally:
+            self.fast_forward = previous
+    
+    def _start_journal(self):
+        """Journal from the current state on, forgetting what came before"""
+        if self.snapshot_spacing is None:
+            self.journal = None
+            return
+        self.journal = SimulationJournal(self.snapshot_spacing, max_snapshots=self.snapshot_limit)
+        self.journal.add_snapshot(self._take_snapshot())
+    
+    def _state_externals(self) -> Dict:
+        # Shared by the subsystems, so snapshots refer to them instead of copying them
+        return {'rng': self.rng, 'np_rng': self.dice_system._np_rng}
+    
+    def _take_snapshot(self) -> Snapshot:
+        state = {
+            'tavern': self.current_tavern,
+            'characters': self.available_characters,
+            'rumors': (self.rumor_system.active_rumors, self.rumor_system.rumor_subjects),
+            'rumor_network': self.rumor_network,
+            'patron_generator': self._patron_generator,
+            'turn_counter': self.turn_counter,
+            'auto_events_enabled': self.auto_events_enabled
+        }
+        np_rng = self.dice_system._np_rng
+        return Snapshot(
+            turn=self.turn_counter,
+            payload=pack_state(state, self._state_externals()),
+            rng_state=self.rng.getstate(),
+            np_rng_state=np_rng.bit_generator.state if np_rng is not None else None,
+            interactions=self._history_length(),
+            events=len(self.event_history)
+        )
+    
+    def _restore_snapshot(self, snapshot: Snapshot):
+        self.rng.setstate(snapshot.rng_state)
+        if snapshot.np_rng_state is None:
+            self.dice_system._np_rng = None
+        else:
+            if self.dice_system._np_rng is None:
+                self.dice_system._np_rng = np.random.default_rng()
+            self.dice_system._np_rng.bit_generator.state = snapshot.np_rng_state
+        
+        state = unpack_state(snapshot.payload, self._state_externals())
+        self.current_tavern = state['tavern']
+        self.available_characters = state['characters']
+        self.rumor_system.active_rumors, self.rumor_system.rumor_subjects = state['rumors']
+        self.rumor_network = state['rumor_network']
+        self._patron_generator = state['patron_generator']
+        self.turn_counter = state['turn_counter']
+        self.auto_events_enabled = state['auto_events_enabled']
+        self._social_graph = None
+        self._truncate_history(snapshot.interactions, snapshot.events)
+    
+    def _truncate_history(self, interactions: int, events: int):
+        del self.interaction_history[interactions - self._history_offset:]
+        del self.event_history[events:]
+    
+    def _journal_turn(self):
+        journal = self.journal
+        tavern = self.current_tavern
+        journal.record_turn(
+            self.turn_counter,
+            tavern.tension_level if tavern else 0,
+            tavern.brawl_count if tavern else 0,
+            self._history_length(),
+            len(self.event_history),
+            self.auto_events_enabled,
+            rng_fingerprint(self.rng)
+        )
+        if journal.snapshot_due(self.turn_counter):
+            journal.add_snapshot(self._take_snapshot())
     
+    def _replay(self, turn: int):
+        """Rebuild the state at the end of a journaled turn"""
+        journal = self.journal
+        snapshot = journal.snapshot_before(turn)
+        if len(self.compact_log):
+            self._flush_compact_log()
+        
+        previous = self.fast_forward
+        journal.replaying = True
+        self.fast_forward = True
+        try:
+            self._restore_snapshot(snapshot)
+            for t in range(snapshot.turn, turn):
+                for name, args, kwargs in journal.commands_at(t):
+                    getattr(self, name)(*args, **kwargs)
+                record = journal.turn_record(t + 1)
+                self.auto_events_enabled = bool(record["auto_events"])
+                self.advance_turn()
+                if rng_fingerprint(self.rng) != record["rng_check"]:
+                    raise RuntimeError(f"Replay diverged from the journal at turn {t + 1}")
+            if not previous:
+                # Played live, these interactions would have had their text
+                for interaction in self._interaction_history[snapshot.interactions - self._history_offset:]:
+                    if not interaction.outcome_description:
+                        interaction.outcome_description = self.interaction_system.describe_interaction(interaction)
+        finally:
+            journal.replaying = False
+            self.fast_forward = previous
+            self.compact_log.clear()   # Replayed turns are not logged again
+        journal.truncate(turn)
+        self._save_marks = None   # Saved files hold the dropped future; the next autosave rewrites them
+    
+    def _check_replay_turn(self, turn: int):
+        if self.journal is None:
+            raise ValueError("Replay needs a journal; this simulator was created with snapshot_spacing=None")
+        if not self.journal.first_turn <= turn <= self.turn_counter:
+            raise ValueError(f"Turn {turn} is outside the journaled turns "
+                             f"{self.journal.first_turn}-{self.turn_counter}")
+    
+    def replay_to(self, turn: int):
+        """Go back to the end of a past turn, dropping everything after it
+        
+        The nearest snapshot at or before the turn is restored and the
+        journaled commands and turns are run forward from it, silently. Commands
+        issued after the turn are dropped as well.
+        """
+        self._check_replay_turn(turn)
+        self._replay(turn)
+        self.log_event(f"Replayed to turn {turn}")
+    
+    def fork(self, turn: Optional[int] = None) -> 'TavernSimulator':
+        """A new simulator branching off at the end of a past turn (the current one by default)
+        
+        The fork has its own random sources, in the state they were in at that
+        turn, so it continues exactly as this simulator did (or would), and
+        either can then go its own way.
+        """
+        turn = self.turn_counter if turn is None else turn
+        self._check_replay_turn(turn)
+        fork = TavernSimulator(
+            seed=self.seed, log_capacity=self.log_store.capacity, patron_arrays=self.patron_arrays,
+            zoned=self.zoned, rumor_diffusion=self.rumor_diffusion, snapshot_spacing=self.snapshot_spacing,
+            snapshot_limit=self.snapshot_limit
+        )
+        fork.session_start_time = self.session_start_time
+        fork.interaction_history = list(self.interaction_history)
+        fork.event_history = list(self.event_history)
+        fork.journal = self.journal.branch(turn)
+        fork._replay(turn)
+        fork.log_event(f"Forked from turn {turn}")
+        return fork
+    
+    def _attach_rumor_network(self):
+        if self.rumor_diffusion and self.current_tavern:
+            self.rumor_network = RumorNetwork(self.current_tavern.relationships, self.dice_system.np_rng)
+            self._social_graph = None
+    
+    def social_graph(self) -> SocialGraph:
+        """Gossip graph of the current patrons, rebuilt only after relationships or seating change"""
+        tavern = self.current_tavern
+        key = (tavern.relationships.version, tavern.characters.version,
+               tavern.zones.version if tavern.zones is not None else None)
+        if self._social_graph is None or self._social_graph[0] != key:
+            names = [c.name for c in tavern.characters]
+            companions = tavern.zones.companions() if tavern.zones is not None else ()
+            self._social_graph = (key, self.rumor_network.build_graph(names, companions))
+        return self._social_graph[1]
+    
+    def diffuse_rumors(self) -> Dict[str, int]:
+        """Let every rumor travel one step through the social graph
+        
+        Returns how many patrons newly heard each rumor; the rumor that
+        reached the most new ears is logged.
+        """
+        spread = self.rumor_network.step(self.social_graph())
+        if spread:
+            rumor = max(spread, key=spread.get)
+            if self.fast_forward:
+                self.compact_log.record_rumor(self.turn_counter, rumor, spread=True)
+            else:
+                self.log_event(f"Rumor spreads: {rumor}", LogKind.RUMOR_SPREAD)
+        return spread
+    
+    @recorded
     def trigger_random_interaction(self):
         """Trigger a random interaction between characters"""
         if len(self.current_tavern.characters) < 2:
             return
         
-        # Select two random characters
-        chars = random.sample(self.current_tavern.characters, 2)
-        initiator, target = chars[0], chars[1]
-        
-        # Select random interaction type (weighted towards peaceful interactions)
-        interaction_weights = {
-            InteractionType.CONVERSATION: 30,
-            InteractionType.DRINKING: 20,
-            InteractionType.GAMBLING: 15,
-            InteractionType.STORYTELLING: 10,
-            InteractionType.TRADE: 10,
-            InteractionType.INFORMATION: 8,
-            InteractionType.PERSUASION: 5,
-            InteractionType.INTIMIDATION: 2
-        }
-        
-        total_weight = sum(interaction_weights.values())
-        rand_val = random.randint(1, total_weight)
-        current_weight = 0
+        # Select two random characters (neighbours, when the tavern has zones)
+        if self.current_tavern.zones is not None:
+            pair = self.current_tavern.zones.sample_pair(self.rng)
+            if pair is None:
+                return
+            initiator, target = pair
+        else:
+            initiator, target = self.rng.sample(self.current_tavern.characters, 2)
         
-        selected_interaction = InteractionType.CONVERSATION
-        for interaction_type, weight in interaction_weights.items():
-            current_weight += weight
-            if rand_val <= current_weight:
-                selected_interaction = interaction_type
-                break
+        # Select random interaction type
+        selected_interaction = self.interaction_sampler.sample(self.rng)
         
         self.perform_interaction(initiator.name, target.name, selected_interaction)
     
+    def sample_interaction_types(self, n: int) -> List[InteractionType]:
+        """Draw many random interaction types at once for headless runs"""
+        return self.interaction_sampler.sample_batch(n, self.dice_system.np_rng)
+    
     def get_character_relationships(self) -> Dict[str, Dict[str, int]]:
         """Get all character relationships as a dictionary"""
-        relationships = {}
-        
-        for char in self.current_tavern.characters if self.current_tavern else []:
-            relationships[char.name] = {}
-            for other_char in self.current_tavern.characters:
-                if other_char != char:
-                    rel = char.get_relationship(other_char.name)
-                    relationships[char.name][other_char.name] = int(rel)
+        if not self.current_tavern:
+            return {}
         
-        return relationships
+        names = [char.name for char in self.current_tavern.characters]
+        return self.current_tavern.relationships.to_nested_dict(names)
     
     def get_tavern_status(self) -> Dict:
         """Get current tavern status"""
@@ -266,15 +600,48 @@ class TavernSimulator:
             'characters': [char.name for char in self.current_tavern.characters]
         }
     
-    def log_event(self, message: str):
+    def _flush_compact_log(self):
+        """Render fast-forwarded events into the log store"""
+        for timestamp, turn, kind, actors, message in self.compact_log.iter_entries():
+            self.log_store.append(message, kind, turn, actors, timestamp)
+        self.compact_log.clear()
+    
+    @property
+    def session_log(self) -> List[str]:
+        """Rendered session log lines still held in memory"""
+        if len(self.compact_log):
+            self._flush_compact_log()
+        return self.log_store.lines()
+    
+    @session_log.setter
+    def session_log(self, entries: List[str]):
+        self.clear_session_log()
+        for entry in entries:
+            self.log_store.append_line(entry, day=self.session_start_time)
+    
+    def log_event(self, message: str, kind: LogKind = LogKind.MESSAGE, actors: Tuple[str, ...] = ()):
         """Log an event with timestamp"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        log_entry = f"[{timestamp}] {message}"
-        self.session_log.append(log_entry)
+        if self.journal is not None and self.journal.replaying:
+            return
+        if len(self.compact_log):
+            self._flush_compact_log()
+        self.log_store.append(message, kind, self.turn_counter, actors)
     
     def get_session_log(self) -> List[str]:
         """Get the current session log"""
-        return self.session_log.copy()
+        return self.session_log
+    
+    def read_log(self, cursor: int = 0, limit: Optional[int] = None) -> Tuple[List[LogRecord], int]:
+        """Log records since a reader's cursor, and the cursor for its next read"""
+        if len(self.compact_log):
+            self._flush_compact_log()
+        return self.log_store.read_since(cursor, limit)
+    
+    def clear_session_log(self):
+        """Drop all log entries"""
+        self.compact_log.clear()
+        self.log_store.clear()
+        self._save_marks = None  # Saved files still hold the old entries
     
     def export_session_log(self, filename: str = None) -> str:
         """Export session log to file"""
@@ -288,8 +655,8 @@ class TavernSimulator:
             f.write(f"Total turns: {self.turn_counter}\n")
             f.write("=" * 50 + "\n\n")
             
-            for entry in self.session_log:
-                f.write(entry + "\n")
+            for record in self._iter_log_records():
+                f.write(record.render() + "\n")
             
             f.write("\n" + "=" * 50 + "\n")
             f.write("Character Relationships:\n")
@@ -301,55 +668,139 @@ class TavernSimulator:
         
         return filename
     
-    def save_session(self, filename: str = None) -> str:
-        """Save the current session state"""
-        if filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"tavern_session_{timestamp}.pkl"
-        
-        session_data = {
+    def _iter_log_records(self):
+        if len(self.compact_log):
+            self._flush_compact_log()
+        return self.log_store.iter_range()
+    
+    @property
+    def interaction_history(self) -> List[Interaction]:
+        """All interactions this session, reading saved ones in on first access after a load"""
+        if self._history_loader is not None:
+            loader, self._history_loader = self._history_loader, None
+            self._interaction_history[:0] = loader()
+            self._history_offset = 0
+        return self._interaction_history
+    
+    @interaction_history.setter
+    def interaction_history(self, interactions: List[Interaction]):
+        self._interaction_history = interactions
+        self._history_loader = None
+        self._history_file: Optional[SessionFile] = None
+        self._history_offset = 0
+    
+    def _history_length(self) -> int:
+        return self._history_offset + len(self._interaction_history)
+    
+    def interaction_count(self) -> int:
+        """Number of interactions this session, without reading saved ones in"""
+        return self._history_length()
+    
+    def recent_interactions(self, limit: int) -> List[Interaction]:
+        """The last limit interactions, reading only those from a loaded session file"""
+        live = self._interaction_history[-limit:] if limit > 0 else []
+        missing = limit - len(live)
+        if missing > 0 and self._history_loader is not None:
+            return self._history_file.read_interaction_tail(self._history_offset, missing) + live
+        return live
+    
+    def _session_state(self) -> Dict:
+        return {
             'tavern': self.current_tavern.to_dict() if self.current_tavern else None,
             'characters': {name: char.to_dict() for name, char in self.available_characters.items()},
-            'session_log': self.session_log,
-            'interaction_history': [
-                {
-                    'initiator': i.initiator,
-                    'target': i.target,
-                    'type': i.interaction_type.value,
-                    'success': i.success,
-                    'description': i.outcome_description,
-                    'timestamp': i.timestamp.isoformat()
-                } for i in self.interaction_history
-            ],
             'turn_counter': self.turn_counter,
-            'session_start_time': self.session_start_time.isoformat()
+            'session_start_time': self.session_start_time.isoformat(),
+            'log': {'first_seq': self.log_store.first_seq, 'next_seq': self.log_store.next_seq},
+            'history_count': self._history_length()
         }
+    
+    def _get_session_file(self, filename: str) -> SessionFile:
+        if self._session_file is None or self._session_file.path != filename:
+            self._session_file = SessionFile(filename)
+        return self._session_file
+    
+    def save_session(self, filename: str = None) -> str:
+        """Save the complete session state"""
+        if filename is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            filename = f"tavern_session_{timestamp}{SESSION_EXTENSION}"
         
-        with open(filename, 'wb') as f:
-            pickle.dump(session_data, f)
+        log_records = self._iter_log_records()
+        self._get_session_file(filename).write(self._session_state(), log_records, self.interaction_history)
+        self._save_marks = (filename, self.log_store.next_seq, self._history_length())
+        
+        return filename
+    
+    def autosave(self, filename: str) -> str:
+        """Append what happened since the last save to a session file
+        
+        Falls back to a full save when the file was not the last one saved to
+        or when log entries it still needs have been dropped.
+        """
+        if len(self.compact_log):
+            self._flush_compact_log()
+        
+        marks = self._save_marks
+        if not marks or marks[0] != filename or not os.path.exists(filename) \
+                or self.log_store.first_seq > marks[1] or marks[2] < self._history_offset:
+            return self.save_session(filename)
+        
+        _, log_mark, history_mark = marks
+        self._get_session_file(filename).append(
+            self._session_state(),
+            self.log_store.iter_range(log_mark),
+            self._interaction_history[history_mark - self._history_offset:]
+        )
+        self._save_marks = (filename, self.log_store.next_seq, self._history_length())
         
         return filename
     
     def load_session(self, filename: str) -> bool:
-        """Load a saved session state"""
+        """Load a saved session state
+        
+        The log and interaction history are read from the file only when they
+        are first accessed.
+        """
         try:
-            with open(filename, 'rb') as f:
-                session_data = pickle.load(f)
+            session_file = SessionFile(filename)
+            state = session_file.read_state()
             
             # Restore tavern
-            if session_data['tavern']:
-                self.current_tavern = Tavern.from_dict(session_data['tavern'])
+            if state['tavern']:
+                self.current_tavern = Tavern.from_dict(state['tavern'])
+                self.current_tavern.rng = self.rng
+                if self.patron_arrays:
+                    self.current_tavern.use_patron_state(self.dice_system.np_rng)
+                if self.zoned:
+                    self.current_tavern.use_zones()
+                self._attach_rumor_network()
             
             # Restore characters
             self.available_characters = {
                 name: Character.from_dict(char_data) 
-                for name, char_data in session_data['characters'].items()
+                for name, char_data in state['characters'].items()
             }
             
             # Restore session data
-            self.session_log = session_data['session_log']
-            self.turn_counter = session_data['turn_counter']
-            self.session_start_time = datetime.fromisoformat(session_data['session_start_time'])
+            self.turn_counter = state['turn_counter']
+            self.session_start_time = datetime.fromisoformat(state['session_start_time'])
+            
+            log_state = state['log']
+            self.compact_log.clear()
+            self.log_store.attach_archive(
+                log_state['first_seq'], log_state['next_seq'],
+                session_file.log_segments(log_state['first_seq'], log_state['next_seq'])
+            )
+            
+            history_count = state['history_count']
+            self._interaction_history = []
+            self._history_offset = history_count
+            self._history_loader = lambda: session_file.read_interactions(history_count)
+            self._history_file = session_file
+            
+            self._session_file = session_file
+            self._save_marks = (filename, log_state['next_seq'], history_count)
+            self._start_journal()
             
             return True
         except Exception as e:
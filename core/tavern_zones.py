@@ -0,0 +1,148 @@
+"""
+Tavern zones for the Warhammer Fantasy Tavern Simulator
+Patrons are spread over areas of the tavern, and most of what they do stays within their area and the next one over
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# zone: (share of the tavern's patrons, neighbouring zones)
+DEFAULT_ZONE_LAYOUT: Dict[str, Tuple[float, Tuple[str, ...]]] = {
+    "bar": (0.25, ("main_hall",)),
+    "main_hall": (0.35, ("bar", "fireplace", "corner_table")),
+    "fireplace": (0.2, ("main_hall", "corner_table")),
+    "corner_table": (0.2, ("main_hall", "fireplace"))
+}
+
+class ZoneMap:
+    """Which zone each patron is in, with zones laid out as a graph
+
+    Every zone keeps its members in a list plus a name -> position index, so
+    membership changes and uniform draws within a zone are O(1). Drawing a
+    pair only looks at zone sizes, never at the whole tavern.
+    """
+
+    def __init__(self, layout: Dict[str, Tuple[float, Sequence[str]]] = None):
+        layout = layout or DEFAULT_ZONE_LAYOUT
+        self.names: List[str] = list(layout)
+        self.index: Dict[str, int] = {name: i for i, name in enumerate(self.names)}
+        self.shares: List[float] = [float(share) for share, _ in layout.values()]
+        self.adjacency: List[List[int]] = [[self.index[other] for other in neighbours]
+                                           for _, neighbours in layout.values()]
+        self.members: List[List] = [[] for _ in self.names]
+        self._position: Dict[str, Tuple[int, int]] = {}
+        self.version = 0   # Bumped on every membership change
+
+    def __len__(self) -> int:
+        return len(self._position)
+
+    def __contains__(self, character) -> bool:
+        return character.name in self._position
+
+    def occupancy(self) -> Dict[str, int]:
+        return {name: len(members) for name, members in zip(self.names, self.members)}
+
+    def zone_of(self, character) -> Optional[str]:
+        position = self._position.get(character.name)
+        return self.names[position[0]] if position else None
+
+    def place(self, character, zone: str = None) -> str:
+        """Put a character in a zone, by default the one furthest below its share"""
+        if character.name in self._position:
+            self.remove(character)
+        if zone is None:
+            z = min(range(len(self.names)), key=lambda i: (len(self.members[i]) + 1) / self.shares[i])
+        else:
+            z = self.index[zone]
+        self._position[character.name] = (z, len(self.members[z]))
+        self.members[z].append(character)
+        self.version += 1
+        return self.names[z]
+
+    def remove(self, character) -> bool:
+        position = self._position.pop(character.name, None)
+        if position is None:
+            return False
+        z, i = position
+        members = self.members[z]
+        last = members.pop()
+        if i < len(members):
+            members[i] = last
+            self._position[last.name] = (z, i)
+        self.version += 1
+        return True
+
+    def move(self, character, zone: str) -> str:
+        return self.place(character, zone)
+
+    def companions(self) -> List[Tuple[str, str]]:
+        """Pairs of names sharing a table: each member and the next in their zone"""
+        return [(a.name, b.name) for members in self.members for a, b in zip(members, members[1:])]
+
+    def local_group(self, zone: str) -> List:
+        """Members of a zone followed by those of its neighbours"""
+        z = self.index[zone]
+        group = list(self.members[z])
+        for neighbour in self.adjacency[z]:
+            group.extend(self.members[neighbour])
+        return group
+
+    def pick_zone(self, rng) -> Optional[str]:
+        """Zone of a uniformly drawn patron (so busier zones come up more often)"""
+        if not self._position:
+            return None
+        draw = rng.randrange(len(self._position))
+        for z, members in enumerate(self.members):
+            if draw < len(members):
+                return self.names[z]
+            draw -= len(members)
+        return None
+
+    def sample_pair(self, rng, local_chance: float = 0.8) -> Optional[Tuple]:
+        """Two distinct patrons, the second from the same zone or a neighbouring one
+
+        The first patron is uniform over the tavern. The second comes from
+        the same zone with local_chance (when it has anyone else in it) and
+        otherwise from a random occupied neighbouring zone, falling back to
+        the own zone.
+        """
+        zone = self.pick_zone(rng)
+        if zone is None:
+            return None
+        z = self.index[zone]
+        members = self.members[z]
+        i = rng.randrange(len(members))
+        first = members[i]
+
+        occupied_neighbours = [n for n in self.adjacency[z] if self.members[n]]
+        if len(members) > 1 and (not occupied_neighbours or rng.random() < local_chance):
+            j = rng.randrange(len(members) - 1)
+            return first, members[j + 1 if j >= i else j]
+        if occupied_neighbours:
+            neighbour = self.members[rng.choice(occupied_neighbours)]
+            return first, neighbour[rng.randrange(len(neighbour))]
+        return None
+
+    def zone_batches(self) -> List[List[str]]:
+        """Groups of zones whose neighbourhoods do not overlap
+
+        Zones in one group are neither adjacent nor share a neighbour, so
+        the local groups they draw partners from (zone plus neighbours) are
+        disjoint and their interactions can be worked through independently
+        (in parallel, for very large taverns).
+        """
+        # Colour the graph where zones conflict when within two steps of each other
+        conflicts = []
+        for z, neighbours in enumerate(self.adjacency):
+            near = set(neighbours)
+            for n in neighbours:
+                near.update(self.adjacency[n])
+            near.discard(z)
+            conflicts.append(near)
+        colour = [-1] * len(self.names)
+        for z in sorted(range(len(self.names)), key=lambda z: -len(conflicts[z])):
+            taken = {colour[n] for n in conflicts[z]}
+            colour[z] = next(c for c in range(len(self.names)) if c not in taken)
+        batches: List[List[str]] = [[] for _ in range(max(colour, default=-1) + 1)]
+        for z, c in enumerate(colour):
+            batches[c].append(self.names[z])
+        return batches
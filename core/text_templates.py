@@ -0,0 +1,85 @@
+"""
+Text templates for the Warhammer Fantasy Tavern Simulator
+Outcome, rumor, event and atmosphere texts are read from data/text_templates.json and parsed once, into a registry
+shared by every simulator
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from string import Formatter
+from typing import Any, Dict, List, Tuple
+
+from .enums import AtmosphereType, EventType, InteractionType
+
+DEFAULT_TEMPLATES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "text_templates.json")
+
+@dataclass(frozen=True)
+class TextTemplate:
+    """One parsed template; id is unique within its registry"""
+    id: int
+    text: str
+    fields: Tuple[str, ...]   # Placeholder names, in order of first use
+
+    def render(self, **args) -> str:
+        return self.text.format_map(args) if self.fields else self.text
+
+def parse_fields(text: str) -> Tuple[str, ...]:
+    return tuple(dict.fromkeys(name for _, name, _, _ in Formatter().parse(text) if name))
+
+class TemplateRegistry:
+    """Every text template of the simulator, parsed and indexed once
+
+    Lists keep their file order, because sessions record which entry of a
+    list was used (an interaction's outcome_variant) and render it later.
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        self.templates: List[TextTemplate] = []
+
+        outcomes = data["outcomes"]
+        self.outcomes: Dict[bool, Dict[InteractionType, Tuple[TextTemplate, ...]]] = {
+            success: {InteractionType(name): self._add_all(texts) for name, texts in outcomes[key].items()}
+            for success, key in ((True, "success"), (False, "failure"))
+        }
+        self.default_outcomes = self._add_all(outcomes["default"])
+        self.critical_success_suffix: str = outcomes["critical_success"]
+        self.critical_failure_suffix: str = outcomes["critical_failure"]
+
+        self.rumors = self._add_all(data["rumors"])
+
+        # Event templates are plain dicts, as EventGenerator always used them;
+        # callers must copy anything they mean to change
+        self.events: Dict[EventType, Tuple[Dict[str, Any], ...]] = {
+            EventType(name): tuple(entries) for name, entries in data["events"].items()
+        }
+
+        atmospheres = dict(data["atmospheres"])
+        self.default_atmospheres: Tuple[str, ...] = tuple(atmospheres.pop("default"))
+        self.atmospheres: Dict[AtmosphereType, Tuple[str, ...]] = {
+            AtmosphereType(name): tuple(texts) for name, texts in atmospheres.items()
+        }
+
+    def _add_all(self, texts: List[str]) -> Tuple[TextTemplate, ...]:
+        added = []
+        for text in texts:
+            template = TextTemplate(len(self.templates), text, parse_fields(text))
+            self.templates.append(template)
+            added.append(template)
+        return tuple(added)
+
+    def outcome_templates(self, interaction_type: InteractionType, success: bool) -> Tuple[TextTemplate, ...]:
+        return self.outcomes[success].get(interaction_type, self.default_outcomes)
+
+    def render(self, template_id: int, **args) -> str:
+        """Render a template from its id, for text stored as id and arguments"""
+        return self.templates[template_id].render(**args)
+
+@lru_cache(maxsize=None)
+def load_template_registry(path: str = DEFAULT_TEMPLATES_PATH) -> TemplateRegistry:
+    """Registry for a templates file, built once per path"""
+    with open(path, 'r', encoding='utf-8') as f:
+        return TemplateRegistry(json.load(f))
+
+TEMPLATES = load_template_registry()
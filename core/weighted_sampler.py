@@ -0,0 +1,63 @@
+"""
+Weighted random selection for the Warhammer Fantasy Tavern Simulator
+"""
+
+from bisect import bisect_left
+from functools import lru_cache
+from itertools import accumulate
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+class WeightedSampler:
+    """Picks items by integer weight from a precomputed cumulative array
+
+    sample() consumes exactly one rng.randint(1, total) per draw and maps it to
+    the same item as walking the weights in order, so seeded runs do not change
+    when a linear scan is swapped for a sampler.
+    """
+
+    def __init__(self, weights: Dict[Any, int]):
+        self.items = list(weights.keys())
+        self.cumulative = list(accumulate(int(w) for w in weights.values()))
+        self.total = self.cumulative[-1] if self.cumulative else 0
+        self._cumulative_array = np.array(self.cumulative, dtype=np.int64)
+
+    def sample(self, rng) -> Optional[Any]:
+        """One weighted draw, or None when every weight is zero"""
+        if self.total <= 0:
+            return None
+        return self.items[bisect_left(self.cumulative, rng.randint(1, self.total))]
+
+    def sample_indices(self, n: int, np_rng: np.random.Generator) -> np.ndarray:
+        """Indices into items for n independent draws"""
+        if self.total <= 0:
+            raise ValueError("cannot sample when every weight is zero")
+        draws = np_rng.integers(1, self.total + 1, size=n)
+        return np.searchsorted(self._cumulative_array, draws, side="left")
+
+    def sample_batch(self, n: int, np_rng: np.random.Generator) -> List[Any]:
+        """n independent draws, for headless runs that need many at once"""
+        return [self.items[i] for i in self.sample_indices(n, np_rng).tolist()]
+
+class TensionSamplerCache:
+    """WeightedSamplers for tension-dependent weights, built once per tension bucket
+
+    weight_fn(tension) returns the weight dict; it is evaluated at the lowest
+    tension of each bucket. The default bucket size of 1 keeps draws identical
+    to evaluating the weights on every call.
+    """
+
+    def __init__(self, weight_fn: Callable[[int], Dict[Any, int]], bucket_size: int = 1, max_buckets: int = 256):
+        self.weight_fn = weight_fn
+        self.bucket_size = bucket_size
+        self._build = lru_cache(maxsize=max_buckets)(self._build_bucket)
+
+    def _build_bucket(self, bucket: int) -> WeightedSampler:
+        return WeightedSampler(self.weight_fn(bucket * self.bucket_size))
+
+    def get(self, tension: int) -> WeightedSampler:
+        return self._build(tension // self.bucket_size)
+
+    def sample(self, tension: int, rng) -> Optional[Any]:
+        return self.get(tension).sample(rng)
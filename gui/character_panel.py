@@ -2,19 +2,23 @@
 Character information panel for the Warhammer Fantasy Tavern Simulator
 """
 
+import threading
 import tkinter as tk
 from tkinter import ttk
-from typing import Optional
+from typing import Optional, Tuple
 from ..core.tavern_simulator import TavernSimulator
 from ..core.character import Character
+from ..core.auto_runner import PatronSnapshot, SimulationSnapshot, take_snapshot
 
 class CharacterPanel:
     """Panel displaying character information and details"""
     
-    def __init__(self, parent: tk.Widget, simulator: TavernSimulator):
+    def __init__(self, parent: tk.Widget, simulator: TavernSimulator, lock: threading.RLock = None):
         self.parent = parent
         self.simulator = simulator
+        self.lock = lock or threading.RLock()  # Held while touching the simulator
         self.selected_character: Optional[Character] = None
+        self.patrons: Tuple[PatronSnapshot, ...] = ()   # As last shown
         
         self.create_widgets()
     
@@ -163,11 +167,11 @@ class CharacterPanel:
     def on_character_select(self, event):
         """Handle character selection from listbox"""
         selection = self.char_listbox.curselection()
-        if selection and self.simulator.current_tavern:
+        if selection:
             index = selection[0]
-            if index < len(self.simulator.current_tavern.characters):
-                self.selected_character = self.simulator.current_tavern.characters[index]
-                self.update_character_details()
+            if index < len(self.patrons):
+                self.selected_character = self.patrons[index].character
+                self.update_character_details(self.patrons[index])
     
     def clear_character_details(self):
         """Clear all character detail fields"""
@@ -184,7 +188,7 @@ class CharacterPanel:
         self.drunk_var.set("")
         self.skills_text.delete(1.0, tk.END)
     
-    def update_character_details(self):
+    def update_character_details(self, patron: PatronSnapshot):
         """Update character details display"""
         if not self.selected_character:
             self.clear_character_details()
@@ -203,12 +207,12 @@ class CharacterPanel:
         self.backstory_var.set(char.backstory)
         self.personality_var.set(", ".join(char.personality_traits))
         
-        # Status
-        self.mood_var.set(char.current_mood.title())
-        self.health_var.set(f"{char.health}/100")
-        self.wealth_var.set(f"{char.wealth} coins")
+        # Status, as of the snapshot
+        self.mood_var.set(patron.mood.title())
+        self.health_var.set(f"{patron.health}/100")
+        self.wealth_var.set(f"{patron.wealth} coins")
         
-        drunk_status = "Drunk" if char.is_drunk() else f"{char.drunk_level}/10"
+        drunk_status = "Drunk" if patron.drunk else f"{patron.drunk_level}/10"
         self.drunk_var.set(drunk_status)
         
         # Top skills
@@ -222,7 +226,8 @@ class CharacterPanel:
     def remove_character(self):
         """Remove selected character from tavern"""
         if self.selected_character:
-            success = self.simulator.remove_character_from_tavern(self.selected_character.name)
+            with self.lock:
+                success = self.simulator.remove_character_from_tavern(self.selected_character.name)
             if success:
                 self.selected_character = None
                 self.update_display()
@@ -233,10 +238,11 @@ class CharacterPanel:
             # This would open a relationships window
             # For now, just show a simple message
             relationships = []
-            for other_char in self.simulator.current_tavern.characters:
-                if other_char != self.selected_character:
-                    rel = self.selected_character.get_relationship(other_char.name)
-                    relationships.append(f"{other_char.name}: {rel.name}")
+            with self.lock:
+                for other_char in self.simulator.current_tavern.characters:
+                    if other_char is not self.selected_character:
+                        rel = self.selected_character.get_relationship(other_char.name)
+                        relationships.append(f"{other_char.name}: {rel.name}")
             
             if relationships:
                 rel_text = "\n".join(relationships)
@@ -246,28 +252,39 @@ class CharacterPanel:
     
     def update_display(self):
         """Update the character list and details"""
+        with self.lock:
+            snapshot = take_snapshot(self.simulator)
+        self.show_snapshot(snapshot)
+    
+    def show_snapshot(self, snapshot: SimulationSnapshot):
+        """Show the patrons as they were in a snapshot"""
+        self.patrons = snapshot.patrons
+        
         # Clear listbox
         self.char_listbox.delete(0, tk.END)
         
-        if not self.simulator.current_tavern:
+        if not snapshot.tavern:
             self.clear_character_details()
             return
         
         # Populate character list
-        for char in self.simulator.current_tavern.characters:
-            display_text = f"{char.name} ({char.faction.value})"
-            if char.is_drunk():
+        selected = None
+        for patron in snapshot.patrons:
+            display_text = f"{patron.name} ({patron.faction})"
+            if patron.drunk:
                 display_text += " [DRUNK]"
-            if char.health < 50:
+            if patron.health < 50:
                 display_text += " [INJURED]"
             
             self.char_listbox.insert(tk.END, display_text)
+            if patron.character is self.selected_character:
+                selected = patron
         
         # Update character details if one is selected
         if self.selected_character:
             # Check if selected character is still in tavern
-            if self.selected_character in self.simulator.current_tavern.characters:
-                self.update_character_details()
+            if selected is not None:
+                self.update_character_details(selected)
             else:
                 self.selected_character = None
                 self.clear_character_details()
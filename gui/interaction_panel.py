@@ -2,19 +2,25 @@
 Interaction panel for the Warhammer Fantasy Tavern Simulator
 """
 
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Callable, Optional
+from typing import Callable, Optional, Tuple
 from ..core.tavern_simulator import TavernSimulator
 from ..core.enums import InteractionType
+from ..core.event import Interaction
+from ..core.auto_runner import SimulationSnapshot, take_snapshot
 
 class InteractionPanel:
     """Panel for managing character interactions"""
     
-    def __init__(self, parent: tk.Widget, simulator: TavernSimulator, update_callback: Callable):
+    def __init__(self, parent: tk.Widget, simulator: TavernSimulator, update_callback: Callable,
+                 lock: threading.RLock = None):
         self.parent = parent
         self.simulator = simulator
         self.update_callback = update_callback
+        self.lock = lock or threading.RLock()  # Held while touching the simulator
+        self.recent_interactions: Tuple[Interaction, ...] = ()   # As last shown
         
         self.create_widgets()
     
@@ -148,7 +154,8 @@ class InteractionPanel:
             return
         
         # Perform the interaction
-        interaction = self.simulator.perform_interaction(initiator, target, interaction_type)
+        with self.lock:
+            interaction = self.simulator.perform_interaction(initiator, target, interaction_type)
         
         if interaction:
             self.update_display()
@@ -168,11 +175,11 @@ class InteractionPanel:
             return
         
         import random
-        chars = random.sample(self.simulator.current_tavern.characters, 2)
-        
-        interaction = self.simulator.perform_interaction(
-            chars[0].name, chars[1].name, InteractionType.CONVERSATION
-        )
+        with self.lock:
+            chars = random.sample(self.simulator.current_tavern.characters, 2)
+            interaction = self.simulator.perform_interaction(
+                chars[0].name, chars[1].name, InteractionType.CONVERSATION
+            )
         
         if interaction:
             self.update_display()
@@ -185,9 +192,9 @@ class InteractionPanel:
             return
         
         # Make multiple characters drink
-        for char in self.simulator.current_tavern.characters:
-            if self.simulator.current_tavern.serve_drink(char):
-                self.simulator.log_event(f"{char.name} drinks ale")
+        with self.lock:
+            for name in [char.name for char in self.simulator.current_tavern.characters]:
+                self.simulator.serve_drink(name)
         
         self.update_callback()
         self.details_text.delete(1.0, tk.END)
@@ -201,11 +208,11 @@ class InteractionPanel:
             return
         
         import random
-        chars = random.sample(self.simulator.current_tavern.characters, 2)
-        
-        interaction = self.simulator.perform_interaction(
-            chars[0].name, chars[1].name, InteractionType.GAMBLING
-        )
+        with self.lock:
+            chars = random.sample(self.simulator.current_tavern.characters, 2)
+            interaction = self.simulator.perform_interaction(
+                chars[0].name, chars[1].name, InteractionType.GAMBLING
+            )
         
         if interaction:
             self.update_display()
@@ -221,7 +228,7 @@ class InteractionPanel:
         result_text += f"Target: {interaction.target}\n"
         result_text += f"Dice Roll: {interaction.dice_roll} + {interaction.modifier} = {interaction.dice_roll + interaction.modifier}\n"
         result_text += f"Result: {'SUCCESS' if interaction.success else 'FAILURE'}\n"
-        result_text += f"Outcome: {interaction.outcome_description}\n"
+        result_text += f"Outcome: {self.simulator.interaction_system.describe_interaction(interaction)}\n"
         
         if interaction.relationship_change != 0:
             change_text = "improved" if interaction.relationship_change > 0 else "worsened"
@@ -245,7 +252,7 @@ class InteractionPanel:
             target = values[2]
             
             # Find matching interaction (simplified)
-            for interaction in reversed(self.simulator.interaction_history):
+            for interaction in reversed(self.recent_interactions):
                 if (interaction.initiator == initiator and 
                     interaction.target == target):
                     self.show_interaction_result(interaction)
@@ -253,7 +260,14 @@ class InteractionPanel:
     
     def update_display(self):
         """Update the interaction panel display"""
-        if not self.simulator.current_tavern:
+        with self.lock:
+            snapshot = take_snapshot(self.simulator)
+        self.show_snapshot(snapshot)
+    
+    def show_snapshot(self, snapshot: SimulationSnapshot):
+        """Show the patrons and latest interactions of a snapshot"""
+        self.recent_interactions = snapshot.recent_interactions
+        if not snapshot.tavern:
             # Clear everything if no tavern
             self.initiator_combo['values'] = []
             self.target_combo['values'] = []
@@ -262,7 +276,7 @@ class InteractionPanel:
             return
         
         # Update character lists
-        char_names = [char.name for char in self.simulator.current_tavern.characters]
+        char_names = [patron.name for patron in snapshot.patrons]
         self.initiator_combo['values'] = char_names
         self.target_combo['values'] = char_names
         
@@ -278,8 +292,7 @@ class InteractionPanel:
         self.interactions_tree.delete(*self.interactions_tree.get_children())
         
         # Show last 20 interactions
-        recent_interactions = self.simulator.interaction_history[-20:]
-        for interaction in reversed(recent_interactions):
+        for interaction in reversed(snapshot.recent_interactions):
             time_str = interaction.timestamp.strftime("%H:%M:%S")
             result = "SUCCESS" if interaction.success else "FAILURE"
             
@@ -2,16 +2,52 @@
 Log panel for the Warhammer Fantasy Tavern Simulator
 """
 
+import threading
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+from typing import List, Sequence
 from ..core.tavern_simulator import TavernSimulator
+from ..core.compact_log import LogKind
+from ..core.session_log import LogRecord
+from ..core.auto_runner import AutoRunner, SimulationSnapshot
+
+WINDOW_LINES = 2000   # Most entries held in the text widget at once
+PAGE_LINES = 500      # Entries brought in when scrolling past either end of the window
+
+# Display tag of each kind of record; free-form messages are classified by their text
+KIND_TAGS = {
+    LogKind.TURN: "turn",
+    LogKind.INTERACTION: "interaction",
+    LogKind.REFUSAL: "",
+    LogKind.EVENT: "event",
+    LogKind.RUMOR_NEW: "rumor",
+    LogKind.RUMOR_SPREAD: "rumor"
+}
 
 class LogPanel:
     """Panel for displaying and managing session logs"""
     
-    def __init__(self, parent: tk.Widget, simulator: TavernSimulator):
+    def __init__(self, parent: tk.Widget, simulator: TavernSimulator, lock: threading.RLock = None,
+                 runner: AutoRunner = None):
         self.parent = parent
         self.simulator = simulator
+        self.lock = lock or threading.RLock()  # Held while touching the simulator
+        # While it is running, the runner reads the log and hands records over in snapshots
+        self.runner = runner
+        
+        # Position in the simulator's log up to which entries have been read
+        self.log_cursor = 0
+        self.shown_filter = ""
+        self.event_count = 0
+        
+        # Every entry read so far, with its tag, and the positions of those
+        # passing the filter. The text widget only holds shown[window_start:window_end].
+        self.lines: List[str] = []
+        self.tags: List[str] = []
+        self.shown: List[int] = []
+        self.window_start = 0
+        self.window_end = 0
+        self.paging = False
         
         self.create_widgets()
     
@@ -65,7 +101,8 @@ class LogPanel:
         self.log_text = tk.Text(log_frame, wrap=tk.WORD, font=("Consolas", 9))
         log_scrollbar = ttk.Scrollbar(log_frame, orient=tk.VERTICAL, 
                                      command=self.log_text.yview)
-        self.log_text.configure(yscrollcommand=log_scrollbar.set)
+        self.log_scrollbar = log_scrollbar
+        self.log_text.configure(yscrollcommand=self.on_text_scroll)
         
         self.log_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         log_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
@@ -101,8 +138,9 @@ class LogPanel:
         result = messagebox.askyesno("Clear Log", 
                                    "Are you sure you want to clear the session log? This cannot be undone.")
         if result:
-            self.simulator.session_log.clear()
-            self.update_display()
+            with self.lock:
+                self.simulator.clear_session_log()
+            self.rebuild_display()
     
     def export_log(self):
         """Export the session log to a file"""
@@ -113,7 +151,8 @@ class LogPanel:
                 title="Export Session Log"
             )
             if filename:
-                exported_file = self.simulator.export_session_log(filename)
+                with self.lock:
+                    exported_file = self.simulator.export_session_log(filename)
                 messagebox.showinfo("Export Complete", f"Log exported to {exported_file}")
         except Exception as e:
             messagebox.showerror("Export Error", f"Failed to export log: {str(e)}")
@@ -121,11 +160,12 @@ class LogPanel:
     def clear_filter(self):
         """Clear the log filter"""
         self.filter_var.set("")
-        self.update_display()
+        self.apply_filter()
     
     def on_filter_change(self, event):
         """Handle filter text change"""
-        self.update_display()
+        if self.filter_var.get().lower() != self.shown_filter:
+            self.apply_filter()
     
     def get_log_tag(self, log_entry: str) -> str:
         """Determine the appropriate tag for a log entry"""
@@ -146,37 +186,179 @@ class LogPanel:
         else:
             return ""
     
-    def update_display(self):
-        """Update the log display"""
-        # Clear current display
-        self.log_text.delete(1.0, tk.END)
+    def _matches(self, index: int, filter_text: str) -> bool:
+        return not filter_text or filter_text in self.lines[index].lower()
+    
+    def apply_filter(self):
+        """Show the entries matching the filter text
         
-        # Get filter text
+        A filter that only adds to the previous one searches just the entries
+        that matched before.
+        """
         filter_text = self.filter_var.get().lower()
+        if not filter_text:
+            self.shown = list(range(len(self.lines)))
+        else:
+            candidates = self.shown if self.shown_filter in filter_text else range(len(self.lines))
+            self.shown = [i for i in candidates if filter_text in self.lines[i].lower()]
+        self.shown_filter = filter_text
+        self.show_tail()
+    
+    def rebuild_display(self):
+        """Read the whole log again, e.g. after it was cleared or loaded"""
+        self.log_cursor = 0
+        self.event_count = 0
+        self.lines, self.tags, self.shown = [], [], []
+        self.shown_filter = self.filter_var.get().lower()
+        self.show_tail()
+        if self.runner is not None and self.runner.running:
+            self.runner.reset_log(self.log_cursor)
+        self.update_display()
+    
+    def _insert_entries(self, index: str, positions: List[int]):
+        """Insert entries into the text widget in one call"""
+        if not positions:
+            return
+        args = []
+        for i in positions:
+            args.extend((self.lines[i] + "\n", self.tags[i]))
+        self.log_text.insert(index, *args)
+    
+    def _trim_head(self):
+        excess = (self.window_end - self.window_start) - WINDOW_LINES
+        if excess > 0:
+            self.log_text.delete("1.0", f"{excess + 1}.0")
+            self.window_start += excess
+    
+    def _trim_tail(self):
+        excess = (self.window_end - self.window_start) - WINDOW_LINES
+        if excess > 0:
+            self.log_text.delete(f"{WINDOW_LINES + 1}.0", tk.END)
+            self.window_end -= excess
+    
+    def show_tail(self):
+        """Fill the text widget with the newest shown entries"""
+        self.log_text.delete(1.0, tk.END)
+        self.window_end = len(self.shown)
+        self.window_start = max(0, self.window_end - WINDOW_LINES)
+        self._insert_entries(tk.END, self.shown[self.window_start:self.window_end])
+        self.log_text.see(tk.END)
+    
+    def on_text_scroll(self, first: str, last: str):
+        """Scrollbar update; pages in more entries when either end of the window is reached"""
+        self.log_scrollbar.set(first, last)
+        if self.paging:
+            return
+        if float(first) <= 0.0 and self.window_start > 0:
+            self.paging = True
+            self.log_text.after_idle(self.page_earlier)
+        elif float(last) >= 1.0 and self.window_end < len(self.shown):
+            self.paging = True
+            self.log_text.after_idle(self.page_later)
+    
+    def page_earlier(self):
+        self.paging = False
+        count = min(PAGE_LINES, self.window_start)
+        if count <= 0:
+            return
+        self.window_start -= count
+        self._insert_entries("1.0", self.shown[self.window_start:self.window_start + count])
+        self._trim_tail()
+        self.log_text.yview(f"{count + 1}.0")
+    
+    def page_later(self):
+        self.paging = False
+        count = min(PAGE_LINES, len(self.shown) - self.window_end)
+        if count <= 0:
+            return
+        first_visible = int(self.log_text.index("@0,0").split(".")[0])
+        self._insert_entries(tk.END, self.shown[self.window_end:self.window_end + count])
+        self.window_end += count
+        before = self.window_start
+        self._trim_head()
+        self.log_text.yview(f"{max(1, first_visible - (self.window_start - before))}.0")
+    
+    def update_display(self):
+        """Append log entries recorded since the last update
         
-        # Display filtered log entries
-        for entry in self.simulator.session_log:
-            if not filter_text or filter_text in entry.lower():
-                tag = self.get_log_tag(entry)
-                self.log_text.insert(tk.END, entry + "\n", tag)
+        Entries are classified once, when read, and only those passing the
+        filter reach the text widget, which keeps at most WINDOW_LINES of them.
+        """
+        filter_text = self.filter_var.get().lower()
+        if filter_text != self.shown_filter:
+            self.apply_filter()
+        if self.runner is not None and self.runner.running:
+            return  # The next snapshot brings the new entries
         
-        # Auto-scroll to bottom if enabled
-        if self.auto_scroll_var.get():
-            self.log_text.see(tk.END)
+        with self.lock:
+            records, cursor = self.simulator.read_log(self.log_cursor)
+        self.add_records(records, cursor)
         
         # Update statistics
         self.update_statistics()
     
-    def update_statistics(self):
-        """Update session statistics"""
+    def show_snapshot(self, snapshot: SimulationSnapshot):
+        """Append the log records carried by a snapshot and show its statistics"""
+        if snapshot.log_cursor is not None:
+            self.add_records(snapshot.log_records, snapshot.log_cursor)
+        self.update_statistics(snapshot)
+    
+    def add_records(self, records: Sequence[LogRecord], cursor: int):
+        """Store, classify and (when they pass the filter) show records read up to cursor"""
+        filter_text = self.shown_filter
+        at_tail = self.window_end == len(self.shown)
+        self.log_cursor = cursor
+        new_shown = []
+        for record in records:
+            if record.kind == LogKind.EVENT:
+                self.event_count += 1
+            entry = record.render()
+            tag = KIND_TAGS.get(record.kind)
+            self.lines.append(entry)
+            self.tags.append(tag if tag is not None else self.get_log_tag(entry))
+            if self._matches(len(self.lines) - 1, filter_text):
+                new_shown.append(len(self.lines) - 1)
+        self._show_new(new_shown, at_tail)
+    
+    def _show_new(self, positions: List[int], at_tail: bool):
+        self.shown.extend(positions)
+        if not at_tail:
+            if self.auto_scroll_var.get():
+                self.show_tail()
+            return  # Otherwise paged in when the reader scrolls down to them
+        
+        if self.auto_scroll_var.get():
+            if len(positions) >= WINDOW_LINES:
+                self.show_tail()
+                return
+            self._insert_entries(tk.END, positions)
+            self.window_end = len(self.shown)
+            self._trim_head()
+            # Auto-scroll to bottom
+            self.log_text.see(tk.END)
+        else:
+            # Leave the reader's view alone: fill the window, page in the rest later
+            room = max(0, WINDOW_LINES - (self.window_end - self.window_start))
+            self._insert_entries(tk.END, positions[:room])
+            self.window_end += min(room, len(positions))
+    
+    def update_statistics(self, snapshot: SimulationSnapshot = None):
+        """Update session statistics (from a snapshot, when given)"""
         # Count different types of events
-        event_count = sum(1 for entry in self.simulator.session_log if "event:" in entry.lower())
-        interaction_count = len(self.simulator.interaction_history)
-        turn_count = self.simulator.turn_counter
+        event_count = self.event_count
+        if snapshot is not None:
+            interaction_count = snapshot.interaction_count
+            turn_count = snapshot.turn
+            session_start_time = snapshot.session_start_time
+        else:
+            with self.lock:
+                interaction_count = self.simulator.interaction_count()
+                turn_count = self.simulator.turn_counter
+                session_start_time = self.simulator.session_start_time
         
         # Calculate session time
         from datetime import datetime
-        session_duration = datetime.now() - self.simulator.session_start_time
+        session_duration = datetime.now() - session_start_time
         hours, remainder = divmod(int(session_duration.total_seconds()), 3600)
         minutes, _ = divmod(remainder, 60)
         
@@ -188,17 +370,11 @@ class LogPanel:
     
     def add_log_entry(self, entry: str, tag: str = ""):
         """Add a new log entry (for real-time updates)"""
-        filter_text = self.filter_var.get().lower()
-        
-        if not filter_text or filter_text in entry.lower():
-            if not tag:
-                tag = self.get_log_tag(entry)
-            
-            self.log_text.insert(tk.END, entry + "\n", tag)
-            
-            # Auto-scroll if enabled
-            if self.auto_scroll_var.get():
-                self.log_text.see(tk.END)
+        at_tail = self.window_end == len(self.shown)
+        self.lines.append(entry)
+        self.tags.append(tag or self.get_log_tag(entry))
+        position = len(self.lines) - 1
+        self._show_new([position] if self._matches(position, self.shown_filter) else [], at_tail)
         
         # Update statistics
         self.update_statistics()
@@ -8,12 +8,16 @@ import threading
 from typing import Optional
 from ..core.tavern_simulator import TavernSimulator
 from ..core.enums import InteractionType
+from ..core.auto_runner import AutoRunner, take_snapshot
 from .character_panel import CharacterPanel
 from .tavern_panel import TavernPanel
 from .relationship_graph import RelationshipGraph
 from .interaction_panel import InteractionPanel
 from .log_panel import LogPanel
 
+UI_TICK_MS = 100              # How often the panels show the newest snapshot while auto-running
+DEFAULT_TURNS_PER_SECOND = 5
+
 class MainWindow:
     """Main application window"""
     
@@ -21,6 +25,11 @@ class MainWindow:
         self.root = root
         self.simulator = simulator
         
+        # Runs turns on a worker thread in auto-run mode; everything touching
+        # the simulator holds its lock
+        self.runner = AutoRunner(simulator, DEFAULT_TURNS_PER_SECOND)
+        self.lock = self.runner.lock
+        
         # Configure the main window
         self.setup_window()
         
@@ -73,8 +82,8 @@ class MainWindow:
         right_frame.grid_propagate(False)
         
         # Initialize panels
-        self.tavern_panel = TavernPanel(left_frame, self.simulator)
-        self.character_panel = CharacterPanel(right_frame, self.simulator)
+        self.tavern_panel = TavernPanel(left_frame, self.simulator, lock=self.lock)
+        self.character_panel = CharacterPanel(right_frame, self.simulator, lock=self.lock)
         
         # Create notebook for center content
         self.notebook = ttk.Notebook(center_frame)
@@ -112,6 +121,9 @@ class MainWindow:
         sim_menu.add_separator()
         sim_menu.add_checkbutton(label="Auto Events", variable=tk.BooleanVar(value=True), 
                                 command=self.toggle_auto_events)
+        self.auto_run_var = tk.BooleanVar(value=False)
+        sim_menu.add_checkbutton(label="Auto Run", variable=self.auto_run_var,
+                                command=self.toggle_auto_run, accelerator="Ctrl+R")
         
         # View menu
         view_menu = tk.Menu(menubar, tearoff=0)
@@ -130,6 +142,8 @@ class MainWindow:
         self.root.bind('<Control-o>', lambda e: self.load_session())
         self.root.bind('<Control-q>', lambda e: self.root.quit())
         self.root.bind('<space>', lambda e: self.advance_turn())
+        self.root.bind('<Control-r>', lambda e: (self.auto_run_var.set(not self.auto_run_var.get()),
+                                                 self.toggle_auto_run()))
         self.root.bind('<F5>', lambda e: self.update_display())
     
     def create_tabs(self):
@@ -137,17 +151,17 @@ class MainWindow:
         # Relationship Graph tab
         graph_frame = ttk.Frame(self.notebook)
         self.notebook.add(graph_frame, text="Relationships")
-        self.relationship_graph = RelationshipGraph(graph_frame, self.simulator)
+        self.relationship_graph = RelationshipGraph(graph_frame, self.simulator, lock=self.lock)
         
         # Interactions tab
         interaction_frame = ttk.Frame(self.notebook)
         self.notebook.add(interaction_frame, text="Interactions")
-        self.interaction_panel = InteractionPanel(interaction_frame, self.simulator, self.update_display)
+        self.interaction_panel = InteractionPanel(interaction_frame, self.simulator, self.update_display, lock=self.lock)
         
         # Log tab
         log_frame = ttk.Frame(self.notebook)
         self.notebook.add(log_frame, text="Session Log")
-        self.log_panel = LogPanel(log_frame, self.simulator)
+        self.log_panel = LogPanel(log_frame, self.simulator, lock=self.lock, runner=self.runner)
     
     def create_status_bar(self):
         """Create the status bar"""
@@ -159,11 +173,22 @@ class MainWindow:
         
         self.turn_label = ttk.Label(self.status_bar, text="Turn: 0")
         self.turn_label.pack(side=tk.RIGHT)
+        
+        # Auto-run speed
+        self.rate_label = ttk.Label(self.status_bar, text="")
+        self.rate_label.pack(side=tk.RIGHT, padx=10)
+        self.rate_var = tk.StringVar(value=str(DEFAULT_TURNS_PER_SECOND))
+        rate_spinbox = ttk.Spinbox(self.status_bar, from_=1, to=1000, increment=1, width=6,
+                                   textvariable=self.rate_var, command=self.on_rate_change)
+        rate_spinbox.pack(side=tk.RIGHT)
+        rate_spinbox.bind('<Return>', lambda e: self.on_rate_change())
+        ttk.Label(self.status_bar, text="Turns/sec:").pack(side=tk.RIGHT, padx=(10, 2))
     
     def new_tavern(self):
         """Generate a new tavern"""
         try:
-            self.simulator.generate_new_tavern()
+            with self.lock:
+                self.simulator.generate_new_tavern()
             self.update_display()
             self.status_label.config(text="New tavern generated")
         except Exception as e:
@@ -173,11 +198,12 @@ class MainWindow:
         """Save the current session"""
         try:
             filename = filedialog.asksaveasfilename(
-                defaultextension=".pkl",
-                filetypes=[("Pickle files", "*.pkl"), ("All files", "*.*")]
+                defaultextension=".tavern",
+                filetypes=[("Tavern sessions", "*.tavern"), ("All files", "*.*")]
             )
             if filename:
-                saved_file = self.simulator.save_session(filename)
+                with self.lock:
+                    saved_file = self.simulator.save_session(filename)
                 self.status_label.config(text=f"Session saved to {saved_file}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save session: {str(e)}")
@@ -186,14 +212,22 @@ class MainWindow:
         """Load a saved session"""
         try:
             filename = filedialog.askopenfilename(
-                filetypes=[("Pickle files", "*.pkl"), ("All files", "*.*")]
+                filetypes=[("Tavern sessions", "*.tavern"), ("All files", "*.*")]
             )
             if filename:
-                if self.simulator.load_session(filename):
+                # The loaded log numbers its records afresh, so the runner starts over after it
+                was_running = self.runner.running
+                self.stop_auto_run()
+                with self.lock:
+                    loaded = self.simulator.load_session(filename)
+                if loaded:
+                    self.log_panel.rebuild_display()
                     self.update_display()
                     self.status_label.config(text=f"Session loaded from {filename}")
                 else:
                     messagebox.showerror("Error", "Failed to load session file")
+                if was_running:
+                    self.start_auto_run()
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load session: {str(e)}")
     
@@ -205,7 +239,8 @@ class MainWindow:
                 filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
             )
             if filename:
-                exported_file = self.simulator.export_session_log(filename)
+                with self.lock:
+                    exported_file = self.simulator.export_session_log(filename)
                 self.status_label.config(text=f"Log exported to {exported_file}")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to export log: {str(e)}")
@@ -213,7 +248,8 @@ class MainWindow:
     def advance_turn(self):
         """Advance the simulation by one turn"""
         try:
-            self.simulator.advance_turn()
+            with self.lock:
+                self.simulator.advance_turn()
             self.update_display()
             self.status_label.config(text="Turn advanced")
         except Exception as e:
@@ -222,7 +258,8 @@ class MainWindow:
     def trigger_event(self):
         """Manually trigger a random event"""
         try:
-            event = self.simulator.trigger_random_event()
+            with self.lock:
+                event = self.simulator.trigger_random_event()
             if event:
                 self.update_display()
                 self.status_label.config(text=f"Event triggered: {event.title}")
@@ -234,7 +271,8 @@ class MainWindow:
     def generate_rumor(self):
         """Generate a new rumor"""
         try:
-            rumor = self.simulator.generate_rumor()
+            with self.lock:
+                rumor = self.simulator.generate_rumor()
             if rumor:
                 self.update_display()
                 self.status_label.config(text="New rumor generated")
@@ -245,10 +283,57 @@ class MainWindow:
     
     def toggle_auto_events(self):
         """Toggle automatic event generation"""
-        self.simulator.auto_events_enabled = not self.simulator.auto_events_enabled
+        with self.lock:
+            self.simulator.auto_events_enabled = not self.simulator.auto_events_enabled
         status = "enabled" if self.simulator.auto_events_enabled else "disabled"
         self.status_label.config(text=f"Auto events {status}")
     
+    def toggle_auto_run(self):
+        """Start or stop running turns in the background"""
+        if self.auto_run_var.get():
+            self.start_auto_run()
+        else:
+            self.stop_auto_run()
+    
+    def start_auto_run(self):
+        self.on_rate_change()
+        self.runner.start(self.log_panel.log_cursor)
+        self.auto_run_var.set(True)
+        self.status_label.config(text="Auto-run started")
+        self.root.after(UI_TICK_MS, self.ui_tick)
+    
+    def stop_auto_run(self):
+        if not self.runner.running:
+            return
+        self.runner.stop()
+        self.auto_run_var.set(False)
+        self.show_snapshot_from_runner()
+        self.rate_label.config(text="")
+        self.status_label.config(text="Auto-run stopped")
+    
+    def on_rate_change(self):
+        """Apply the turns/sec setting"""
+        try:
+            self.runner.set_rate(float(self.rate_var.get()))
+        except ValueError:
+            self.rate_var.set(str(self.runner.turns_per_second))
+    
+    def ui_tick(self):
+        """Show the newest snapshot, at the UI's own pace, while auto-running"""
+        if not self.runner.running:
+            if self.runner.error is not None:
+                self.auto_run_var.set(False)
+                messagebox.showerror("Error", f"Auto-run stopped: {self.runner.error}")
+            return
+        self.show_snapshot_from_runner()
+        self.root.after(UI_TICK_MS, self.ui_tick)
+    
+    def show_snapshot_from_runner(self):
+        snapshot = self.runner.poll()
+        if snapshot is not None:
+            self.show_snapshot(snapshot)
+            self.rate_label.config(text=f"{snapshot.turns_per_second:.0f} turns/sec")
+    
     def show_character_details(self):
         """Show detailed character information"""
         # This would open a detailed character window
@@ -274,21 +359,35 @@ Created with Python and Tkinter"""
     
     def update_display(self):
         """Update all display elements"""
+        if self.runner.running:
+            # The next tick shows the runner's newest snapshot
+            return
+        try:
+            with self.lock:
+                snapshot = take_snapshot(self.simulator)
+            self.show_snapshot(snapshot)
+            if hasattr(self, 'log_panel'):
+                self.log_panel.update_display()
+        except Exception as e:
+            print(f"Error updating display: {e}")
+    
+    def show_snapshot(self, snapshot):
+        """Show one snapshot in every panel"""
         try:
             # Update turn counter
-            self.turn_label.config(text=f"Turn: {self.simulator.turn_counter}")
+            self.turn_label.config(text=f"Turn: {snapshot.turn}")
             
             # Update all panels
             if hasattr(self, 'tavern_panel'):
-                self.tavern_panel.update_display()
+                self.tavern_panel.show_snapshot(snapshot)
             if hasattr(self, 'character_panel'):
-                self.character_panel.update_display()
+                self.character_panel.show_snapshot(snapshot)
             if hasattr(self, 'relationship_graph'):
-                self.relationship_graph.update_display()
+                self.relationship_graph.show_snapshot(snapshot)
             if hasattr(self, 'interaction_panel'):
-                self.interaction_panel.update_display()
+                self.interaction_panel.show_snapshot(snapshot)
             if hasattr(self, 'log_panel'):
-                self.log_panel.update_display()
+                self.log_panel.show_snapshot(snapshot)
                 
         except Exception as e:
             print(f"Error updating display: {e}")
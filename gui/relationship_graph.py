@@ -2,28 +2,60 @@
 Relationship graph visualization for the Warhammer Fantasy Tavern Simulator
 """
 
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.collections import LineCollection
 import networkx as nx
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 from ..core.tavern_simulator import TavernSimulator
 from ..core.enums import RelationshipType
+from ..core.auto_runner import SimulationSnapshot, take_snapshot
+
+# Spring layouts restarted from the previous positions only need a few iterations
+WARM_START_ITERATIONS = 15
+LAYOUT_POLL_MS = 50
+# Layouts that depend only on which nodes there are, not on the edges
+NODE_ONLY_LAYOUTS = ("circular", "random", "shell")
+EMPTY_KEY = ("empty",)
 
 class RelationshipGraph:
     """Interactive relationship graph visualization"""
     
-    def __init__(self, parent: tk.Widget, simulator: TavernSimulator):
+    def __init__(self, parent: tk.Widget, simulator: TavernSimulator, lock: threading.RLock = None):
         self.parent = parent
         self.simulator = simulator
+        self.lock = lock or threading.RLock()  # Held while touching the simulator
         
         # Graph settings
         self.node_size = 1000
         self.font_size = 8
         self.edge_width_multiplier = 2
         
+        # Cached layout: node positions, and what they were computed for
+        self.positions: Dict[str, np.ndarray] = {}
+        self._layout_for: Optional[Tuple] = None     # (layout, nodes, edges) of the last layout request
+        self._layout_rng = np.random.default_rng()
+        
+        # Layouts are computed on a worker thread; results come back through a queue
+        self._layout_queue: "queue.Queue[Tuple[int, Dict]]" = queue.Queue()
+        self._layout_generation = 0
+        self._layout_thread: Optional[threading.Thread] = None
+        self._pending_layout: Optional[Tuple] = None
+        
+        # Drawn artists, updated in place between refreshes
+        self._drawn_key: Optional[Tuple] = None
+        self._factions: Dict[str, str] = {}
+        self._drawn_nodes: Tuple[str, ...] = ()
+        self._edges: List[Tuple[str, str, int]] = []
+        self._node_artist = None
+        self._edge_artist: Optional[LineCollection] = None
+        self._label_artists: Dict[str, plt.Text] = {}
+        
         self.create_widgets()
         self.setup_graph()
     
@@ -130,11 +162,8 @@ class RelationshipGraph:
     
     def get_node_color(self, character_name: str) -> str:
         """Get node color based on character faction"""
-        if not self.simulator.current_tavern:
-            return "lightblue"
-        
-        character = self.simulator.current_tavern.get_character_by_name(character_name)
-        if not character:
+        faction = self._factions.get(character_name)
+        if not faction:
             return "lightblue"
         
         faction_colors = {
@@ -157,7 +186,12 @@ class RelationshipGraph:
             "Witch Hunter": "white"
         }
         
-        return faction_colors.get(character.faction.value, "lightblue")
+        return faction_colors.get(faction, "lightblue")
+    
+    def relationship_edges(self, names: List[str]) -> List[Tuple[str, str, int]]:
+        """Undirected edges among names, weighted by the first one's regard (or the other's if that is neutral)"""
+        # Show all edges for small groups
+        return self.simulator.current_tavern.relationships.undirected_edges(names, include_neutral=len(names) <= 5)
     
     def create_graph_from_relationships(self) -> nx.Graph:
         """Create NetworkX graph from character relationships"""
@@ -166,35 +200,26 @@ class RelationshipGraph:
         if not self.simulator.current_tavern:
             return graph
         
-        characters = self.simulator.current_tavern.characters
-        
-        # Add nodes
-        for char in characters:
-            graph.add_node(char.name)
-        
-        # Add edges for relationships
-        for char in characters:
-            for other_char in characters:
-                if char != other_char:
-                    relationship = char.get_relationship(other_char.name)
-                    rel_value = int(relationship)
-                    
-                    # Only add edge if relationship is not neutral or if we want to show all
-                    if rel_value != 0 or len(characters) <= 5:  # Show all edges for small groups
-                        if not graph.has_edge(char.name, other_char.name):
-                            graph.add_edge(char.name, other_char.name, weight=rel_value)
-        
+        names = [char.name for char in self.simulator.current_tavern.characters]
+        graph.add_nodes_from(names)
+        graph.add_weighted_edges_from(self.relationship_edges(names))
         return graph
     
-    def get_layout_positions(self, graph: nx.Graph) -> Dict:
-        """Get node positions based on selected layout"""
+    def get_layout_positions(self, graph: nx.Graph, layout: str = None, initial: Dict = None) -> Dict:
+        """Get node positions based on selected layout
+        
+        Spring layouts given initial positions continue from them instead of
+        starting over. Runs on the layout thread, so it must not touch Tk.
+        """
         if len(graph.nodes()) == 0:
             return {}
         
-        layout = self.layout_var.get()
+        layout = layout or self.layout_var.get()
         
         try:
             if layout == "spring":
+                if initial:
+                    return nx.spring_layout(graph, k=2, pos=initial, iterations=WARM_START_ITERATIONS)
                 return nx.spring_layout(graph, k=2, iterations=50)
             elif layout == "circular":
                 return nx.circular_layout(graph)
@@ -208,96 +233,185 @@ class RelationshipGraph:
             # Fallback to spring layout if there's an error
             return nx.spring_layout(graph)
     
-    def update_display(self):
-        """Update the relationship graph display"""
-        # Clear the current plot
-        self.ax.clear()
+    def _provisional_positions(self, nodes: Tuple[str, ...], edges: List[Tuple[str, str, int]]):
+        """Keep cached positions and put newcomers next to someone they know (or anywhere)"""
+        self.positions = {name: self.positions[name] for name in nodes if name in self.positions}
+        if len(self.positions) == len(nodes):
+            return
+        known = {}
+        for a, b, _ in edges:
+            known.setdefault(a, b)
+            known.setdefault(b, a)
+        for name in nodes:
+            if name not in self.positions:
+                anchor = self.positions.get(known.get(name))
+                if anchor is not None:
+                    self.positions[name] = anchor + self._layout_rng.normal(0, 0.05, 2)
+                else:
+                    self.positions[name] = self._layout_rng.uniform(-1, 1, 2)
+    
+    def _request_layout(self, nodes: Tuple[str, ...], edges: List[Tuple[str, str, int]]):
+        """Start computing a layout on the worker thread, unless the cached one still fits"""
+        layout = self.layout_var.get()
+        layout_for = (layout, nodes, tuple(edges) if layout not in NODE_ONLY_LAYOUTS else None)
+        if layout_for == self._layout_for:
+            return
+        warm = self._layout_for is not None and self._layout_for[0] == layout == "spring"
+        self._layout_for = layout_for
         
-        if not self.simulator.current_tavern or not self.simulator.current_tavern.characters:
-            self.ax.set_title("Character Relationships", fontsize=14, fontweight='bold')
-            self.ax.text(0.5, 0.5, "No characters in tavern", ha='center', va='center', 
-                        transform=self.ax.transAxes, fontsize=12)
-            self.ax.set_xlim(0, 1)
-            self.ax.set_ylim(0, 1)
-            self.ax.axis('off')
-            self.canvas.draw()
+        graph = nx.Graph()
+        graph.add_nodes_from(nodes)
+        graph.add_weighted_edges_from(edges)
+        initial = {name: tuple(pos) for name, pos in self.positions.items()} if warm else None
+        self._layout_generation += 1
+        self._pending_layout = (self._layout_generation, graph, layout, initial)
+        if self._layout_thread is None:
+            self._start_layout_thread()
+    
+    def _start_layout_thread(self):
+        generation, graph, layout, initial = self._pending_layout
+        self._pending_layout = None
+        
+        def work():
+            self._layout_queue.put((generation, self.get_layout_positions(graph, layout, initial)))
+        
+        self._layout_thread = threading.Thread(target=work, name="relationship-layout", daemon=True)
+        self._layout_thread.start()
+        self.frame.after(LAYOUT_POLL_MS, self._poll_layout)
+    
+    def _poll_layout(self):
+        """Pick up a finished layout on the Tk thread"""
+        try:
+            generation, positions = self._layout_queue.get_nowait()
+        except queue.Empty:
+            self.frame.after(LAYOUT_POLL_MS, self._poll_layout)
             return
         
-        # Create graph from relationships
-        self.graph = self.create_graph_from_relationships()
+        self._layout_thread = None
+        if self._pending_layout is not None:
+            # The graph changed while this one was computed; lay out the latest
+            self._start_layout_thread()
+        if generation == self._layout_generation:
+            self.positions = {name: np.asarray(pos, dtype=float) for name, pos in positions.items()}
+            self._update_positions()
+            self.canvas.draw_idle()
+    
+    def short_label(self, name: str) -> str:
+        # Use first name only or abbreviate long names
+        parts = name.split()
+        if len(parts) > 1:
+            return parts[0]  # First name only
+        elif len(name) > 10:
+            return name[:8] + "..."  # Truncate long names
+        return name
+    
+    def _show_message(self, message: str):
+        self.ax.clear()
+        self._drawn_key = None
+        self._drawn_nodes = ()
+        self._node_artist = self._edge_artist = None
+        self._label_artists = {}
+        self.ax.set_title("Character Relationships", fontsize=14, fontweight='bold')
+        self.ax.text(0.5, 0.5, message, ha='center', va='center',
+                    transform=self.ax.transAxes, fontsize=12)
+        self.ax.set_xlim(0, 1)
+        self.ax.set_ylim(0, 1)
+        self.ax.axis('off')
+        self.canvas.draw_idle()
+    
+    def update_display(self):
+        """Update the relationship graph display
+        
+        Nothing is redrawn unless relationships, patrons or display options
+        changed. Edges are then restyled in place, labels are only added or
+        dropped for patrons who came or went, and the layout is refined in
+        the background, moving the existing artists when it arrives.
+        """
+        with self.lock:
+            snapshot = take_snapshot(self.simulator)
+        self.show_snapshot(snapshot)
+    
+    def show_snapshot(self, snapshot: SimulationSnapshot):
+        """Show the relationships of a snapshot"""
+        if not snapshot.tavern or not snapshot.patrons:
+            if self._drawn_key != EMPTY_KEY:
+                self._show_message("No characters in tavern")
+                self._drawn_key = EMPTY_KEY
+            return
         
-        if len(self.graph.nodes()) == 0:
-            self.ax.set_title("Character Relationships", fontsize=14, fontweight='bold')
-            self.ax.text(0.5, 0.5, "No relationships to display", ha='center', va='center', 
-                        transform=self.ax.transAxes, fontsize=12)
-            self.ax.set_xlim(0, 1)
-            self.ax.set_ylim(0, 1)
-            self.ax.axis('off')
-            self.canvas.draw()
+        key = (snapshot.graph_key, self.layout_var.get(), self.show_labels_var.get())
+        if key == self._drawn_key:
+            return
+        if snapshot.relationship_edges is None:
+            self._show_message(f"Too many patrons to draw ({len(snapshot.patrons)})")
+            self._drawn_key = key
             return
         
-        # Get layout positions
-        pos = self.get_layout_positions(self.graph)
+        nodes = tuple(patron.name for patron in snapshot.patrons)
+        self._factions = {patron.name: patron.faction for patron in snapshot.patrons}
+        self._edges = list(snapshot.relationship_edges)
+        self.graph = nx.Graph()
+        self.graph.add_nodes_from(nodes)
+        self.graph.add_weighted_edges_from(self._edges)
         
-        # Prepare node colors
-        node_colors = [self.get_node_color(node) for node in self.graph.nodes()]
+        self._provisional_positions(nodes, self._edges)
+        self._request_layout(nodes, self._edges)
         
-        # Draw nodes
-        nx.draw_networkx_nodes(self.graph, pos, 
-                              node_color=node_colors,
-                              node_size=self.node_size,
-                              alpha=0.8,
-                              ax=self.ax)
+        if nodes != self._drawn_nodes or self._drawn_key is None or key[2] != self._drawn_key[2]:
+            self._draw_nodes(nodes)
+        self._draw_edges()
+        self._update_positions()
         
-        # Draw edges with different colors and widths based on relationships
-        for edge in self.graph.edges(data=True):
-            node1, node2, data = edge
-            weight = data.get('weight', 0)
-            
-            color = self.get_relationship_color(weight)
-            width = self.get_relationship_width(weight)
-            
-            # Draw edge
-            nx.draw_networkx_edges(self.graph, pos,
-                                  edgelist=[(node1, node2)],
-                                  edge_color=color,
-                                  width=width,
-                                  alpha=0.7,
-                                  ax=self.ax)
-        
-        # Draw labels if enabled
-        if self.show_labels_var.get():
-            # Create shortened labels for better readability
-            labels = {}
-            for node in self.graph.nodes():
-                # Use first name only or abbreviate long names
-                parts = node.split()
-                if len(parts) > 1:
-                    labels[node] = parts[0]  # First name only
-                elif len(node) > 10:
-                    labels[node] = node[:8] + "..."  # Truncate long names
-                else:
-                    labels[node] = node
-            
-            nx.draw_networkx_labels(self.graph, pos,
-                                   labels=labels,
-                                   font_size=self.font_size,
-                                   font_weight='bold',
-                                   ax=self.ax)
-        
-        # Set title
-        num_chars = len(self.simulator.current_tavern.characters)
-        self.ax.set_title(f"Character Relationships ({num_chars} characters)", 
+        self.ax.set_title(f"Character Relationships ({len(nodes)} characters)",
                          fontsize=14, fontweight='bold')
+        self._drawn_key = key
+        self.canvas.draw_idle()
+    
+    def _draw_nodes(self, nodes: Tuple[str, ...]):
+        """Restyle nodes and add or drop labels for patrons who came or went"""
+        if self._node_artist is None:
+            self.ax.clear()
+            self.ax.axis('off')
+            self._edge_artist = LineCollection([], alpha=0.7, zorder=1)
+            self.ax.add_collection(self._edge_artist)
+            self._node_artist = self.ax.scatter([], [], s=self.node_size, alpha=0.8, zorder=2)
+        
+        self._drawn_nodes = nodes
+        self._node_artist.set_offsets(np.array([self.positions[name] for name in nodes]))
+        self._node_artist.set_facecolor([self.get_node_color(name) for name in nodes])
+        
+        wanted = set(nodes) if self.show_labels_var.get() else set()
+        for name in [name for name in self._label_artists if name not in wanted]:
+            self._label_artists.pop(name).remove()
+        for name in nodes:
+            if name in wanted and name not in self._label_artists:
+                x, y = self.positions[name]
+                self._label_artists[name] = self.ax.text(
+                    x, y, self.short_label(name), fontsize=self.font_size, fontweight='bold',
+                    ha='center', va='center', zorder=3
+                )
+    
+    def _draw_edges(self):
+        """Restyle the edge collection for the current relationships"""
+        weights = [weight for _, _, weight in self._edges]
+        self._edge_artist.set_color([self.get_relationship_color(w) for w in weights])
+        self._edge_artist.set_linewidth([self.get_relationship_width(w) for w in weights])
+    
+    def _update_positions(self):
+        """Move nodes, labels and edge ends to the cached positions"""
+        if self._node_artist is None:
+            return
         
-        # Remove axes
-        self.ax.axis('off')
-        
-        # Adjust layout to prevent clipping
-        self.fig.tight_layout()
+        offsets = np.array([self.positions[name] for name in self._drawn_nodes])
+        self._node_artist.set_offsets(offsets)
+        self._edge_artist.set_segments([(self.positions[a], self.positions[b]) for a, b, _ in self._edges])
+        for name, label in self._label_artists.items():
+            label.set_position(self.positions[name])
         
-        # Redraw canvas
-        self.canvas.draw()
+        low, high = offsets.min(axis=0), offsets.max(axis=0)
+        margin = np.maximum((high - low) * 0.1, 0.1)
+        self.ax.set_xlim(low[0] - margin[0], high[0] + margin[0])
+        self.ax.set_ylim(low[1] - margin[1], high[1] + margin[1])
     
     def on_node_click(self, event):
         """Handle node click events (for future implementation)"""
@@ -2,17 +2,20 @@
 Tavern information panel for the Warhammer Fantasy Tavern Simulator
 """
 
+import threading
 import tkinter as tk
 from tkinter import ttk
 from typing import Optional
 from ..core.tavern_simulator import TavernSimulator
+from ..core.auto_runner import SimulationSnapshot, take_snapshot
 
 class TavernPanel:
     """Panel displaying tavern information and controls"""
     
-    def __init__(self, parent: tk.Widget, simulator: TavernSimulator):
+    def __init__(self, parent: tk.Widget, simulator: TavernSimulator, lock: threading.RLock = None):
         self.parent = parent
         self.simulator = simulator
+        self.lock = lock or threading.RLock()  # Held while touching the simulator
         
         self.create_widgets()
     
@@ -150,35 +153,46 @@ class TavernPanel:
     
     def new_tavern(self):
         """Generate a new tavern"""
-        self.simulator.generate_new_tavern()
+        with self.lock:
+            self.simulator.generate_new_tavern()
         self.update_display()
     
     def advance_turn(self):
         """Advance the simulation by one turn"""
-        self.simulator.advance_turn()
+        with self.lock:
+            self.simulator.advance_turn()
         self.update_display()
     
     def trigger_event(self):
         """Trigger a random event"""
-        self.simulator.trigger_random_event()
+        with self.lock:
+            self.simulator.trigger_random_event()
         self.update_display()
     
     def generate_rumor(self):
         """Generate a new rumor"""
-        self.simulator.generate_rumor()
+        with self.lock:
+            self.simulator.generate_rumor()
         self.update_display()
     
     def add_character(self):
         """Add selected character to tavern"""
         char_name = self.available_chars_var.get()
         if char_name:
-            success = self.simulator.add_character_to_tavern(char_name)
+            with self.lock:
+                success = self.simulator.add_character_to_tavern(char_name)
             if success:
                 self.update_display()
     
     def update_display(self):
         """Update the display with current tavern information"""
-        tavern = self.simulator.current_tavern
+        with self.lock:
+            snapshot = take_snapshot(self.simulator)
+        self.show_snapshot(snapshot)
+    
+    def show_snapshot(self, snapshot: SimulationSnapshot):
+        """Show the tavern as it was in a snapshot"""
+        tavern = snapshot.tavern
         if not tavern:
             # Clear display if no tavern
             self.name_var.set("No tavern loaded")
@@ -200,9 +214,9 @@ class TavernPanel:
         self.location_var.set(tavern.location)
         
         # Update status
-        self.atmosphere_var.set(tavern.atmosphere.value)
+        self.atmosphere_var.set(tavern.atmosphere)
         self.atm_desc_var.set(tavern.atmosphere_description)
-        self.occupancy_var.set(f"{tavern.current_occupancy}/{tavern.capacity}")
+        self.occupancy_var.set(f"{tavern.occupancy}/{tavern.capacity}")
         
         # Update tension meter
         self.tension_var.set(tavern.tension_level)
@@ -232,9 +246,7 @@ class TavernPanel:
             self.events_listbox.insert(tk.END, event)
         
         # Update available characters dropdown
-        current_char_names = {char.name for char in tavern.characters}
-        available_chars = [name for name in self.simulator.available_characters.keys() 
-                          if name not in current_char_names]
+        available_chars = list(snapshot.available_characters)
         self.available_chars_combo['values'] = available_chars
         
         if available_chars and not self.available_chars_var.get():
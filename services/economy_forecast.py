@@ -0,0 +1,141 @@
+"""
+Monte-Carlo economic forecasting for the tavern economy
+Runs many independent economy trajectories at once as NumPy arrays to produce risk bands
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Sequence
+
+import numpy as np
+
+from .tavern_economy import (
+    TavernEconomySystem, ResourceType,
+    MARKET_FLUCTUATION_CHANCE, MARKET_FLUCTUATION_RANGE,
+    REPUTATION_EVENT_CHANCE, REPUTATION_EVENT_RANGE,
+    SUPPLY_EVENT_CHANCE, SUPPLY_EVENT_RANGE
+)
+
+DEFAULT_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+
+@dataclass
+class EconomicForecast:
+    """Quantile bands and final distributions of a Monte-Carlo forecast"""
+    ticks: np.ndarray             # (T,) tick index of each recorded band row
+    quantiles: np.ndarray         # (Q,)
+    resources: List[ResourceType]
+    price_bands: np.ndarray       # (T, Q, R)
+    reputation_bands: np.ndarray  # (T, Q)
+    supply_bands: np.ndarray      # (T, Q)
+    final_prices: np.ndarray      # (N, R)
+    final_reputation: np.ndarray  # (N,)
+    final_supply: np.ndarray      # (N,)
+    seed: Optional[int] = None
+
+    @property
+    def n_paths(self) -> int:
+        return len(self.final_reputation)
+
+    def price_band(self, resource_type: ResourceType) -> np.ndarray:
+        """(T, Q) quantile bands for a single resource price"""
+        return self.price_bands[:, :, self.resources.index(resource_type)]
+
+    def probability_reputation_below(self, threshold: float) -> float:
+        """Share of futures ending with tavern reputation below a threshold"""
+        return float(np.mean(self.final_reputation < threshold))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-friendly bands for dashboard charts"""
+        return {
+            "ticks": self.ticks.tolist(),
+            "quantiles": self.quantiles.tolist(),
+            "n_paths": self.n_paths,
+            "seed": self.seed,
+            "market_prices": {
+                rt.value: self.price_band(rt).tolist() for rt in self.resources
+            },
+            "reputation": self.reputation_bands.tolist(),
+            "supply_quality": self.supply_bands.tolist()
+        }
+
+class EconomyForecaster:
+    """Vectorized forward simulation of ``simulate_economic_events``
+
+    Each path is an independent future of the market: every tick applies the
+    same market, reputation and supply events as the live system, but for all
+    paths at once. The live economy is only read, never mutated.
+    """
+
+    def __init__(self, economy: TavernEconomySystem, seed: Optional[int] = None):
+        self.economy = economy
+        self.seed = seed
+        self.rng = np.random.default_rng(seed)
+        self.resources = list(ResourceType)
+
+    def forecast(self, n_ticks: int = 1000, n_paths: int = 10000,
+                 quantiles: Sequence[float] = DEFAULT_QUANTILES,
+                 record_every: int = 10) -> EconomicForecast:
+        """Run n_paths trajectories for n_ticks and collect quantile bands"""
+        if n_ticks < 0 or n_paths <= 0 or record_every <= 0:
+            raise ValueError("n_ticks must be >= 0, n_paths and record_every > 0")
+
+        rng = self.rng
+        quantiles = np.asarray(quantiles, dtype=float)
+        n_resources = len(self.resources)
+        rows = np.arange(n_paths)
+
+        prices = np.tile(
+            np.array([self.economy.market_prices[rt] for rt in self.resources], dtype=float),
+            (n_paths, 1)
+        )
+        reputation = np.full(n_paths, float(self.economy.economic_state.reputation_score))
+        supply = np.full(n_paths, float(self.economy.economic_state.supply_quality))
+
+        recorded_ticks = list(range(0, n_ticks + 1, record_every))
+        if recorded_ticks[-1] != n_ticks:
+            recorded_ticks.append(n_ticks)
+        n_recorded = len(recorded_ticks)
+
+        price_bands = np.empty((n_recorded, len(quantiles), n_resources))
+        reputation_bands = np.empty((n_recorded, len(quantiles)))
+        supply_bands = np.empty((n_recorded, len(quantiles)))
+
+        def record(slot: int):
+            price_bands[slot] = np.quantile(prices, quantiles, axis=0)
+            reputation_bands[slot] = np.quantile(reputation, quantiles)
+            supply_bands[slot] = np.quantile(supply, quantiles)
+
+        record(0)
+        slot = 1
+        for tick in range(1, n_ticks + 1):
+            # Market fluctuations: one random resource per affected path
+            fluctuates = rng.random(n_paths) < MARKET_FLUCTUATION_CHANCE
+            resource_idx = rng.integers(0, n_resources, n_paths)
+            change = rng.uniform(*MARKET_FLUCTUATION_RANGE, n_paths)
+            prices[rows, resource_idx] *= np.where(fluctuates, 1.0 + change, 1.0)
+
+            # Reputation events
+            shifts = rng.random(n_paths) < REPUTATION_EVENT_CHANCE
+            reputation += np.where(shifts, rng.uniform(*REPUTATION_EVENT_RANGE, n_paths), 0.0)
+            np.clip(reputation, 0, 100, out=reputation)
+
+            # Supply events
+            shifts = rng.random(n_paths) < SUPPLY_EVENT_CHANCE
+            supply += np.where(shifts, rng.uniform(*SUPPLY_EVENT_RANGE, n_paths), 0.0)
+            np.clip(supply, 0, 100, out=supply)
+
+            if slot < n_recorded and tick == recorded_ticks[slot]:
+                record(slot)
+                slot += 1
+
+        return EconomicForecast(
+            ticks=np.array(recorded_ticks),
+            quantiles=quantiles,
+            resources=self.resources,
+            price_bands=price_bands,
+            reputation_bands=reputation_bands,
+            supply_bands=supply_bands,
+            final_prices=prices,
+            final_reputation=reputation,
+            final_supply=supply,
+            seed=self.seed
+        )
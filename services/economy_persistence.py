@@ -0,0 +1,201 @@
+"""
+Event-sourced persistence for the tavern economy
+Periodic binary snapshots plus an append-only JSON-lines log of changes since the snapshot
+"""
+
+import json
+import os
+import time
+from dataclasses import asdict, fields
+from pathlib import Path
+from typing import Dict, List, Any, TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from .tavern_economy import TavernEconomySystem, Transaction
+
+SNAPSHOT_FILE = "economy_snapshot.npz"
+EVENT_LOG_FILE = "economy_events.jsonl"
+
+class EconomySnapshotStore:
+    """Stores economy state as a snapshot plus the tail of events after it
+
+    Every log record carries the absolute post-change values of whatever it
+    touched (agent resource rows, market prices, tavern state), so replaying
+    the tail is a sequence of assignments and never depends on random draws.
+    Records also carry a sequence number; a snapshot remembers the last one it
+    covers, which makes replay safe even if the log was not truncated after
+    the snapshot was written.
+    """
+
+    def __init__(self, directory: str = "data/economy", snapshot_every: int = 1000):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.snapshot_path = self.directory / SNAPSHOT_FILE
+        self.log_path = self.directory / EVENT_LOG_FILE
+        self.snapshot_every = snapshot_every
+
+        self.sequence = 0
+        self.events_since_snapshot = 0
+        self._log_file = None
+
+    def has_state(self) -> bool:
+        return self.snapshot_path.exists() or self.log_path.exists()
+
+    def save_snapshot(self, economy: 'TavernEconomySystem'):
+        """Write a binary snapshot of the economy and start a fresh event log"""
+        from .tavern_economy import ResourceType
+
+        resources = list(ResourceType)
+        agents = list(economy.agent_resources.keys())
+        balances = np.array(
+            [[economy.agent_resources[agent].get(rt, 0.0) for rt in resources] for agent in agents],
+            dtype=np.float64
+        ).reshape(len(agents), len(resources))
+        state_fields = [f.name for f in fields(economy.economic_state)]
+
+        tmp_path = self.snapshot_path.with_suffix(".tmp.npz")
+        np.savez(
+            tmp_path,
+            sequence=np.int64(self.sequence),
+            timestamp=np.float64(time.time()),
+            agents=np.array(agents, dtype=str),
+            resources=np.array([rt.value for rt in resources], dtype=str),
+            balances=balances,
+            prices=np.array([economy.market_prices[rt] for rt in resources], dtype=np.float64),
+            state_fields=np.array(state_fields, dtype=str),
+            state_values=np.array(
+                [getattr(economy.economic_state, name) for name in state_fields], dtype=np.float64
+            ),
+            transaction_count=np.int64(economy.transaction_count)
+        )
+        os.replace(tmp_path, self.snapshot_path)
+
+        # Everything in the old log is now covered by the snapshot
+        self._close_log()
+        with open(self.log_path, 'w', encoding='utf-8'):
+            pass
+        self.events_since_snapshot = 0
+
+    def append_event(self, economy: 'TavernEconomySystem', kind: str,
+                     agents: List[str] = None, transaction: 'Transaction' = None):
+        """Append the post-change state touched by an operation to the log"""
+        self.sequence += 1
+        record = {
+            "seq": self.sequence,
+            "kind": kind,
+            "timestamp": time.time(),
+            "agents": {
+                agent: {rt.value: amount for rt, amount in economy.agent_resources[agent].items()}
+                for agent in (agents or []) if agent in economy.agent_resources
+            },
+            "prices": {rt.value: price for rt, price in economy.market_prices.items()},
+            "state": asdict(economy.economic_state)
+        }
+        if transaction is not None:
+            record["transaction"] = serialize_transaction(transaction)
+
+        if self._log_file is None:
+            self._log_file = open(self.log_path, 'a', encoding='utf-8')
+        self._log_file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._log_file.flush()
+
+        self.events_since_snapshot += 1
+        if self.snapshot_every and self.events_since_snapshot >= self.snapshot_every:
+            self.save_snapshot(economy)
+
+    def restore(self, economy: 'TavernEconomySystem') -> int:
+        """Load the snapshot into the economy and replay the log tail
+
+        Returns the number of replayed events.
+        """
+        from .tavern_economy import ResourceType, TavernEconomicState
+
+        snapshot_sequence = 0
+        if self.snapshot_path.exists():
+            with np.load(self.snapshot_path, allow_pickle=False) as snapshot:
+                snapshot_sequence = int(snapshot["sequence"])
+                resources = [ResourceType(value) for value in snapshot["resources"].tolist()]
+                balances = snapshot["balances"]
+                economy.agent_resources = {
+                    agent: dict(zip(resources, balances[row].tolist()))
+                    for row, agent in enumerate(snapshot["agents"].tolist())
+                }
+                economy.market_prices.update(zip(resources, snapshot["prices"].tolist()))
+                economy.economic_state = TavernEconomicState(**dict(zip(
+                    snapshot["state_fields"].tolist(), snapshot["state_values"].tolist()
+                )))
+                economy.transaction_count = int(snapshot["transaction_count"])
+
+        self.sequence = snapshot_sequence
+        replayed = 0
+        for record in self._read_log():
+            if record["seq"] <= snapshot_sequence:
+                continue
+            self._apply(economy, record)
+            self.sequence = record["seq"]
+            replayed += 1
+
+        self.events_since_snapshot = replayed
+        return replayed
+
+    def close(self):
+        self._close_log()
+
+    def _apply(self, economy: 'TavernEconomySystem', record: Dict[str, Any]):
+        from .tavern_economy import ResourceType, TavernEconomicState
+
+        for agent, row in record["agents"].items():
+            economy.agent_resources[agent] = {ResourceType(k): v for k, v in row.items()}
+        economy.market_prices.update({ResourceType(k): v for k, v in record["prices"].items()})
+        economy.economic_state = TavernEconomicState(**record["state"])
+        if "transaction" in record:
+            economy.transaction_history.append(deserialize_transaction(record["transaction"]))
+            economy.transaction_count += 1
+
+    def _read_log(self):
+        """Yield the complete log records, then cut off anything after the last of them"""
+        if not self.log_path.exists():
+            return
+        self._close_log()
+        valid_end = 0
+        with open(self.log_path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break  # A torn final line from a crash mid-write
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    break  # Nothing after a damaged line is valid
+                valid_end += len(line)
+                yield record
+        # Appends must follow the last valid line, or the next restore would stop before them
+        if self.log_path.stat().st_size > valid_end:
+            with open(self.log_path, 'r+b') as f:
+                f.truncate(valid_end)
+
+    def _close_log(self):
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = None
+
+def serialize_transaction(transaction: 'Transaction') -> Dict[str, Any]:
+    """Convert a transaction to JSON-safe values"""
+    data = asdict(transaction)
+    data["transaction_type"] = transaction.transaction_type.value
+    data["resources_exchanged"] = {
+        rt.value: amount for rt, amount in transaction.resources_exchanged.items()
+    }
+    return data
+
+def deserialize_transaction(data: Dict[str, Any]) -> 'Transaction':
+    """Rebuild a transaction from serialize_transaction output"""
+    from .tavern_economy import Transaction, TransactionType, ResourceType
+
+    data = dict(data)
+    data["transaction_type"] = TransactionType(data["transaction_type"])
+    data["resources_exchanged"] = {
+        ResourceType(k): v for k, v in data["resources_exchanged"].items()
+    }
+    return Transaction(**data)
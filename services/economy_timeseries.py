@@ -0,0 +1,161 @@
+"""
+Economy Time Series Store for market prices, reputation and supply quality
+Fixed-size NumPy ring buffers at raw, per-minute and per-hour resolution
+"""
+
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Resolution name -> bucket width in seconds (0 means every raw sample)
+RESOLUTIONS = {
+    "raw": 0,
+    "minute": 60,
+    "hour": 3600
+}
+
+DEFAULT_CAPACITIES = {
+    "raw": 4096,
+    "minute": 1440,  # One day of minutes
+    "hour": 720      # Thirty days of hours
+}
+
+# Columns stored for every point; raw points have mean == min == max == value
+FIELDS = ("mean", "min", "max", "last")
+
+class RingBuffer:
+    """Time-ordered ring buffer of (timestamp, fields) rows backed by NumPy arrays"""
+
+    def __init__(self, capacity: int, n_fields: int = len(FIELDS)):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        self.capacity = capacity
+        self.times = np.zeros(capacity, dtype=np.float64)
+        self.values = np.zeros((capacity, n_fields), dtype=np.float64)
+        self.head = 0  # Next slot to write
+        self.size = 0
+
+    def append(self, timestamp: float, row):
+        self.times[self.head] = timestamp
+        self.values[self.head] = row
+        self.head = (self.head + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def _segments(self) -> List[Tuple[int, int]]:
+        """Index ranges of the buffer in chronological order"""
+        if self.size < self.capacity:
+            return [(0, self.size)]
+        return [(self.head, self.capacity), (0, self.head)]
+
+    def query(self, start: float = None, end: float = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Rows with start <= timestamp <= end, oldest first
+
+        Each chronological segment is sorted, so the bounds are found by binary
+        search and only the returned rows are copied.
+        """
+        times, values = [], []
+        for lo, hi in self._segments():
+            segment = self.times[lo:hi]
+            i = lo + (np.searchsorted(segment, start, side="left") if start is not None else 0)
+            j = lo + (np.searchsorted(segment, end, side="right") if end is not None else hi - lo)
+            if i < j:
+                times.append(self.times[i:j])
+                values.append(self.values[i:j])
+        if not times:
+            return np.empty(0), np.empty((0, self.values.shape[1]))
+        return np.concatenate(times), np.concatenate(values)
+
+    def last(self) -> Optional[Tuple[float, np.ndarray]]:
+        if self.size == 0:
+            return None
+        index = (self.head - 1) % self.capacity
+        return float(self.times[index]), self.values[index].copy()
+
+    def __len__(self) -> int:
+        return self.size
+
+class MetricSeries:
+    """One metric stored at every resolution, rolling raw samples up into buckets"""
+
+    def __init__(self, capacities: Dict[str, int] = None):
+        capacities = {**DEFAULT_CAPACITIES, **(capacities or {})}
+        self.buffers = {name: RingBuffer(capacities[name]) for name in RESOLUTIONS}
+        # Open bucket per rollup resolution: [bucket_start, sum, count, min, max, last]
+        self._open: Dict[str, Optional[list]] = {
+            name: None for name, width in RESOLUTIONS.items() if width
+        }
+
+    def record(self, value: float, timestamp: float):
+        value = float(value)
+        self.buffers["raw"].append(timestamp, (value, value, value, value))
+
+        for name, bucket in self._open.items():
+            width = RESOLUTIONS[name]
+            bucket_start = timestamp - timestamp % width
+            if bucket is not None and bucket[0] != bucket_start:
+                self._flush(name, bucket)
+                bucket = None
+            if bucket is None:
+                self._open[name] = [bucket_start, value, 1, value, value, value]
+            else:
+                bucket[1] += value
+                bucket[2] += 1
+                bucket[3] = min(bucket[3], value)
+                bucket[4] = max(bucket[4], value)
+                bucket[5] = value
+
+    def _flush(self, name: str, bucket: list):
+        bucket_start, total, count, low, high, last = bucket
+        self.buffers[name].append(bucket_start, (total / count, low, high, last))
+
+    def query(self, resolution: str = "raw", start: float = None,
+              end: float = None, include_open: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+        """(timestamps, rows) at a resolution; rows hold the FIELDS columns"""
+        if resolution not in RESOLUTIONS:
+            raise ValueError(f"Unknown resolution: {resolution}")
+
+        times, values = self.buffers[resolution].query(start, end)
+        bucket = self._open.get(resolution)
+        if include_open and bucket is not None:
+            bucket_start = bucket[0]
+            if (start is None or bucket_start >= start) and (end is None or bucket_start <= end):
+                row = np.array([[bucket[1] / bucket[2], bucket[3], bucket[4], bucket[5]]])
+                times = np.append(times, bucket_start)
+                values = np.concatenate([values, row])
+        return times, values
+
+    def latest(self) -> Optional[float]:
+        last = self.buffers["raw"].last()
+        return None if last is None else float(last[1][FIELDS.index("last")])
+
+class EconomyTimeSeries:
+    """Named metric series (e.g. ``price:gold``, ``reputation:tavern``) with bounded memory"""
+
+    def __init__(self, capacities: Dict[str, int] = None):
+        self.capacities = capacities
+        self.series: Dict[str, MetricSeries] = {}
+
+    def record(self, metric: str, value: float, timestamp: float = None):
+        """Record a sample for a metric, creating its series on first use"""
+        timestamp = time.time() if timestamp is None else timestamp
+        series = self.series.get(metric)
+        if series is None:
+            series = self.series[metric] = MetricSeries(self.capacities)
+        series.record(value, timestamp)
+
+    def query(self, metric: str, resolution: str = "raw", start: float = None,
+              end: float = None, field: str = "mean") -> Tuple[np.ndarray, np.ndarray]:
+        """(timestamps, values) of one field of a metric within a time range"""
+        series = self.series.get(metric)
+        if series is None:
+            return np.empty(0), np.empty(0)
+        times, rows = series.query(resolution, start, end)
+        return times, rows[:, FIELDS.index(field)]
+
+    def latest(self, metric: str) -> Optional[float]:
+        series = self.series.get(metric)
+        return series.latest() if series else None
+
+    def metrics(self, prefix: str = "") -> List[str]:
+        return sorted(name for name in self.series if name.startswith(prefix))
@@ -0,0 +1,226 @@
+"""
+Rumor Market for the tavern economy - rumors as a decaying, expiring currency
+Keeps running totals and trader rankings incrementally so long sessions stay bounded
+"""
+
+import heapq
+import math
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Any, Optional, Tuple
+
+
+@dataclass
+class MarketRumor:
+    """Rumor traded on the tavern market"""
+    id: str
+    content: str
+    trader: str
+    base_value: float
+    timestamp: float
+    expires_at: float
+
+    def value_at(self, now: float, half_life: float) -> float:
+        """Current value of the rumor after exponential decay"""
+        age = max(0.0, now - self.timestamp)
+        return self.base_value * 0.5 ** (age / half_life)
+
+
+class RumorMarket:
+    """Bounded rumor market with value decay, heap-based expiry and trader rankings
+
+    Every rumor loses value with the same half-life, so its current value is
+    ``base_value * exp(-decay * (now - timestamp))``. Values are stored as
+    weights relative to an anchor time, which lets the market keep the total
+    rumor value and per-trader totals as plain running sums: the decayed value
+    of any sum is that sum scaled by a single factor.
+    """
+
+    # Rebase the anchor before exp() of the weight exponent gets near overflow
+    _MAX_ANCHOR_DRIFT_HALF_LIVES = 256
+
+    def __init__(self, half_life: float = 900.0, rumor_ttl: float = 3600.0,
+                 max_active: int = 500):
+        if half_life <= 0 or rumor_ttl <= 0 or max_active <= 0:
+            raise ValueError("half_life, rumor_ttl and max_active must be positive")
+
+        self.half_life = half_life
+        self.rumor_ttl = rumor_ttl
+        self.max_active = max_active
+        self._decay = math.log(2) / half_life
+
+        self.rumors: Dict[str, MarketRumor] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []  # (expires_at, rumor_id)
+
+        # Anchored weights: weight * exp(-decay * (now - anchor)) == current value
+        self._anchor: Optional[float] = None
+        self._weights: Dict[str, float] = {}
+        self._total_weight = 0.0
+
+        # Trader rankings as a heap by descending anchored weight. Updates push
+        # a new entry and leave the old one behind, to be dropped when met.
+        self._trader_weights: Dict[str, float] = {}
+        self._trader_rumors: Dict[str, List[str]] = {}
+        self._ranking: List[Tuple[float, str]] = []  # (-weight, trader), possibly stale
+
+        self.total_expired = 0
+        self._sequence = 0
+
+    def add_rumor(self, content: str, trader: str, value: float,
+                  now: float = None, ttl: float = None) -> MarketRumor:
+        """Add a rumor to the market and return its record"""
+        now = time.time() if now is None else now
+        self.expire(now)
+
+        self._sequence += 1
+        rumor = MarketRumor(
+            id=f"rumor_{int(now)}_{self._sequence}",
+            content=content,
+            trader=trader,
+            base_value=value,
+            timestamp=now,
+            expires_at=now + (self.rumor_ttl if ttl is None else ttl)
+        )
+
+        self._maybe_rebase(now)
+        weight = value * math.exp(self._decay * (now - self._anchor))
+
+        self.rumors[rumor.id] = rumor
+        self._weights[rumor.id] = weight
+        self._total_weight += weight
+        self._trader_rumors.setdefault(trader, []).append(rumor.id)
+        self._adjust_trader(trader, weight)
+        heapq.heappush(self._expiry_heap, (rumor.expires_at, rumor.id))
+
+        # Keep memory bounded: evict the rumors closest to expiring first
+        while len(self.rumors) > self.max_active:
+            _, rumor_id = heapq.heappop(self._expiry_heap)
+            self._remove(rumor_id)
+
+        return rumor
+
+    def expire(self, now: float = None) -> List[MarketRumor]:
+        """Remove every rumor whose expiry time has passed"""
+        now = time.time() if now is None else now
+        expired = []
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            _, rumor_id = heapq.heappop(self._expiry_heap)
+            rumor = self._remove(rumor_id)
+            if rumor:
+                expired.append(rumor)
+        self.total_expired += len(expired)
+        return expired
+
+    def get_rumor_value(self, rumor_id: str, now: float = None) -> float:
+        """Current decayed value of a single rumor (0 if unknown or expired)"""
+        now = time.time() if now is None else now
+        rumor = self.rumors.get(rumor_id)
+        if not rumor or rumor.expires_at <= now:
+            return 0.0
+        return rumor.value_at(now, self.half_life)
+
+    def total_value(self, now: float = None) -> float:
+        """Current decayed value of all active rumors in O(1) after expiry"""
+        now = time.time() if now is None else now
+        self.expire(now)
+        return self._total_weight * self._scale(now)
+
+    def trader_value(self, trader: str, now: float = None) -> float:
+        """Current decayed value of the active rumors held by a trader"""
+        now = time.time() if now is None else now
+        self.expire(now)
+        return self._trader_weights.get(trader, 0.0) * self._scale(now)
+
+    def top_traders(self, limit: int = 5, now: float = None) -> List[str]:
+        """Traders ranked by the current value of their active rumors
+
+        O(limit * log n) plus the cost of dropping stale entries, each once.
+        """
+        self.expire(now)
+        top: List[Tuple[float, str]] = []
+        while self._ranking and len(top) < limit:
+            entry = heapq.heappop(self._ranking)
+            neg_weight, trader = entry
+            if self._trader_weights.get(trader) == -neg_weight and all(t != trader for _, t in top):
+                top.append(entry)
+        for entry in top:
+            heapq.heappush(self._ranking, entry)
+        return [trader for _, trader in top]
+
+    def get_trader_rumors(self, trader: str) -> List[MarketRumor]:
+        """Active rumors traded by an agent"""
+        return [self.rumors[rumor_id] for rumor_id in self._trader_rumors.get(trader, [])]
+
+    def get_summary(self, now: float = None) -> Dict[str, Any]:
+        """Summary of the market for the economic overview"""
+        now = time.time() if now is None else now
+        total = self.total_value(now)
+        return {
+            "active_rumors": len(self.rumors),
+            "total_rumor_value": total,
+            "top_traders": self.top_traders(5, now),
+            "expired_rumors": self.total_expired
+        }
+
+    def __len__(self) -> int:
+        return len(self.rumors)
+
+    def _scale(self, now: float) -> float:
+        """Factor converting anchored weights into current values"""
+        if self._anchor is None:
+            return 1.0
+        return math.exp(-self._decay * (now - self._anchor))
+
+    def _remove(self, rumor_id: str) -> Optional[MarketRumor]:
+        """Drop a rumor and subtract it from the running totals"""
+        rumor = self.rumors.pop(rumor_id, None)
+        if rumor is None:
+            return None
+
+        weight = self._weights.pop(rumor_id)
+        self._total_weight -= weight
+        if not self.rumors:
+            self._total_weight = 0.0  # Discard accumulated float error
+
+        trader_rumors = self._trader_rumors[rumor.trader]
+        trader_rumors.remove(rumor_id)
+        if trader_rumors:
+            self._adjust_trader(rumor.trader, -weight)
+        else:
+            del self._trader_rumors[rumor.trader]
+            self._set_trader_weight(rumor.trader, None)
+
+        return rumor
+
+    def _adjust_trader(self, trader: str, delta: float):
+        """Add delta to a trader's anchored weight and re-rank them"""
+        self._set_trader_weight(trader, max(0.0, self._trader_weights.get(trader, 0.0) + delta))
+
+    def _set_trader_weight(self, trader: str, weight: Optional[float]):
+        """Re-rank a trader in O(log n) (None removes them)"""
+        self._trader_weights.pop(trader, None)
+        if weight is not None:
+            self._trader_weights[trader] = weight
+            heapq.heappush(self._ranking, (-weight, trader))
+        if len(self._ranking) > 2 * len(self._trader_weights) + 64:
+            self._rebuild_ranking()
+
+    def _rebuild_ranking(self):
+        """Drop stale ranking entries, keeping the heap within a constant factor of the traders"""
+        self._ranking = [(-w, t) for t, w in self._trader_weights.items()]
+        heapq.heapify(self._ranking)
+
+    def _maybe_rebase(self, now: float):
+        """Move the anchor forward so stored weights stay in float range"""
+        if self._anchor is None:
+            self._anchor = now
+            return
+        if abs(now - self._anchor) < self._MAX_ANCHOR_DRIFT_HALF_LIVES * self.half_life:
+            return
+
+        factor = self._scale(now)
+        self._anchor = now
+        self._weights = {rumor_id: w * factor for rumor_id, w in self._weights.items()}
+        self._total_weight = sum(self._weights.values())
+        self._trader_weights = {t: w * factor for t, w in self._trader_weights.items()}
+        self._rebuild_ranking()
@@ -5,12 +5,26 @@ Integrates with narrative engine and agent memory for dynamic economic consequen
 
 import time
 import random
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, asdict
 from enum import Enum
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from .agent_memory import AgentMemorySystem, MemoryType, MemoryImportance
+from .rumor_market import RumorMarket
+from .economy_timeseries import EconomyTimeSeries
+from .economy_persistence import EconomySnapshotStore
+
+if TYPE_CHECKING:
+    from .economy_forecast import EconomicForecast
+
+# Odds and ranges of the random economic events (shared with the forecaster)
+MARKET_FLUCTUATION_CHANCE = 0.3
+MARKET_FLUCTUATION_RANGE = (-0.2, 0.3)
+REPUTATION_EVENT_CHANCE = 0.2
+REPUTATION_EVENT_RANGE = (-10, 15)
+SUPPLY_EVENT_CHANCE = 0.25
+SUPPLY_EVENT_RANGE = (-20, 25)
 
 class ResourceType(Enum):
     GOLD = "gold"
@@ -77,15 +91,17 @@ class TavernEconomicState:
 class TavernEconomySystem:
     """Comprehensive tavern economy management system"""
     
-    def __init__(self, memory_system: AgentMemorySystem = None):
+    def __init__(self, memory_system: AgentMemorySystem = None,
+                 persistence_dir: str = None, snapshot_every: int = 1000):
         self.memory_system = memory_system or AgentMemorySystem()
         self.economic_state = TavernEconomicState()
         
         # Resource inventories by agent
         self.agent_resources: Dict[str, Dict[ResourceType, float]] = {}
         
-        # Transaction history
+        # Transaction history (after a restore only the replayed tail is kept)
         self.transaction_history: List[Transaction] = []
+        self.transaction_count = 0
         
         # Market prices (base values)
         self.market_prices = {
@@ -97,15 +113,23 @@ class TavernEconomySystem:
             ResourceType.FAVORS: 20.0  # Gold per favor
         }
         
-        # Rumor economy - rumors as currency
-        self.rumor_market = {
-            "active_rumors": [],
-            "rumor_values": {},  # rumor_id -> value
-            "rumor_traders": {},  # agent_id -> [rumor_ids]
-        }
+        # Rumor economy - rumors as currency that decays and expires
+        self.rumor_market = RumorMarket()
+        
+        # Price, reputation and supply history for trend charts
+        self.time_series = EconomyTimeSeries()
         
         # Initialize agent resources
         self._initialize_agent_resources()
+        
+        # Snapshot + event log persistence, restored on startup when present
+        self.persistence: Optional[EconomySnapshotStore] = None
+        if persistence_dir:
+            self.persistence = EconomySnapshotStore(persistence_dir, snapshot_every)
+            if self.persistence.has_state():
+                self.persistence.restore(self)
+        
+        self._record_initial_series()
     
     def _initialize_agent_resources(self):
         """Initialize starting resources for all 17 agents"""
@@ -114,6 +138,14 @@ class TavernEconomySystem:
         for agent, resources in agent_starting_resources.items():
             self.agent_resources[agent] = resources.copy()
 
+    def _record_initial_series(self):
+        """Seed the time series with the starting market and tavern state"""
+        now = time.time()
+        for resource_type, price in self.market_prices.items():
+            self.time_series.record(f"price:{resource_type.value}", price, now)
+        self.time_series.record("reputation:tavern", self.economic_state.reputation_score, now)
+        self.time_series.record("supply_quality", self.economic_state.supply_quality, now)
+
     def _get_17_agent_resources(self) -> Dict[str, Dict[ResourceType, float]]:
         """Get starting resources for all 17 agents organized by faction"""
         return {
@@ -226,6 +258,8 @@ class TavernEconomySystem:
                 consequences=["Transaction validation failed"]
             )
             self.transaction_history.append(transaction)
+            self.transaction_count += 1
+            self._persist_event("transaction", [], transaction)
             return transaction
         
         # Execute resource transfers
@@ -249,6 +283,7 @@ class TavernEconomySystem:
         )
         
         self.transaction_history.append(transaction)
+        self.transaction_count += 1
         
         # Store in agent memories
         self._record_transaction_in_memory(transaction)
@@ -256,6 +291,8 @@ class TavernEconomySystem:
         # Update economic state
         self._update_economic_state(transaction)
         
+        self._persist_event("transaction", participants, transaction)
+        
         return transaction
     
     def trade_rumor_for_resources(self, trader: str, rumor_content: str, 
@@ -274,20 +311,7 @@ class TavernEconomySystem:
             self.agent_resources[trader][target_resource] += target_amount
             
             # Add rumor to market
-            rumor_id = f"rumor_{int(time.time())}_{random.randint(100, 999)}"
-            self.rumor_market["active_rumors"].append({
-                "id": rumor_id,
-                "content": rumor_content,
-                "trader": trader,
-                "value": rumor_value,
-                "timestamp": time.time()
-            })
-            
-            self.rumor_market["rumor_values"][rumor_id] = rumor_value
-            
-            if trader not in self.rumor_market["rumor_traders"]:
-                self.rumor_market["rumor_traders"][trader] = []
-            self.rumor_market["rumor_traders"][trader].append(rumor_id)
+            self.rumor_market.add_rumor(rumor_content, trader, rumor_value)
             
             # Record transaction
             transaction = self.execute_transaction(
@@ -339,11 +363,12 @@ class TavernEconomySystem:
         events = []
         
         # Market fluctuations
-        if random.random() < 0.3:
+        if random.random() < MARKET_FLUCTUATION_CHANCE:
             resource_type = random.choice(list(ResourceType))
-            change = random.uniform(-0.2, 0.3)
+            change = random.uniform(*MARKET_FLUCTUATION_RANGE)
             old_price = self.market_prices[resource_type]
             self.market_prices[resource_type] *= (1 + change)
+            self.time_series.record(f"price:{resource_type.value}", self.market_prices[resource_type])
             
             events.append({
                 "type": "market_fluctuation",
@@ -355,10 +380,11 @@ class TavernEconomySystem:
             })
         
         # Reputation events
-        if random.random() < 0.2:
-            reputation_change = random.uniform(-10, 15)
+        if random.random() < REPUTATION_EVENT_CHANCE:
+            reputation_change = random.uniform(*REPUTATION_EVENT_RANGE)
             self.economic_state.reputation_score += reputation_change
             self.economic_state.reputation_score = max(0, min(100, self.economic_state.reputation_score))
+            self.time_series.record("reputation:tavern", self.economic_state.reputation_score)
             
             events.append({
                 "type": "reputation_event",
@@ -368,10 +394,11 @@ class TavernEconomySystem:
             })
         
         # Supply events
-        if random.random() < 0.25:
-            supply_change = random.uniform(-20, 25)
+        if random.random() < SUPPLY_EVENT_CHANCE:
+            supply_change = random.uniform(*SUPPLY_EVENT_RANGE)
             self.economic_state.supply_quality += supply_change
             self.economic_state.supply_quality = max(0, min(100, self.economic_state.supply_quality))
+            self.time_series.record("supply_quality", self.economic_state.supply_quality)
             
             events.append({
                 "type": "supply_event",
@@ -380,8 +407,33 @@ class TavernEconomySystem:
                 "description": f"Supply quality {'improved' if supply_change > 0 else 'deteriorated'}"
             })
         
+        if events:
+            self._persist_event("market_events")
+        
         return events
     
+    def forecast_economy(self, n_ticks: int = 1000, n_paths: int = 10000,
+                         seed: Optional[int] = None) -> 'EconomicForecast':
+        """Monte-Carlo forecast of prices, reputation and supplies from the current state"""
+        from .economy_forecast import EconomyForecaster
+        return EconomyForecaster(self, seed=seed).forecast(n_ticks=n_ticks, n_paths=n_paths)
+
+    def save_snapshot(self) -> bool:
+        """Write a persistence snapshot now (no-op without persistence)"""
+        if not self.persistence:
+            return False
+        self.persistence.save_snapshot(self)
+        return True
+
+    def _persist_event(self, kind: str, agents: List[str] = None, transaction: Transaction = None):
+        """Append a change to the persistence log without failing the caller"""
+        if not self.persistence:
+            return
+        try:
+            self.persistence.append_event(self, kind, agents, transaction)
+        except OSError as e:
+            print(f"Warning: Could not persist economy event: {e}")
+
     def _validate_transaction(self, participants: List[str], 
                             resources: Dict[ResourceType, float]) -> bool:
         """Validate if transaction is possible"""
@@ -478,6 +530,8 @@ class TavernEconomySystem:
         effect = reputation_effects.get(transaction.transaction_type, 0.0)
         self.economic_state.reputation_score += effect
         self.economic_state.reputation_score = max(0, min(100, self.economic_state.reputation_score))
+        if effect:
+            self.time_series.record("reputation:tavern", self.economic_state.reputation_score)
     
     def _evaluate_rumor_value(self, rumor_content: str, trader: str) -> float:
         """Evaluate the economic value of a rumor"""
@@ -595,6 +649,7 @@ class TavernEconomySystem:
         old_reputation = self.economic_state.reputation_score
         self.economic_state.reputation_score += total_reputation_change
         self.economic_state.reputation_score = max(0, min(100, self.economic_state.reputation_score))
+        self.time_series.record("reputation:tavern", self.economic_state.reputation_score)
 
         reputation_changes["tavern"] = total_reputation_change
 
@@ -613,6 +668,8 @@ class TavernEconomySystem:
                 self.agent_resources[participant][ResourceType.REPUTATION] += agent_change
                 self.agent_resources[participant][ResourceType.REPUTATION] = max(0, min(100,
                     self.agent_resources[participant][ResourceType.REPUTATION]))
+                self.time_series.record(f"reputation:{participant}",
+                                        self.agent_resources[participant][ResourceType.REPUTATION])
 
                 reputation_changes[participant] = agent_change
 
@@ -631,6 +688,8 @@ class TavernEconomySystem:
             tags=["reputation", "event_impact", event_type]
         )
 
+        self._persist_event("reputation_event", participants)
+
         return reputation_changes
 
     def get_economic_summary(self) -> Dict[str, Any]:
@@ -642,11 +701,7 @@ class TavernEconomySystem:
                 agent: self.get_agent_wealth_status(agent)
                 for agent in self.agent_resources.keys()
             },
-            "rumor_market": {
-                "active_rumors": len(self.rumor_market["active_rumors"]),
-                "total_rumor_value": sum(self.rumor_market["rumor_values"].values()),
-                "top_traders": list(self.rumor_market["rumor_traders"].keys())[:5]
-            },
+            "rumor_market": self.rumor_market.get_summary(),
             "recent_transactions": len([t for t in self.transaction_history if time.time() - t.timestamp < 3600]),
             "economic_metrics": {
                 "total_wealth_in_circulation": sum(
@@ -655,7 +710,7 @@ class TavernEconomySystem:
                 "average_reputation": sum(
                     resources[ResourceType.REPUTATION] for resources in self.agent_resources.values()
                 ) / len(self.agent_resources),
-                "market_activity": len(self.transaction_history)
+                "market_activity": self.transaction_count
             }
         }
 
@@ -666,4 +721,8 @@ tavern_economy = TavernEconomySystem()
 def cleanup_economy_system():
     """Save economic state before shutdown"""
     tavern_economy.memory_system.save_memories()
-    print("💰 Economic state saved successfully")
+    # The shared instance has no persistence directory unless one is configured for it
+    if tavern_economy.save_snapshot():
+        print("💰 Economic state saved successfully")
+    else:
+        print("💰 Agent memories saved (economy persistence not configured)")
@@ -309,13 +309,11 @@ def apply_agent_effects_to_tavern(effects: dict):
     if not st.session_state.simulator.current_tavern:
         return
     
-    tavern = st.session_state.simulator.current_tavern
-    
-    for effect_type, effect_value in effects.items():
-        if effect_type == "tension_change":
-            tavern.tension_level = max(0, min(100, tavern.tension_level + effect_value))
-        elif effect_type == "reputation_change":
-            tavern.reputation = max(0, min(100, tavern.reputation + effect_value))
+    # Through the simulator, so the change is journaled for replay
+    st.session_state.simulator.adjust_tavern(
+        tension_change=effects.get("tension_change", 0),
+        reputation_change=effects.get("reputation_change", 0)
+    )
 
 def trigger_agent_animations(agent_actions: dict):
     """Trigger animations based on agent actions"""
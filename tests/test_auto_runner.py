@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Test the background simulation runner and its snapshots
+"""
+
+import dataclasses
+import os
+import sys
+import tempfile
+import time
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.auto_runner import AutoRunner, RECENT_INTERACTIONS, take_snapshot
+from core.tavern_simulator import TavernSimulator
+
+def test_snapshot_copies_state():
+    """Snapshots hold copies of the simulator's state and are immutable"""
+    print("📷 Testing Snapshots")
+    simulator = TavernSimulator(seed=4)
+    simulator.generate_new_tavern()
+    simulator.advance_turns(10)
+    snapshot = take_snapshot(simulator, log_cursor=0)
+
+    tavern = simulator.current_tavern
+    assert snapshot.turn == 10 and snapshot.tavern.tension_level == tavern.tension_level
+    assert [p.name for p in snapshot.patrons] == [c.name for c in tavern.characters]
+    assert not set(snapshot.available_characters) & {c.name for c in tavern.characters}
+    assert [r.render() for r in snapshot.log_records] == simulator.get_session_log()
+    assert snapshot.log_cursor == simulator.log_store.next_seq
+    try:
+        snapshot.turn = 0
+        assert False, "snapshots should be frozen"
+    except dataclasses.FrozenInstanceError:
+        pass
+
+    # Edges are only recomputed when relationships or the crowd changed
+    again = take_snapshot(simulator, previous=snapshot)
+    assert again.relationship_edges is snapshot.relationship_edges and again.log_records == ()
+    simulator.current_tavern.relationships.modify(tavern.characters[0].name, tavern.characters[1].name, 1)
+    assert take_snapshot(simulator, previous=snapshot).graph_key != snapshot.graph_key
+
+def test_runner_publishes_turns():
+    """The worker runs turns at about the set rate and loses no log records"""
+    print("🏃 Testing Auto-Run")
+    simulator = TavernSimulator(seed=4)
+    simulator.generate_new_tavern()
+    runner = AutoRunner(simulator, turns_per_second=400)
+    runner.start()
+
+    snapshots, records = [], []
+    deadline = time.monotonic() + 0.6
+    while time.monotonic() < deadline:
+        snapshot = runner.poll()
+        if snapshot:
+            snapshots.append(snapshot)
+            records.extend(snapshot.log_records)
+        time.sleep(0.1)
+    runner.stop()
+    assert not runner.running and runner.error is None
+    last = runner.poll()
+    if last:
+        snapshots.append(last)
+        records.extend(last.log_records)
+
+    turns = [s.turn for s in snapshots]
+    assert turns == sorted(turns) and 50 < turns[-1] <= 400
+    assert turns[-1] == simulator.turn_counter
+    assert [r.seq for r in records] == list(range(len(records)))
+    assert records[-1].seq + 1 == snapshots[-1].log_cursor == simulator.log_store.next_seq
+
+    # Running on a thread plays the same turns as running directly
+    direct = TavernSimulator(seed=4)
+    direct.generate_new_tavern()
+    direct.advance_turns(simulator.turn_counter)
+    assert direct.get_character_relationships() == simulator.get_character_relationships()
+    assert direct.current_tavern.tension_level == simulator.current_tavern.tension_level
+
+def test_reset_log_starts_records_over():
+    """After reset_log the runner publishes the log from the new cursor, once"""
+    print("🔁 Testing Log Reset")
+    simulator = TavernSimulator(seed=4)
+    simulator.generate_new_tavern()
+    runner = AutoRunner(simulator, turns_per_second=400)
+    runner.start()
+    time.sleep(0.3)
+    runner.reset_log(0)
+    time.sleep(0.3)
+    runner.stop()
+
+    snapshot = runner.poll()
+    seqs = [r.seq for r in snapshot.log_records]
+    assert seqs == list(range(simulator.log_store.next_seq))
+    assert snapshot.log_cursor == simulator.log_store.next_seq
+
+def test_snapshot_keeps_history_lazy():
+    """Snapshots of a loaded session read only the newest saved interactions"""
+    print("💤 Testing Lazy History in Snapshots")
+    simulator = TavernSimulator(seed=4)
+    simulator.generate_new_tavern()
+    while len(simulator.interaction_history) < 2 * RECENT_INTERACTIONS:
+        simulator.advance_turn()
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = simulator.save_session(os.path.join(tmp, "lazy.tavern"))
+        restored = TavernSimulator()
+        assert restored.load_session(filename)
+        snapshot = take_snapshot(restored)
+        assert restored._history_loader is not None
+        assert snapshot.interaction_count == len(simulator.interaction_history)
+        assert [i.to_dict() for i in snapshot.recent_interactions] == \
+            [i.to_dict() for i in simulator.interaction_history[-RECENT_INTERACTIONS:]]
+
+        # New interactions come after the saved tail
+        while restored.interaction_count() == len(simulator.interaction_history):
+            restored.advance_turn()
+        recent = restored.recent_interactions(RECENT_INTERACTIONS)
+        assert len(recent) == RECENT_INTERACTIONS and restored._history_loader is not None
+        assert recent == restored.interaction_history[-RECENT_INTERACTIONS:]
+
+if __name__ == "__main__":
+    test_snapshot_copies_state()
+    test_runner_publishes_turns()
+    test_reset_log_starts_records_over()
+    test_snapshot_keeps_history_lazy()
+    print("\n🎉 Auto-run tests passed!")
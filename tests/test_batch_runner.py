@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+Test the headless batch simulation runner
+"""
+
+import os
+import sys
+
+import numpy as np
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.batch_runner import run_batch, simulate_tavern
+
+def test_batch_metrics_shape():
+    """Every tavern reports one metric per turn"""
+    print("🏭 Testing Batch Runner")
+    result = run_batch(n_taverns=4, n_turns=25, seed=3, max_workers=2)
+
+    assert len(result.runs) == 4
+    assert [run.tavern_index for run in result.runs] == [0, 1, 2, 3]
+    assert result.tension_matrix().shape == (4, 25)
+    assert all(run.tension.max() <= 100 for run in result.runs)
+    assert result.turns_per_sec > 0
+    print(f"   {result.summary()}")
+
+def test_batch_is_reproducible():
+    """Same seed gives the same metrics regardless of worker count"""
+    print("🎲 Testing Batch Reproducibility")
+    single = run_batch(n_taverns=3, n_turns=30, seed=11, max_workers=1)
+    pooled = run_batch(n_taverns=3, n_turns=30, seed=11, max_workers=2)
+
+    for a, b in zip(single.runs, pooled.runs):
+        assert a.tavern_name == b.tavern_name
+        assert np.array_equal(a.tension, b.tension)
+        assert np.array_equal(a.relationship_delta, b.relationship_delta)
+
+    assert simulate_tavern(0, 30, 12).seed != single.runs[0].seed
+
+if __name__ == "__main__":
+    test_batch_metrics_shape()
+    test_batch_is_reproducible()
+    print("\n🎉 Batch runner tests passed!")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test the indexed character roster of a tavern
+"""
+
+import os
+import random
+import sys
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.character_generator import CharacterGenerator
+from core.tavern import Tavern
+from core.tavern_generator import TavernGenerator
+
+def _tavern_with_characters():
+    tavern = TavernGenerator(rng=random.Random(3)).generate_tavern()
+    tavern.capacity = 20
+    characters = CharacterGenerator().get_all_characters()
+    for character in characters:
+        tavern.add_character(character)
+    return tavern, characters
+
+def test_index_follows_adds_and_removes():
+    """Name lookups and membership stay in step with the ordered list"""
+    print("📇 Testing Character Roster Index")
+    tavern, characters = _tavern_with_characters()
+    assert list(tavern.characters) == characters
+    assert tavern.characters[:2] == characters[:2]
+
+    leaving = characters[1]
+    assert tavern.remove_character(leaving)
+    assert leaving not in tavern.characters
+    assert tavern.get_character_by_name(leaving.name) is None
+    assert not tavern.remove_character(leaving)
+    assert tavern.current_occupancy == len(characters) - 1
+    assert list(tavern.characters) == characters[:1] + characters[2:]
+
+    assert tavern.add_character(leaving)
+    assert tavern.characters[-1] is leaving
+    assert tavern.get_character_by_name(leaving.name) is leaving
+
+def test_duplicate_names_are_rejected():
+    """A second character with a name already present can't enter"""
+    print("🚪 Testing Duplicate Names")
+    tavern, characters = _tavern_with_characters()
+    duplicate = CharacterGenerator().get_all_characters()[0]
+    assert duplicate.name == characters[0].name
+    assert not tavern.add_character(duplicate)
+    assert duplicate not in tavern.characters
+    assert tavern.get_character_by_name(duplicate.name) is characters[0]
+
+def test_roster_is_read_only_and_round_trips():
+    """The roster can't be mutated directly and survives serialization"""
+    print("🔒 Testing Read-Only Roster")
+    tavern, characters = _tavern_with_characters()
+    assert not hasattr(tavern.characters, "append")
+    restored = Tavern.from_dict(tavern.to_dict())
+    assert [c.name for c in restored.characters] == [c.name for c in characters]
+    assert restored.get_character_by_name(characters[-1].name) is restored.characters[-1]
+    assert len(random.Random(0).sample(tavern.characters, 2)) == 2
+
+if __name__ == "__main__":
+    test_index_follows_adds_and_removes()
+    test_duplicate_names_are_rejected()
+    test_roster_is_read_only_and_round_trips()
+    print("\n🎉 Character roster tests passed!")
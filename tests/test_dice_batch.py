@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Test vectorized batch skill checks
+"""
+
+import os
+import random
+import sys
+
+import numpy as np
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.dice_system import DiceSystem
+
+def test_batch_skill_check_rules():
+    """Batch checks follow the same rules as single skill checks"""
+    print("🎲 Testing Batch Skill Checks")
+    dice = DiceSystem(rng=random.Random(7))
+    result = dice.batch_skill_check(np.arange(100_000) % 10, 2, 15)
+
+    assert len(result) == 100_000
+    assert result.rolls.min() >= 1 and result.rolls.max() <= 20
+    assert np.array_equal(result.totals, result.rolls + result.modifiers)
+    assert result.success[result.critical_success].all()
+    assert not result.success[result.critical_failure].any()
+
+    normal = ~(result.critical_success | result.critical_failure)
+    assert np.array_equal(result.success[normal], (result.totals >= 15)[normal])
+
+    single = result[0]
+    assert single.modifier == 2 and single.difficulty == 15
+    assert 0.0 < result.success_rate() < 1.0
+
+def test_batch_is_reproducible():
+    """The NumPy generator is derived from the injected scalar RNG"""
+    print("🔁 Testing Batch Reproducibility")
+    first = DiceSystem(rng=random.Random(42)).batch_skill_check([5] * 1000, 0, 12)
+    second = DiceSystem(rng=random.Random(42)).batch_skill_check([5] * 1000, 0, 12)
+    assert np.array_equal(first.rolls, second.rolls)
+
+def test_batch_opposed_check():
+    """Criticals decide opposed checks before totals do"""
+    print("⚔️ Testing Batch Opposed Checks")
+    dice = DiceSystem(rng=random.Random(3))
+    side1, side2, wins = dice.batch_opposed_check(np.full(50_000, 10), np.full(50_000, 0))
+
+    assert wins[side1.critical_success & ~side2.critical_success].all()
+    assert not wins[side2.critical_success & ~side1.critical_success].any()
+    assert wins.mean() > 0.5  # +10 skill should win most contests
+
+if __name__ == "__main__":
+    test_batch_skill_check_rules()
+    test_batch_is_reproducible()
+    test_batch_opposed_check()
+    print("\n🎉 Dice batch tests passed!")
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Tavern Economy benchmark suite - throughput, latency scaling and memory per transaction
+
+The benchmarks are marked slow, which the default pytest options deselect. Run them offline
+under pytest (``pytest -m slow tests/test_economy_benchmarks.py``) or directly:
+
+    python tests/test_economy_benchmarks.py --save-baseline    # record a JSON baseline
+    python tests/test_economy_benchmarks.py --compare          # fail on regressions
+    python tests/test_economy_benchmarks.py --full             # history sizes up to 1M
+
+Under pytest, set ECONOMY_BENCH_SIZES (e.g. "1000,10000,100000,1000000") to change the
+history sizes, ECONOMY_BENCH_COMPARE=1 to check results against the saved baseline and
+ECONOMY_BENCH_SAVE=1 to save them as the new baseline. ECONOMY_BENCH_BASELINE points these and
+the --compare and --save-baseline options at another baseline file than
+tests/benchmarks/economy_baseline.json.
+"""
+
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Any
+
+import pytest
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.agent_memory import AgentMemorySystem
+from services.tavern_economy import TavernEconomySystem, ResourceType, TransactionType, Transaction
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "economy_baseline.json")
+QUICK_SIZES = [1_000, 10_000]
+FULL_SIZES = [1_000, 10_000, 100_000, 1_000_000]
+# A result regresses when it is this many times slower (or larger) than the baseline
+DEFAULT_TOLERANCE = 1.5
+
+class EconomyBenchmark:
+    """Minimal pytest-benchmark style runner collecting timing statistics"""
+
+    def __init__(self):
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    def run(self, name: str, func: Callable[[], Any], rounds: int = 5,
+            warmup: int = 1, ops_per_round: int = 1) -> Dict[str, Any]:
+        """Time func over several rounds; ops_per_round turns rounds into ops/sec"""
+        for _ in range(warmup):
+            func()
+
+        timings = []
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for _ in range(rounds):
+                start = time.perf_counter()
+                func()
+                timings.append(time.perf_counter() - start)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+
+        result = {
+            "min": min(timings),
+            "mean": statistics.mean(timings),
+            "median": statistics.median(timings),
+            "stddev": statistics.stdev(timings) if len(timings) > 1 else 0.0,
+            "rounds": rounds,
+            "ops_per_sec": ops_per_round / statistics.median(timings)
+        }
+        self.results[name] = result
+        print(f"   {name}: median {result['median'] * 1000:.3f} ms, {result['ops_per_sec']:.1f} ops/s")
+        return result
+
+    def record(self, name: str, **values):
+        """Store a non-timing measurement (e.g. memory)"""
+        self.results[name] = values
+        print(f"   {name}: {values}")
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "results": self.results
+        }
+
+    def save(self, path: str = BASELINE_PATH):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        print(f"💾 Benchmark baseline written to {path}")
+
+    def compare(self, path: str = BASELINE_PATH, tolerance: float = DEFAULT_TOLERANCE) -> List[str]:
+        """Names of results that regressed against a saved baseline
+
+        Raises FileNotFoundError when there is no baseline to compare with.
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"No benchmark baseline at {path}; record one with --save-baseline")
+        with open(path, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)["results"]
+
+        regressions = []
+        for name, result in self.results.items():
+            old = baseline.get(name)
+            if not old:
+                continue
+            if "median" in result and result["median"] > old["median"] * tolerance:
+                regressions.append(f"{name}: {old['median']:.6f}s -> {result['median']:.6f}s")
+            if "bytes_per_transaction" in result and \
+                    result["bytes_per_transaction"] > old["bytes_per_transaction"] * tolerance:
+                regressions.append(
+                    f"{name}: {old['bytes_per_transaction']:.0f}B -> {result['bytes_per_transaction']:.0f}B"
+                )
+        return regressions
+
+def make_economy(memory_dir: str) -> TavernEconomySystem:
+    return TavernEconomySystem(memory_system=AgentMemorySystem(memory_dir=memory_dir))
+
+def fill_history(economy: TavernEconomySystem, size: int, seed: int = 0):
+    """Fill transaction history with synthetic records without executing them
+
+    Participants, resources and consequences are shared objects so a million
+    records stays affordable in memory.
+    """
+    rng = random.Random(seed)
+    agents = list(economy.agent_resources.keys())
+    pairs = [[a, b] for a in agents for b in agents if a != b]
+    resources = {ResourceType.GOLD: 1.0}
+    consequences: List[str] = []
+    types = list(TransactionType)
+    start = time.time() - size
+
+    economy.transaction_history = [
+        Transaction(
+            id=f"txn_bench_{i}",
+            transaction_type=types[i % len(types)],
+            participants=rng.choice(pairs),
+            resources_exchanged=resources,
+            description="benchmark transaction",
+            timestamp=start + i,
+            success=True,
+            consequences=consequences
+        )
+        for i in range(size)
+    ]
+    economy.transaction_count = size
+
+def _trade_once(economy: TavernEconomySystem, agents: List[str], rng: random.Random):
+    giver, receiver = rng.sample(agents, 2)
+    economy.execute_transaction(
+        TransactionType.PURCHASE, [giver, receiver], {ResourceType.GOLD: 0.01}, "benchmark trade"
+    )
+
+def bench_execute_transaction(bench: EconomyBenchmark, n_transactions: int = 2_000):
+    """Transactions per second through execute_transaction"""
+    print("💸 execute_transaction throughput")
+    with tempfile.TemporaryDirectory() as memory_dir:
+        economy = make_economy(memory_dir)
+        agents = list(economy.agent_resources.keys())
+        rng = random.Random(1)
+
+        def run():
+            for _ in range(n_transactions):
+                _trade_once(economy, agents, rng)
+
+        return bench.run("execute_transaction", run, rounds=3, ops_per_round=n_transactions)
+
+def bench_query_latency(bench: EconomyBenchmark, sizes: List[int]):
+    """Latency of the summary and wealth queries as history grows"""
+    print("📊 Query latency vs. history size")
+    with tempfile.TemporaryDirectory() as memory_dir:
+        economy = make_economy(memory_dir)
+        for size in sizes:
+            fill_history(economy, size)
+            rounds = 5 if size <= 10_000 else 2
+            bench.run(f"get_agent_wealth_status[{size}]",
+                      lambda: economy.get_agent_wealth_status("Karczmarz"), rounds=rounds)
+            bench.run(f"get_economic_summary[{size}]",
+                      economy.get_economic_summary, rounds=rounds, warmup=0 if size > 100_000 else 1)
+        economy.transaction_history = []
+
+def bench_memory_per_transaction(bench: EconomyBenchmark, n_transactions: int = 2_000):
+    """Bytes retained per executed transaction (history + agent memories)"""
+    print("🧠 Memory per transaction")
+    with tempfile.TemporaryDirectory() as memory_dir:
+        economy = make_economy(memory_dir)
+        agents = list(economy.agent_resources.keys())
+        rng = random.Random(2)
+
+        gc.collect()
+        tracemalloc.start()
+        before, _ = tracemalloc.get_traced_memory()
+        for _ in range(n_transactions):
+            _trade_once(economy, agents, rng)
+        gc.collect()
+        after, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        bench.record("memory_per_transaction",
+                     bytes_per_transaction=(after - before) / n_transactions,
+                     peak_bytes=peak, transactions=n_transactions)
+
+def run_suite(sizes: List[int]) -> EconomyBenchmark:
+    bench = EconomyBenchmark()
+    bench_execute_transaction(bench)
+    bench_query_latency(bench, sizes)
+    bench_memory_per_transaction(bench)
+    return bench
+
+def _env_sizes() -> List[int]:
+    raw = os.getenv("ECONOMY_BENCH_SIZES")
+    return [int(size) for size in raw.split(",")] if raw else QUICK_SIZES
+
+def _env_baseline() -> str:
+    return os.getenv("ECONOMY_BENCH_BASELINE") or BASELINE_PATH
+
+@pytest.fixture(scope="module")
+def economy_bench():
+    bench = EconomyBenchmark()
+    yield bench
+    if os.getenv("ECONOMY_BENCH_SAVE") == "1":
+        bench.save(_env_baseline())
+
+def _check_regressions(bench: EconomyBenchmark):
+    if os.getenv("ECONOMY_BENCH_COMPARE") == "1":
+        path = _env_baseline()
+        if not os.path.exists(path):
+            pytest.skip(f"ECONOMY_BENCH_COMPARE=1 but there is no baseline at {path}")
+        regressions = bench.compare(path)
+        assert not regressions, "Economy benchmark regressions:\n" + "\n".join(regressions)
+
+@pytest.mark.slow
+def test_execute_transaction_throughput(economy_bench):
+    result = bench_execute_transaction(economy_bench)
+    assert result["ops_per_sec"] > 0
+    _check_regressions(economy_bench)
+
+@pytest.mark.slow
+def test_query_latency_scaling(economy_bench):
+    sizes = _env_sizes()
+    bench_query_latency(economy_bench, sizes)
+    assert f"get_economic_summary[{sizes[-1]}]" in economy_bench.results
+    _check_regressions(economy_bench)
+
+@pytest.mark.slow
+def test_memory_per_transaction(economy_bench):
+    bench_memory_per_transaction(economy_bench)
+    assert economy_bench.results["memory_per_transaction"]["bytes_per_transaction"] > 0
+    _check_regressions(economy_bench)
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Tavern economy benchmarks")
+    parser.add_argument("--full", action="store_true", help="history sizes up to 1M transactions")
+    parser.add_argument("--save-baseline", action="store_true",
+                        help="write results to $ECONOMY_BENCH_BASELINE or tests/benchmarks/economy_baseline.json")
+    parser.add_argument("--compare", action="store_true", help="exit non-zero on regressions")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    args = parser.parse_args()
+
+    print("💰 Tavern Economy Benchmark Suite")
+    print("=" * 40)
+    suite = run_suite(FULL_SIZES if args.full else QUICK_SIZES)
+
+    baseline = _env_baseline()
+    exit_code = 0
+    if args.compare:
+        if not os.path.exists(baseline):
+            print(f"❌ No baseline at {baseline}; record one with --save-baseline")
+            sys.exit(2)
+        regressions = suite.compare(baseline, tolerance=args.tolerance)
+        for regression in regressions:
+            print(f"❌ Regression: {regression}")
+        exit_code = 1 if regressions else 0
+        if not regressions:
+            print("✅ No regressions against baseline")
+    if args.save_baseline:
+        suite.save(baseline)
+    sys.exit(exit_code)
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test vectorized Monte-Carlo economic forecasting
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.agent_memory import AgentMemorySystem
+from services.tavern_economy import TavernEconomySystem, ResourceType
+from services.economy_forecast import EconomyForecaster
+
+def _make_economy(memory_dir: str) -> TavernEconomySystem:
+    return TavernEconomySystem(memory_system=AgentMemorySystem(memory_dir=memory_dir))
+
+def test_forecast_bands():
+    """Forecast produces ordered quantile bands within the economy bounds"""
+    print("📈 Testing Economic Forecast Bands")
+    with tempfile.TemporaryDirectory() as memory_dir:
+        economy = _make_economy(memory_dir)
+        initial_prices = dict(economy.market_prices)
+
+        forecast = EconomyForecaster(economy, seed=7).forecast(n_ticks=200, n_paths=2000, record_every=50)
+
+        assert forecast.ticks.tolist() == [0, 50, 100, 150, 200]
+        assert forecast.price_bands.shape == (5, 5, len(ResourceType))
+        assert np.all(np.diff(forecast.reputation_bands, axis=1) >= 0)
+        assert forecast.final_reputation.min() >= 0 and forecast.final_reputation.max() <= 100
+        assert forecast.final_supply.min() >= 0 and forecast.final_supply.max() <= 100
+        assert np.allclose(forecast.price_band(ResourceType.GOLD)[0], initial_prices[ResourceType.GOLD])
+
+        # The live economy is left untouched
+        assert economy.market_prices == initial_prices
+        print(f"   P(reputation < 25): {forecast.probability_reputation_below(25):.2%}")
+
+def test_forecast_is_seeded():
+    """Identical seeds give identical futures"""
+    print("🎲 Testing Forecast Determinism")
+    with tempfile.TemporaryDirectory() as memory_dir:
+        economy = _make_economy(memory_dir)
+
+        first = economy.forecast_economy(n_ticks=50, n_paths=500, seed=42)
+        second = economy.forecast_economy(n_ticks=50, n_paths=500, seed=42)
+
+        assert np.array_equal(first.final_prices, second.final_prices)
+        assert np.array_equal(first.final_supply, second.final_supply)
+        assert first.to_dict()["market_prices"].keys() == {rt.value for rt in ResourceType}
+
+if __name__ == "__main__":
+    test_forecast_bands()
+    test_forecast_is_seeded()
+    print("\n🎉 Economic forecast tests passed!")
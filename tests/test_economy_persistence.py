@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Test economy snapshots and event-log replay
+"""
+
+import os
+import sys
+import tempfile
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.agent_memory import AgentMemorySystem
+from services.tavern_economy import TavernEconomySystem, ResourceType, TransactionType
+
+def _make_economy(base_dir: str, snapshot_every: int = 1000) -> TavernEconomySystem:
+    return TavernEconomySystem(
+        memory_system=AgentMemorySystem(memory_dir=os.path.join(base_dir, "memory")),
+        persistence_dir=os.path.join(base_dir, "economy"),
+        snapshot_every=snapshot_every
+    )
+
+def _trade(economy: TavernEconomySystem, amount: float):
+    return economy.execute_transaction(
+        TransactionType.PURCHASE,
+        ["Karczmarz", "Kupiec_Imperialny"],
+        {ResourceType.GOLD: amount},
+        f"Karczmarz pays {amount} gold"
+    )
+
+def test_restore_from_log_only():
+    """A restart without any snapshot replays the whole event log"""
+    print("💾 Testing Log Replay")
+    with tempfile.TemporaryDirectory() as base_dir:
+        economy = _make_economy(base_dir)
+        _trade(economy, 10.0)
+        _trade(economy, 5.0)
+        economy.update_reputation_on_event({"type": "brawl_brewing", "participants": ["Czempion"]})
+        economy.persistence.close()
+
+        restored = _make_economy(base_dir)
+        assert restored.agent_resources == economy.agent_resources
+        assert restored.economic_state == economy.economic_state
+        assert restored.transaction_count == 2
+        assert [t.description for t in restored.transaction_history] == [
+            "Karczmarz pays 10.0 gold", "Karczmarz pays 5.0 gold"
+        ]
+
+def test_restore_from_snapshot_and_tail():
+    """Snapshots cover older events and only the tail is replayed"""
+    print("📸 Testing Snapshot + Tail Restore")
+    with tempfile.TemporaryDirectory() as base_dir:
+        economy = _make_economy(base_dir, snapshot_every=3)
+        for amount in range(1, 6):
+            _trade(economy, float(amount))
+        economy.market_prices[ResourceType.FAVORS] = 42.0
+        economy.save_snapshot()
+        _trade(economy, 7.0)
+        economy.persistence.close()
+
+        restored = _make_economy(base_dir, snapshot_every=3)
+        assert restored.agent_resources == economy.agent_resources
+        assert restored.market_prices[ResourceType.FAVORS] == 42.0
+        assert restored.transaction_count == 6
+        assert len(restored.transaction_history) == 1  # Only the tail after the snapshot
+        assert restored.persistence.sequence == economy.persistence.sequence
+
+def test_append_after_torn_line_survives_restarts():
+    """A torn final line is cut off on restore, so events appended afterwards are kept"""
+    print("🩹 Testing Torn Log Recovery")
+    with tempfile.TemporaryDirectory() as base_dir:
+        economy = _make_economy(base_dir)
+        _trade(economy, 10.0)
+        economy.persistence.close()
+        with open(economy.persistence.log_path, 'a', encoding='utf-8') as f:
+            f.write('{"seq": 2, "kind": "trans')
+
+        restarted = _make_economy(base_dir)
+        assert restarted.transaction_count == 1
+        _trade(restarted, 8.0)
+        restarted.persistence.close()
+
+        again = _make_economy(base_dir)
+        assert again.transaction_count == 2
+        assert again.agent_resources == restarted.agent_resources
+        assert [t.description for t in again.transaction_history] == [
+            "Karczmarz pays 10.0 gold", "Karczmarz pays 8.0 gold"
+        ]
+
+if __name__ == "__main__":
+    test_restore_from_log_only()
+    test_restore_from_snapshot_and_tail()
+    test_append_after_torn_line_survives_restarts()
+    print("\n🎉 Economy persistence tests passed!")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test economy time series ring buffers and rollups
+"""
+
+import os
+import sys
+import tempfile
+
+import numpy as np
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.agent_memory import AgentMemorySystem
+from services.economy_timeseries import EconomyTimeSeries, RingBuffer
+from services.tavern_economy import TavernEconomySystem
+
+def test_ring_buffer_wraps():
+    """Ring buffer keeps only the newest rows and queries them in order"""
+    print("🔁 Testing Ring Buffer")
+    buffer = RingBuffer(capacity=5, n_fields=1)
+    for t in range(8):
+        buffer.append(float(t), (t * 10.0,))
+
+    times, values = buffer.query()
+    assert times.tolist() == [3.0, 4.0, 5.0, 6.0, 7.0]
+    assert values[:, 0].tolist() == [30.0, 40.0, 50.0, 60.0, 70.0]
+
+    times, _ = buffer.query(start=4.5, end=6.0)
+    assert times.tolist() == [5.0, 6.0]
+
+def test_minute_and_hour_rollups():
+    """Raw samples roll up into per-minute and per-hour buckets"""
+    print("🕐 Testing Rollups")
+    series = EconomyTimeSeries(capacities={"raw": 100})
+    for second in range(0, 7200, 10):
+        series.record("price:gold", second / 60.0, timestamp=float(second))
+
+    raw_times, _ = series.query("price:gold")
+    assert len(raw_times) == 100  # Bounded raw history
+
+    minute_times, minute_means = series.query("price:gold", resolution="minute")
+    assert len(minute_times) == 120
+    assert minute_times[1] == 60.0
+    assert abs(minute_means[0] - np.mean([s / 60.0 for s in range(0, 60, 10)])) < 1e-9
+
+    hour_times, hour_max = series.query("price:gold", resolution="hour", field="max")
+    assert hour_times.tolist() == [0.0, 3600.0]
+    assert hour_max[0] == 3590 / 60.0
+    assert series.latest("price:gold") == 7190 / 60.0
+
+def test_economy_records_series():
+    """Economy events feed the time series"""
+    print("📊 Testing Economy Series Recording")
+    with tempfile.TemporaryDirectory() as memory_dir:
+        economy = TavernEconomySystem(memory_system=AgentMemorySystem(memory_dir=memory_dir))
+        assert economy.time_series.latest("reputation:tavern") == economy.economic_state.reputation_score
+
+        economy.update_reputation_on_event({"type": "alliance_forming", "participants": ["Karczmarz"]})
+        assert economy.time_series.latest("reputation:tavern") == economy.economic_state.reputation_score
+        assert "reputation:Karczmarz" in economy.time_series.metrics("reputation:")
+
+if __name__ == "__main__":
+    test_ring_buffer_wraps()
+    test_minute_and_hour_rollups()
+    test_economy_records_series()
+    print("\n🎉 Economy time series tests passed!")
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Test the compiled faction interaction modifier table
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.dice_system import DiceSystem, InteractionSystem
+from core.enums import Faction
+from core.faction_relations import FACTION_INDEX, load_faction_modifier_table
+
+def test_default_modifiers():
+    """Pairs apply both ways and wildcards only match the initiator"""
+    print("⚔️ Testing Faction Modifiers")
+    interactions = InteractionSystem(DiceSystem())
+    modifier = interactions.get_faction_interaction_modifier
+
+    assert modifier(Faction.EMPIRE, Faction.DWARF) == 2
+    assert modifier(Faction.DWARF, Faction.EMPIRE) == 2
+    assert modifier(Faction.NORSE, Faction.EMPIRE) == -3
+    assert modifier(Faction.WITCH_HUNTER, Faction.CULTIST) == -10
+    assert modifier(Faction.CULTIST, Faction.WITCH_HUNTER) == -10
+    assert modifier(Faction.CULTIST, Faction.HALFLING) == -5
+    assert modifier(Faction.HALFLING, Faction.CULTIST) == 0
+    assert modifier(Faction.TILEAN, Faction.ESTALIA) == 0
+
+    table = interactions.faction_modifiers
+    assert table.shape == (len(Faction), len(Faction))
+    assert not table.flags.writeable
+
+def test_custom_relations_file():
+    """Designers can point the interaction system at their own relations"""
+    print("📜 Testing Custom Relations File")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "relations.json")
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"relations": [{"factions": ["Halfling", "*"], "modifier": 3}]}, f)
+
+        interactions = InteractionSystem(DiceSystem(), faction_relations_path=path)
+        assert interactions.get_faction_interaction_modifier(Faction.HALFLING, Faction.NORSE) == 3
+        assert interactions.get_faction_interaction_modifier(Faction.EMPIRE, Faction.DWARF) == 0
+        assert load_faction_modifier_table(path)[FACTION_INDEX[Faction.HALFLING], 0] == 3
+
+if __name__ == "__main__":
+    test_default_modifiers()
+    test_custom_relations_file()
+    print("\n🎉 Faction relations tests passed!")
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test the procedural patron generator
+"""
+
+import os
+import sys
+from collections import Counter
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.character import Character
+from core.enums import CharacterClass, Faction
+from core.patron_generator import PatronGenerator, load_patron_tables
+from core.tavern_simulator import TavernSimulator
+
+def test_seeded_patrons_repeat():
+    """The same seed yields the same patrons, streamed or in bulk"""
+    print("🎲 Testing Seeded Patrons")
+    streamed = [p.to_dict() for p in PatronGenerator(seed=11).iter_patrons(200)]
+    bulk = [p.to_dict() for p in PatronGenerator(seed=11).generate(200)]
+    assert streamed == bulk
+    assert streamed != [p.to_dict() for p in PatronGenerator(seed=12).generate(200)]
+
+def test_patrons_follow_the_tables():
+    """Classes come from their faction's table and skills match the usual derivation"""
+    print("📜 Testing Lore-Consistent Patrons")
+    tables = load_patron_tables()
+    patrons = PatronGenerator(seed=3, reserved_names=["Grimm Ironbeard"]).generate(3000)
+
+    names = [p.name for p in patrons]
+    assert len(set(names)) == len(names)
+    assert "Grimm Ironbeard" not in names
+
+    for patron in patrons:
+        assert patron.character_class.value in tables["factions"][patron.faction.value]["classes"]
+        low, high = tables["factions"][patron.faction.value]["ages"]
+        assert low <= patron.age <= high
+    assert not any(p.faction == Faction.DWARF and p.character_class == CharacterClass.WIZARD for p in patrons)
+
+    factions = Counter(p.faction for p in patrons)
+    assert factions.most_common(1)[0][0] == Faction.EMPIRE
+
+    sample = patrons[-1]
+    fresh = Character(name="x", faction=sample.faction, character_class=sample.character_class, age=1,
+                      gender="Male", appearance="", distinctive_features="", backstory="", motivation="")
+    assert sample.skills == fresh.skills
+    assert sample.skills is not patrons[0].skills
+
+def test_simulator_crowd():
+    """add_patrons fills a tavern beyond its usual size"""
+    print("🎉 Testing Crowded Tavern")
+    simulator = TavernSimulator(seed=8, patron_arrays=True)
+    tavern = simulator.generate_new_tavern()
+    before = len(tavern.characters)
+    assert simulator.add_patrons(2000) == 2000
+    assert len(tavern.characters) == before + 2000
+    assert tavern.current_occupancy == len(tavern.characters)
+    simulator.advance_turns(5)
+
+    capped = TavernSimulator(seed=8)
+    tavern = capped.generate_new_tavern()
+    room = tavern.capacity - tavern.current_occupancy
+    assert capped.add_patrons(room + 50, grow_capacity=False) == room
+
+if __name__ == "__main__":
+    test_seeded_patrons_repeat()
+    test_patrons_follow_the_tables()
+    test_simulator_crowd()
+    print("\n🎉 Patron generator tests passed!")
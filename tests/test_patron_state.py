@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Test the structure-of-arrays patron state
+"""
+
+import dataclasses
+import os
+import random
+import sys
+
+import numpy as np
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.character_generator import CharacterGenerator
+from core.tavern_generator import TavernGenerator
+
+def _crowded_tavern(n: int, arrays: bool):
+    tavern = TavernGenerator(rng=random.Random(5)).generate_tavern()
+    tavern.capacity = n
+    if arrays:
+        tavern.use_patron_state(np.random.default_rng(5))
+    base = CharacterGenerator().get_all_characters()
+    for i in range(n):
+        character = dataclasses.replace(base[i % len(base)], name=f"Patron {i}", relationships={})
+        character.drunk_level = i % 11
+        character.current_mood = "drunk" if character.drunk_level > 5 else "neutral"
+        tavern.add_character(character)
+    return tavern
+
+def _stats(tavern):
+    return [(c.health, c.wealth, c.drunk_level, c.current_mood) for c in tavern.characters]
+
+def test_vectorized_sober_up_matches_characters():
+    """Sobering up and drunk counts agree with the per-character path"""
+    print("🍺 Testing Vectorized Sober Up")
+    plain, arrays = _crowded_tavern(200, False), _crowded_tavern(200, True)
+    assert _stats(plain) == _stats(arrays)
+    for _ in range(4):
+        assert plain.drunk_count() == arrays.drunk_count()
+        plain.sober_up_characters()
+        arrays.sober_up_characters()
+        assert _stats(plain) == _stats(arrays)
+
+def test_characters_view_their_row():
+    """Attribute writes land in the arrays and leaving copies them back"""
+    print("🧮 Testing Character Views")
+    tavern = _crowded_tavern(50, True)
+    first, middle = tavern.characters[0], tavern.characters[25]
+    middle.drink_alcohol()
+    middle.wealth += 7
+    row = middle.__dict__["_patron_row"]
+    assert tavern.patrons.drunk_level[row] == middle.drunk_level
+    assert tavern.patrons.wealth[row] == middle.wealth
+
+    expected = (middle.health, middle.wealth, middle.drunk_level, middle.current_mood)
+    assert tavern.remove_character(middle)
+    assert "_patron_state" not in middle.__dict__
+    assert (middle.health, middle.wealth, middle.drunk_level, middle.current_mood) == expected
+    assert len(tavern.patrons) == 49
+    assert tavern.patrons.characters[first.__dict__["_patron_row"]] is first
+    assert all(tavern.patrons.characters[c.__dict__["_patron_row"]] is c for c in tavern.characters)
+
+def test_vectorized_brawl_injuries():
+    """Brawl injuries only ever lower health, and not below the floor"""
+    print("🥊 Testing Vectorized Brawl")
+    tavern = _crowded_tavern(1000, True)
+    before = np.array([c.health for c in tavern.characters])
+    tavern.trigger_brawl()
+    after = np.array([c.health for c in tavern.characters])
+    injured = after < before
+    assert 200 < injured.sum() < 400
+    assert (before[injured] - after[injured] <= 30).all()
+    assert (after >= 10).all()
+
+if __name__ == "__main__":
+    test_vectorized_sober_up_matches_characters()
+    test_characters_view_their_row()
+    test_vectorized_brawl_injuries()
+    print("\n🎉 Patron state tests passed!")
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test the dense tavern relationship matrix
+"""
+
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.relationship_matrix import RelationshipMatrix
+from core.tavern_simulator import TavernSimulator
+from core.enums import RelationshipType
+
+def test_matrix_reads_writes_and_growth():
+    """Values clamp to the relationship range and survive matrix growth"""
+    print("🔢 Testing Relationship Matrix")
+    matrix = RelationshipMatrix(capacity=2)
+    matrix.set("Anna", "Bors", 5)
+    assert matrix.get("Anna", "Bors") == 3
+    assert matrix.modify("Bors", "Anna", -10) == -3
+
+    for i in range(20):
+        matrix.ensure(f"Patron {i}")
+    assert matrix.get("Anna", "Bors") == 3
+    assert matrix.get("Anna", "Nobody") == 0
+    assert matrix.row("Anna") == {"Bors": 3}
+
+def test_vectorized_queries():
+    """Most hated, faction averages and hostility clusters"""
+    print("📐 Testing Relationship Queries")
+    matrix = RelationshipMatrix()
+    for name in ["A", "B", "C", "D", "E"]:
+        matrix.ensure(name)
+    matrix.set("A", "C", -3)
+    matrix.set("B", "C", -2)
+    matrix.set("D", "E", -2)
+    matrix.set("A", "B", 2)
+
+    assert matrix.most_hated(n=1) == [("C", -5)]
+    clusters = matrix.hostility_clusters()
+    assert sorted(clusters) == [["A", "B", "C"], ["D", "E"]]
+
+    averages = matrix.faction_averages({"A": "x", "B": "x", "C": "y"})
+    assert averages[("x", "x")] == 1.0  # A->B is 2, B->A is 0
+    assert averages[("x", "y")] == -2.5
+    assert averages[("y", "x")] == 0.0
+    assert ("y", "y") not in averages  # Nobody to pair C with
+
+    assert matrix.indices(["A", "Stranger", "C"]).tolist() == [0, -1, 2]
+    assert matrix.submatrix(["A", "Stranger", "C"]).tolist() == [[0, 0, -3], [0, 0, 0], [0, 0, 0]]
+    assert matrix.most_hated(["A", "Stranger", "C"], n=1) == [("C", -3)]
+    assert len(matrix) == 5 and "Stranger" not in matrix.index  # Queries never add names
+
+def test_characters_share_tavern_matrix():
+    """Character.relationships is a view onto the tavern matrix"""
+    print("🍺 Testing Character Relationship View")
+    simulator = TavernSimulator(seed=5)
+    tavern = simulator.generate_new_tavern()
+    first, second = tavern.characters[:2]
+
+    first.modify_relationship(second.name, 2)
+    assert tavern.relationships.get(first.name, second.name) == 2
+    assert first.get_relationship(second.name) == RelationshipType.FRIENDSHIP
+    assert first.to_dict()["relationships"] == {second.name: 2}
+
+    relationships = simulator.get_character_relationships()
+    assert relationships[first.name][second.name] == 2
+    assert first.name not in relationships[first.name]
+
+def test_version_only_counts_real_changes():
+    """Writes that leave a value as it was (e.g. clamped at the limit) keep the version"""
+    print("🔢 Testing Matrix Version")
+    matrix = RelationshipMatrix()
+    matrix.set("Hans", "Greta", 3)
+    version = matrix.version
+    matrix.set("Hans", "Greta", 3)
+    matrix.set("Hans", "Greta", 99)
+    assert matrix.modify("Hans", "Greta", 1) == 3
+    assert matrix.modify("Hans", "Greta", 0) == 3
+    assert matrix.version == version
+    assert matrix.modify("Hans", "Greta", -1) == 2
+    assert matrix.version == version + 1
+
+if __name__ == "__main__":
+    test_matrix_reads_writes_and_growth()
+    test_vectorized_queries()
+    test_characters_share_tavern_matrix()
+    test_version_only_counts_real_changes()
+    print("\n🎉 Relationship matrix tests passed!")
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+"""
+Test deterministic replay and forks of simulator sessions
+"""
+
+import os
+import sys
+import tempfile
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import numpy as np
+
+from core.enums import InteractionType
+from core.tavern_simulator import TavernSimulator
+
+def _state(simulator: TavernSimulator):
+    tavern = simulator.current_tavern
+    return (
+        simulator.turn_counter,
+        tavern.tension_level,
+        tavern.brawl_count,
+        [c.name for c in tavern.characters],
+        simulator.get_character_relationships(),
+        [i.dice_roll for i in simulator.interaction_history],
+        [e.title for e in simulator.event_history],
+        list(simulator.rumor_system.active_rumors),
+        simulator.rng.getstate()
+    )
+
+def _played(seed: int = 5, spacing: int = 10, **options) -> TavernSimulator:
+    simulator = TavernSimulator(seed=seed, snapshot_spacing=spacing, **options)
+    simulator.generate_new_tavern()
+    simulator.advance_turns(12)
+    names = [c.name for c in simulator.current_tavern.characters]
+    simulator.perform_interaction(names[0], names[1], InteractionType.BRAWL)
+    simulator.remove_character_from_tavern(names[2])
+    simulator.auto_events_enabled = False
+    for _ in range(9):
+        simulator.advance_turn()
+    simulator.auto_events_enabled = True
+    simulator.advance_turns(14)
+    return simulator
+
+def test_replay_to_past_turn():
+    """Replaying to a turn rebuilds exactly the state the session had then"""
+    print("⏪ Testing Replay")
+    simulator = TavernSimulator(seed=5, snapshot_spacing=10)
+    simulator.generate_new_tavern()
+    simulator.advance_turns(12)
+    names = [c.name for c in simulator.current_tavern.characters]
+    simulator.perform_interaction(names[0], names[1], InteractionType.BRAWL)
+    simulator.remove_character_from_tavern(names[2])
+    simulator.auto_events_enabled = False
+    simulator.advance_turns(5)
+    expected = _state(simulator)
+
+    simulator.auto_events_enabled = True
+    simulator.advance_turns(30)
+    simulator.replay_to(17)
+    assert _state(simulator) == expected
+    assert simulator.session_log[-1].endswith("Replayed to turn 17")
+
+    # The future was dropped, and playing on from here journals afresh
+    assert simulator.journal.turn_count == 17
+    assert all(s.turn <= 17 for s in simulator.journal.snapshots)
+    simulator.advance_turns(10)
+    continued = _state(simulator)
+    simulator.replay_to(27)
+    assert _state(simulator) == continued
+
+def test_fork_continues_like_original():
+    """A fork from a past turn plays on exactly as the original did"""
+    print("🌿 Testing Forks")
+    for options in ({}, {"patron_arrays": True, "zoned": True, "rumor_diffusion": True}):
+        simulator = _played(**options)
+        fork = simulator.fork(21)
+        assert fork is not simulator and fork.turn_counter == 21
+
+        # Interactions replayed for the fork get the text of those played live (turns 13-21)
+        live = [i.outcome_description for i in simulator.interaction_history[:len(fork.interaction_history)]]
+        assert any(live)
+        assert all(text == i.outcome_description for text, i in zip(live, fork.interaction_history) if text)
+
+        simulator.replay_to(21)
+        assert _state(fork) == _state(simulator)
+        fork.advance_turns(25)
+        simulator.advance_turns(25)
+        assert _state(fork) == _state(simulator)
+        if options:
+            assert np.array_equal(fork.current_tavern.patrons.health[:len(fork.current_tavern.characters)],
+                                  simulator.current_tavern.patrons.health[:len(simulator.current_tavern.characters)])
+
+        # Branches are independent of each other
+        fork.add_patrons(20)
+        assert len(fork.current_tavern.characters) != len(simulator.current_tavern.characters)
+
+def test_snapshot_spacing():
+    """Spacing sets how many snapshots are kept; None turns journaling off"""
+    print("📸 Testing Snapshot Spacing")
+    assert len(_played(spacing=5).journal.snapshots) == 1 + 35 // 5
+    assert len(_played(spacing=50).journal.snapshots) == 1
+    for spacing in (1, 7, 50):
+        simulator = _played(spacing=spacing)
+        expected = _state(simulator.fork(13))
+        simulator.replay_to(13)
+        assert _state(simulator) == expected
+
+    # Only the newest snapshots are kept, and replay reaches back as far as they do
+    simulator = _played(spacing=5, snapshot_limit=3)
+    journal = simulator.journal
+    assert [s.turn for s in journal.snapshots] == [25, 30, 35] and journal.first_turn == 25
+    assert list(journal.turn_records()["turn"]) == list(range(26, 36))
+    assert all(turn >= 25 for turn in journal._command_turns)
+    expected = _state(simulator.fork(27))
+    simulator.replay_to(27)
+    assert _state(simulator) == expected
+    try:
+        simulator.replay_to(20)
+        assert False, "replaying past the oldest snapshot should fail"
+    except ValueError:
+        pass
+
+    simulator = TavernSimulator(seed=5, snapshot_spacing=None)
+    simulator.generate_new_tavern()
+    simulator.advance_turns(3)
+    assert simulator.journal is None
+    try:
+        simulator.replay_to(1)
+        assert False, "replay without a journal should fail"
+    except ValueError:
+        pass
+
+def test_turn_records():
+    """Every turn leaves a compact record, and future turns cannot be replayed to"""
+    print("🧾 Testing Turn Records")
+    simulator = _played()
+    records = simulator.journal.turn_records()
+    assert list(records["turn"]) == list(range(1, 36))
+    assert not records["auto_events"][12:21].any() and records["auto_events"][21:].all()
+    assert records["interactions"][-1] == len(simulator.interaction_history)
+    assert records["tension"][-1] == simulator.current_tavern.tension_level
+    try:
+        simulator.replay_to(36)
+        assert False, "replaying to a future turn should fail"
+    except ValueError:
+        pass
+
+def test_replay_includes_ui_actions():
+    """Actions taken from the UI (a round of drinks, outside effects) are replayed too"""
+    print("🍺 Testing Replay of UI Actions")
+    simulator = TavernSimulator(seed=5, snapshot_spacing=10)
+    simulator.generate_new_tavern()
+    simulator.advance_turns(4)
+    # What the interaction panel's drinking round does
+    for name in [c.name for c in simulator.current_tavern.characters]:
+        simulator.serve_drink(name)
+    simulator.adjust_tavern(tension_change=15, reputation_change=-5)
+    simulator.advance_turns(3)
+
+    def wealth_and_drink():
+        tavern = simulator.current_tavern
+        return ([(c.name, c.wealth, c.drunk_level) for c in tavern.characters],
+                tavern.reputation, tavern.noise_level)
+
+    expected = (_state(simulator), wealth_and_drink())
+    simulator.replay_to(simulator.turn_counter)
+    assert (_state(simulator), wealth_and_drink()) == expected
+
+def test_autosave_after_replay():
+    """Autosaving after a replay saves the new branch, not the dropped future"""
+    print("💾 Testing Autosave After Replay")
+    simulator = TavernSimulator(seed=5, snapshot_spacing=10)
+    simulator.generate_new_tavern()
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "replayed.tavern")
+        simulator.advance_turns(20)
+        simulator.autosave(filename)
+        simulator.replay_to(8)
+        simulator.advance_turns(5)
+        simulator.autosave(filename)
+
+        restored = TavernSimulator()
+        assert restored.load_session(filename)
+        assert restored.turn_counter == 13
+        assert [i.to_dict() for i in restored.interaction_history] == \
+            [i.to_dict() for i in simulator.interaction_history]
+        assert restored.get_session_log() == simulator.get_session_log()
+
+if __name__ == "__main__":
+    test_replay_to_past_turn()
+    test_fork_continues_like_original()
+    test_snapshot_spacing()
+    test_turn_records()
+    test_replay_includes_ui_actions()
+    test_autosave_after_replay()
+    print("\n🎉 Replay tests passed!")
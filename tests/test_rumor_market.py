@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test Rumor Market decay, expiry and trader rankings
+"""
+
+import os
+import random
+import sys
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from services.rumor_market import RumorMarket
+
+def test_value_decay():
+    """Rumor values halve every half-life and totals follow"""
+    print("📉 Testing Rumor Value Decay")
+    market = RumorMarket(half_life=100.0, rumor_ttl=1000.0)
+
+    rumor = market.add_rumor("Chaos cultists in the forest", "Wiedźma", 80.0, now=0.0)
+    market.add_rumor("Hidden treasure", "Zwiadowca", 40.0, now=100.0)
+
+    assert abs(market.get_rumor_value(rumor.id, now=100.0) - 40.0) < 1e-9
+    assert abs(market.total_value(now=100.0) - 80.0) < 1e-9
+    assert abs(market.total_value(now=200.0) - 40.0) < 1e-9
+    print(f"   Total value after 200s: {market.total_value(now=200.0):.1f}")
+
+def test_expiry_heap():
+    """Expired rumors leave the market and the running totals"""
+    print("⏳ Testing Rumor Expiry")
+    market = RumorMarket(half_life=100.0, rumor_ttl=50.0)
+
+    market.add_rumor("Old news", "Karczmarz", 10.0, now=0.0)
+    market.add_rumor("Fresh news", "Karczmarz", 10.0, now=40.0, ttl=100.0)
+
+    expired = market.expire(now=60.0)
+    assert [r.content for r in expired] == ["Old news"]
+    assert len(market) == 1
+    assert market.get_summary(now=60.0)["expired_rumors"] == 1
+
+    market.expire(now=1000.0)
+    assert len(market) == 0
+    assert market.total_value(now=1000.0) == 0.0
+    assert market.top_traders(now=1000.0) == []
+
+def test_top_traders_and_bounds():
+    """Trader ranking follows current value and the market stays bounded"""
+    print("🏆 Testing Top Traders")
+    market = RumorMarket(half_life=100.0, rumor_ttl=1000.0, max_active=3)
+
+    market.add_rumor("A", "Wiedźma", 10.0, now=0.0)
+    market.add_rumor("B", "Zwiadowca", 30.0, now=0.0)
+    market.add_rumor("C", "Czempion", 20.0, now=0.0)
+    assert market.top_traders(now=0.0) == ["Zwiadowca", "Czempion", "Wiedźma"]
+
+    # Newer rumor evicts the one closest to expiry, never growing past the cap
+    market.add_rumor("D", "Wiedźma", 50.0, now=10.0)
+    assert len(market) == 3
+    assert market.top_traders(limit=1, now=10.0) == ["Wiedźma"]
+    assert abs(market.trader_value("Wiedźma", now=10.0) - 50.0) < 1e-9
+
+def test_ranking_under_churn():
+    """The heap ranking matches a full sort after many updates and stays bounded"""
+    print("🔀 Testing Ranking Under Churn")
+    rng = random.Random(7)
+    market = RumorMarket(half_life=100.0, rumor_ttl=300.0, max_active=200)
+    traders = [f"trader_{i}" for i in range(40)]
+    for step in range(3000):
+        now = step * 0.5
+        market.add_rumor(f"rumor {step}", rng.choice(traders), rng.uniform(1.0, 100.0), now=now)
+        if step % 100 == 0:
+            expected = sorted(market._trader_weights, key=lambda t: (-market._trader_weights[t], t))
+            assert market.top_traders(limit=10, now=now) == expected[:10]
+            assert market.top_traders(limit=100, now=now) == expected
+    assert len(market._ranking) <= 2 * len(market._trader_weights) + 64
+
+if __name__ == "__main__":
+    test_value_decay()
+    test_expiry_heap()
+    test_top_traders_and_bounds()
+    test_ranking_under_churn()
+    print("\n🎉 Rumor market tests passed!")
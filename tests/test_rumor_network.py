@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test rumor diffusion over the social graph
+"""
+
+import os
+import sys
+
+import numpy as np
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.enums import RelationshipType
+from core.relationship_matrix import RelationshipMatrix
+from core.rumor_network import RumorNetwork, SocialGraph
+from core.tavern_simulator import TavernSimulator
+
+def _chain(n: int):
+    matrix = RelationshipMatrix()
+    names = [f"Patron {i}" for i in range(n)]
+    for a, b in zip(names, names[1:]):
+        matrix.set(a, b, RelationshipType.FRIENDSHIP)
+    return matrix, names
+
+def test_graph_is_csr():
+    """Edges are grouped by speaker and repeated edges keep the best chance"""
+    print("🕸️ Testing Social Graph")
+    graph = SocialGraph.from_edges(4, np.array([2, 0, 0, 2]), np.array([1, 3, 1, 1]), np.array([0.1, 0.2, 0.3, 0.5]))
+    assert graph.indptr.tolist() == [0, 2, 2, 3, 3]
+    assert graph.neighbours(0).tolist() == [1, 3]
+    assert graph.neighbours(2).tolist() == [1]
+    assert graph.chances.tolist() == [0.3, 0.2, 0.5]
+
+    matrix, names = _chain(5)
+    matrix.set(names[4], names[0], RelationshipType.DISTRUST)
+    network = RumorNetwork(matrix, np.random.default_rng(0))
+    graph = network.build_graph(names, companions=[(names[4], names[0])])
+    assert graph.edge_count == 4 + 2
+    assert graph.neighbours(matrix.index[names[0]]).tolist() == [matrix.index[names[1]], matrix.index[names[4]]]
+
+def test_rumor_travels_one_step_per_turn():
+    """With certain gossip a rumor moves one friend further each step"""
+    print("🗣️ Testing Rumor Cascade")
+    matrix, names = _chain(6)
+    network = RumorNetwork(matrix, np.random.default_rng(1), base_chance=1.0, regard_chance=0.0)
+    network.add_rumor("The ale is watered", sources=[names[0]])
+    graph = network.build_graph(names)
+    for step in range(1, 6):
+        assert network.step(graph) == {"The ale is watered": 1}
+        assert network.knowers("The ale is watered", names) == names[:step + 1]
+    assert network.step(graph) == {}
+    assert network.reach(names) == {"The ale is watered": 6}
+
+    assert network.reach(names + ["Stranger"]) == {"The ale is watered": 6}
+    assert network.build_graph(names + ["Stranger"], companions=[(names[0], "Stranger")]).edge_count == graph.edge_count
+    assert "Stranger" not in matrix.index
+
+def test_old_rumors_are_forgotten():
+    """Reusing a slot clears who knew the rumor that held it"""
+    print("🧠 Testing Rumor Slots")
+    matrix, names = _chain(3)
+    network = RumorNetwork(matrix, np.random.default_rng(2), max_rumors=64)
+    for i in range(64):
+        network.add_rumor(f"Rumor {i}", sources=[names[i % 3]])
+    assert network.knows(names[0], "Rumor 0")
+    network.add_rumor("Rumor 64", sources=[names[1]])
+    assert not network.knows(names[0], "Rumor 0")
+    assert "Rumor 0" not in network.slots
+    assert network.knows(names[1], "Rumor 64") and not network.knows(names[0], "Rumor 64")
+
+def test_simulated_rumors_spread():
+    """Rumors reach patrons beyond their source, the same way for the same seed"""
+    print("📣 Testing Rumor Diffusion In Simulation")
+    reaches = []
+    for _ in range(2):
+        simulator = TavernSimulator(seed=13, zoned=True, rumor_diffusion=True)
+        simulator.generate_new_tavern()
+        simulator.add_patrons(200)
+        simulator.advance_turns(100)
+        names = [c.name for c in simulator.current_tavern.characters]
+        reaches.append(simulator.rumor_network.reach(names))
+    assert reaches[0] == reaches[1]
+    assert max(reaches[0].values()) > 10
+
+if __name__ == "__main__":
+    test_graph_is_csr()
+    test_rumor_travels_one_step_per_turn()
+    test_old_rumors_are_forgotten()
+    test_simulated_rumors_spread()
+    print("\n🎉 Rumor network tests passed!")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Test the ring-buffer session log and cursor reads
+"""
+
+import os
+import sys
+import tempfile
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.compact_log import LogKind
+from core.session_log import SessionLog
+from core.tavern_simulator import TavernSimulator
+
+def test_ring_buffer_bounds_memory():
+    """Without a spill directory only the newest records are kept"""
+    print("🔁 Testing Bounded Log")
+    log = SessionLog(capacity=5)
+    for i in range(12):
+        log.append(f"entry {i}", turn=i)
+
+    assert len(log) == 5
+    assert [line.split("] ", 1)[1] for line in log.lines()] == [f"entry {i}" for i in range(7, 12)]
+
+    records, cursor = log.read_since(0)
+    assert records[0].seq == 7 and cursor == 12
+
+def test_spilled_records_stay_readable():
+    """Evicted records are written to segments and read back in order"""
+    print("💾 Testing Spill To Disk")
+    with tempfile.TemporaryDirectory() as spill_dir:
+        log = SessionLog(capacity=4, spill_dir=spill_dir, segment_size=3)
+        for i in range(20):
+            log.append(f"entry {i}", LogKind.TURN, turn=i, actors=("Anna",))
+
+        assert len(log.lines()) == 4
+        assert len(os.listdir(spill_dir)) == 5
+        assert [record.turn for record in log.iter_range()] == list(range(20))
+        assert [record.seq for record in log.iter_range(2, 9)] == list(range(2, 9))
+        assert log.read_since(0, limit=6)[1] == 6
+
+def test_cursor_reads_are_incremental():
+    """Readers only receive entries recorded since their cursor"""
+    print("📜 Testing Cursor Reads")
+    simulator = TavernSimulator(seed=8)
+    simulator.generate_new_tavern()
+    records, cursor = simulator.read_log()
+    assert records and cursor == records[-1].seq + 1
+
+    simulator.advance_turns(20)
+    new_records, new_cursor = simulator.read_log(cursor)
+    assert new_records[0].seq == cursor
+    assert sum(record.kind == LogKind.TURN for record in new_records) == 20
+    assert simulator.read_log(new_cursor) == ([], new_cursor)
+
+    simulator.clear_session_log()
+    simulator.advance_turn()
+    records, _ = simulator.read_log(new_cursor)
+    assert [record.message for record in records] == ["Turn 21 completed"]
+
+def test_saved_log_keeps_clock_times():
+    """Reloaded log lines render exactly as they were saved"""
+    print("🕰️ Testing Log Save And Load")
+    simulator = TavernSimulator(seed=4)
+    simulator.generate_new_tavern()
+    simulator.advance_turns(10)
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = simulator.save_session(os.path.join(tmp, "session.tavern"))
+        restored = TavernSimulator(seed=4)
+        assert restored.load_session(filename)
+    assert restored.get_session_log() == simulator.get_session_log()
+
+if __name__ == "__main__":
+    test_ring_buffer_bounds_memory()
+    test_spilled_records_stay_readable()
+    test_cursor_reads_are_incremental()
+    test_saved_log_keeps_clock_times()
+    print("\n🎉 Session log tests passed!")
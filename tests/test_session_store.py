@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Test the streaming session file format
+"""
+
+import os
+import sys
+import tempfile
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.session_store import SessionFile
+from core.tavern_simulator import TavernSimulator
+
+def _played_simulator(turns: int = 50) -> TavernSimulator:
+    simulator = TavernSimulator(seed=21)
+    simulator.generate_new_tavern()
+    simulator.advance_turns(turns)
+    return simulator
+
+def test_save_and_lazy_load():
+    """Everything round-trips, with log and history read on first access"""
+    print("💾 Testing Session Save/Load")
+    simulator = _played_simulator()
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = simulator.save_session(os.path.join(tmp, "session.tavern"))
+
+        restored = TavernSimulator()
+        assert restored.load_session(filename)
+        assert restored._history_loader is not None
+        assert restored.turn_counter == simulator.turn_counter
+        assert restored.current_tavern.name == simulator.current_tavern.name
+
+        assert [i.to_dict() for i in restored.interaction_history] == \
+            [i.to_dict() for i in simulator.interaction_history]
+        assert restored.get_session_log() == simulator.get_session_log()
+        assert restored.get_character_relationships() == simulator.get_character_relationships()
+
+def test_autosave_appends_new_turns():
+    """Autosave only appends chunks for turns since the previous save"""
+    print("📝 Testing Append Autosave")
+    simulator = _played_simulator()
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "auto.tavern")
+        simulator.autosave(filename)
+        size_after_first = os.path.getsize(filename)
+        first_chunks = len(SessionFile(filename).index().log_chunks)
+
+        simulator.advance_turns(10)
+        simulator.autosave(filename)
+        assert os.path.getsize(filename) > size_after_first
+        assert len(SessionFile(filename).index().log_chunks) == first_chunks + 1
+
+        restored = TavernSimulator()
+        assert restored.load_session(filename)
+        assert restored.turn_counter == simulator.turn_counter
+        assert restored.get_session_log() == simulator.get_session_log()
+        assert len(restored.interaction_history) == len(simulator.interaction_history)
+
+        # Keep playing the restored session and append to the same file
+        restored.advance_turns(5)
+        restored.autosave(filename)
+        again = TavernSimulator()
+        assert again.load_session(filename)
+        assert again.get_session_log() == restored.get_session_log()
+
+def test_torn_append_falls_back_to_previous_state():
+    """A half-written final line is ignored on load"""
+    print("🩹 Testing Torn Save Recovery")
+    simulator = _played_simulator(20)
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = simulator.save_session(os.path.join(tmp, "torn.tavern"))
+        with open(filename, 'a', encoding='utf-8') as f:
+            f.write('{"section": "state", "turn_cou')
+
+        restored = TavernSimulator()
+        assert restored.load_session(filename)
+        assert restored.turn_counter == 20
+
+def test_append_after_torn_save_drops_its_chunks():
+    """Chunks of a torn append are cut off by the next one and never read back"""
+    print("✂️ Testing Append After Torn Save")
+    simulator = _played_simulator(20)
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, "torn.tavern")
+        simulator.autosave(filename)
+        simulator.advance_turns(10)
+        simulator.autosave(filename)
+        # Tear the state line of the second save, leaving its chunks behind
+        with open(filename, 'r+', encoding='utf-8') as f:
+            f.truncate(os.path.getsize(filename) - 20)
+
+        restored = TavernSimulator()
+        assert restored.load_session(filename)
+        assert restored.turn_counter == 20
+        restored.advance_turns(15)
+        restored.autosave(filename)
+
+        again = TavernSimulator()
+        assert again.load_session(filename)
+        assert again.turn_counter == 35
+        index = SessionFile(filename).index()
+        seqs = [seq for first, last, _ in index.log_chunks for seq in range(first, last + 1)]
+        assert len(seqs) == len(set(seqs))
+        assert again.get_session_log() == restored.get_session_log()
+        assert [i.to_dict() for i in again.interaction_history] == \
+            [i.to_dict() for i in restored.interaction_history]
+
+if __name__ == "__main__":
+    test_save_and_lazy_load()
+    test_autosave_appends_new_turns()
+    test_torn_append_falls_back_to_previous_state()
+    test_append_after_torn_save_drops_its_chunks()
+    print("\n🎉 Session store tests passed!")
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Test the precomputed default skill table
+"""
+
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.character import Character, DEFAULT_SKILL_TABLE
+from core.character_generator import CharacterGenerator
+from core.enums import CharacterClass, Faction, Skill
+
+def _character(character_class, faction, **kwargs):
+    return Character(name="Test", faction=faction, character_class=character_class, age=30, gender="Female",
+                     appearance="", distinctive_features="", backstory="", motivation="", **kwargs)
+
+def test_defaults_copy_the_table():
+    """New characters get their own copy of the table's skills"""
+    print("📊 Testing Default Skill Table")
+    assert len(DEFAULT_SKILL_TABLE) == len(CharacterClass) * len(Faction)
+    first = _character(CharacterClass.WIZARD, Faction.HIGH_ELF)
+    second = _character(CharacterClass.WIZARD, Faction.HIGH_ELF)
+    assert first.skills[Skill.MAGIC] == 1 + 8 + 3
+    assert first.skills[Skill.KNOWLEDGE] == 5 + 5 + 2
+    first.skills[Skill.MAGIC] = 20
+    assert second.skills[Skill.MAGIC] == 12
+    assert DEFAULT_SKILL_TABLE[(CharacterClass.WIZARD, Faction.HIGH_ELF)][Skill.MAGIC] == 12
+
+def test_skills_survive_round_trip():
+    """Saved skills are restored as saved, not re-derived"""
+    print("🔁 Testing Skill Round Trip")
+    for character in CharacterGenerator().get_all_characters():
+        character.skills[Skill.GAMBLING] = 17
+        restored = Character.from_dict(character.to_dict())
+        assert restored.skills == character.skills
+    explicit = _character(CharacterClass.PEASANT, Faction.EMPIRE, skills={Skill.COMBAT: 2})
+    assert explicit.skills == {Skill.COMBAT: 2}
+
+if __name__ == "__main__":
+    test_defaults_copy_the_table()
+    test_skills_survive_round_trip()
+    print("\n🎉 Skill table tests passed!")
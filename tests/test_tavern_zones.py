@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Test tavern zones and locality-aware encounters
+"""
+
+import os
+import random
+import sys
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.patron_generator import PatronGenerator
+from core.tavern_generator import TavernGenerator
+from core.tavern_simulator import TavernSimulator
+from core.tavern_zones import ZoneMap, DEFAULT_ZONE_LAYOUT
+
+def _zoned_tavern(n: int = 200):
+    tavern = TavernGenerator(rng=random.Random(2)).generate_tavern()
+    tavern.capacity = n
+    tavern.use_zones()
+    tavern.add_characters(PatronGenerator(seed=2).iter_patrons(n))
+    return tavern
+
+def _adjacent(zones: ZoneMap, a: str, b: str) -> bool:
+    return a == b or zones.index[b] in zones.adjacency[zones.index[a]]
+
+def test_patrons_spread_over_zones():
+    """Patrons fill zones by their share and leaving keeps the index consistent"""
+    print("🗺️ Testing Zone Placement")
+    tavern = _zoned_tavern(200)
+    occupancy = tavern.zones.occupancy()
+    assert sum(occupancy.values()) == 200
+    for name, (share, _) in DEFAULT_ZONE_LAYOUT.items():
+        assert abs(occupancy[name] - share * 200) <= 1
+
+    for character in list(tavern.characters)[::3]:
+        assert tavern.remove_character(character)
+        assert character not in tavern.zones
+    assert len(tavern.zones) == len(tavern.characters)
+    for z, members in enumerate(tavern.zones.members):
+        for i, character in enumerate(members):
+            assert tavern.zones._position[character.name] == (z, i)
+
+def test_pairs_stay_local():
+    """Sampled pairs are distinct and share a zone or neighbouring zones"""
+    print("🤝 Testing Local Encounters")
+    tavern = _zoned_tavern(200)
+    zones, rng = tavern.zones, random.Random(4)
+    same = 0
+    for _ in range(500):
+        first, second = zones.sample_pair(rng)
+        assert first is not second
+        a, b = zones.zone_of(first), zones.zone_of(second)
+        assert _adjacent(zones, a, b)
+        same += a == b
+    assert same > 300
+
+    # Zones batched together draw partners from disjoint groups of zones
+    for layout in (None, {"a": (0.3, ("b",)), "b": (0.2, ("a", "c")), "c": (0.2, ("b", "d")),
+                          "d": (0.2, ("c", "e")), "e": (0.1, ("d",))}):
+        zone_map = ZoneMap(layout) if layout else zones
+        batches = zone_map.zone_batches()
+        assert sorted(z for batch in batches for z in batch) == sorted(zone_map.names)
+        for batch in batches:
+            reach = [{z, *(zone_map.names[n] for n in zone_map.adjacency[zone_map.index[z]])} for z in batch]
+            for i in range(len(reach)):
+                for j in range(i + 1, len(reach)):
+                    assert not reach[i] & reach[j], f"{batch[i]} and {batch[j]} share a neighbour"
+
+def test_brawl_stays_local():
+    """A brawl only hurts patrons in its zone and the neighbouring ones"""
+    print("🥊 Testing Local Brawls")
+    layout = {
+        "bar": (0.5, ("main_hall",)),
+        "main_hall": (0.25, ("bar",)),
+        "cellar": (0.25, ())
+    }
+    for seed in range(6):
+        tavern = TavernGenerator(rng=random.Random(seed)).generate_tavern()
+        tavern.capacity = 400
+        if seed % 2:
+            tavern.use_patron_state()
+        tavern.use_zones(layout)
+        tavern.add_characters(PatronGenerator(seed=seed).iter_patrons(400))
+        tavern.trigger_brawl()
+        hurt = {tavern.zones.zone_of(c) for c in tavern.characters if c.health < 100}
+        assert hurt in ({"cellar"}, {"bar", "main_hall"})
+
+def test_zoned_simulation_runs():
+    """A zoned simulator plays turns and keeps zones in step with the roster"""
+    print("🍻 Testing Zoned Simulation")
+    simulator = TavernSimulator(seed=9, zoned=True, patron_arrays=True)
+    simulator.generate_new_tavern()
+    simulator.add_patrons(1000)
+    simulator.advance_turns(50)
+    assert len(simulator.current_tavern.zones) == len(simulator.current_tavern.characters)
+    assert simulator.interaction_history
+
+if __name__ == "__main__":
+    test_patrons_spread_over_zones()
+    test_pairs_stay_local()
+    test_brawl_stays_local()
+    test_zoned_simulation_runs()
+    print("\n🎉 Tavern zone tests passed!")
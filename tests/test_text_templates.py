@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test the shared text template registry
+"""
+
+import os
+import sys
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.dice_system import render_outcome_description
+from core.enums import AtmosphereType, EventType, InteractionType
+from core.tavern_simulator import TavernSimulator
+from core.text_templates import TEMPLATES, load_template_registry
+
+def test_registry_parses_templates_once():
+    """Templates are parsed once, with their placeholders, and ids index the registry"""
+    print("📜 Testing Template Registry")
+    assert load_template_registry() is TEMPLATES
+    assert [t.id for t in TEMPLATES.templates] == list(range(len(TEMPLATES.templates)))
+    assert all(TEMPLATES.templates[t.id] is t for t in TEMPLATES.rumors)
+    assert {t.fields for t in TEMPLATES.rumors} == {("char1",), ("char1", "char2")}
+    assert all(t.fields == ("initiator", "target") or t.fields == ("target", "initiator")
+               for t in TEMPLATES.outcome_templates(InteractionType.TRADE, True))
+    assert TEMPLATES.outcome_templates(InteractionType.BRAWL, False) is TEMPLATES.default_outcomes
+    assert set(TEMPLATES.atmospheres) == set(AtmosphereType) and set(TEMPLATES.events) == set(EventType)
+
+    template = TEMPLATES.outcome_templates(InteractionType.GAMBLING, False)[2]
+    assert TEMPLATES.render(template.id, initiator="Hans", target="Greta") == \
+        "Hans loses coins to Greta in an unlucky game."
+    assert render_outcome_description("Hans", "Greta", InteractionType.GAMBLING, False, False, True, 2) == \
+        "Hans loses coins to Greta in an unlucky game. Things go terribly wrong!"
+
+def test_simulators_share_templates():
+    """Every simulator uses the same templates, and events get their own effects"""
+    print("🤝 Testing Shared Templates")
+    first, second = TavernSimulator(seed=1), TavernSimulator(seed=2)
+    assert first.event_generator.event_templates is second.event_generator.event_templates
+
+    first.generate_new_tavern()
+    assert first.current_tavern.atmosphere_description in TEMPLATES.atmospheres[first.current_tavern.atmosphere]
+    event = first.event_generator.generate_random_event(first.current_tavern.characters, 50)
+    event.effects["tension_change"] = 999
+    assert all(t.get("effects", {}).get("tension_change") != 999
+               for templates in TEMPLATES.events.values() for t in templates)
+
+    rumor = first.generate_rumor()
+    assert rumor and "{" not in rumor
+
+if __name__ == "__main__":
+    test_registry_parses_templates_once()
+    test_simulators_share_templates()
+    print("\n🎉 Text template tests passed!")
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Test cumulative-weight samplers
+"""
+
+import os
+import random
+import sys
+
+import numpy as np
+
+# Add the current directory to Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from core.weighted_sampler import WeightedSampler, TensionSamplerCache
+from core.event import event_weights
+
+def _linear_pick(weights, rand_val):
+    current_weight = 0
+    for item, weight in weights.items():
+        current_weight += weight
+        if rand_val <= current_weight:
+            return item
+
+def test_sample_matches_linear_walk():
+    """Every possible roll maps to the same item as walking the weights"""
+    print("⚖️ Testing Weighted Sampler")
+    weights = {"a": 3, "b": 0, "c": 5, "d": 2}
+    sampler = WeightedSampler(weights)
+
+    class FixedRoll:
+        def __init__(self, value):
+            self.value = value
+
+        def randint(self, low, high):
+            return self.value
+
+    for roll in range(1, sampler.total + 1):
+        assert sampler.sample(FixedRoll(roll)) == _linear_pick(weights, roll)
+    assert WeightedSampler({"a": 0}).sample(random.Random(0)) is None
+
+def test_batch_draw_frequencies():
+    """Batch draws follow the weights"""
+    print("🎯 Testing Batch Draws")
+    sampler = WeightedSampler({"a": 1, "b": 0, "c": 3})
+    draws = sampler.sample_batch(40_000, np.random.default_rng(0))
+    assert "b" not in draws
+    assert abs(draws.count("c") / len(draws) - 0.75) < 0.02
+
+def test_tension_buckets_are_cached():
+    """Tables are built once per tension bucket"""
+    print("🌡️ Testing Tension Buckets")
+    cache = TensionSamplerCache(event_weights)
+    assert cache.get(80) is cache.get(80)
+    assert cache.get(0).total == sum(event_weights(0).values())
+
+    bucketed = TensionSamplerCache(event_weights, bucket_size=10)
+    assert bucketed.get(41) is bucketed.get(49)
+
+if __name__ == "__main__":
+    test_sample_matches_linear_walk()
+    test_batch_draw_frequencies()
+    test_tension_buckets_are_cached()
+    print("\n🎉 Weighted sampler tests passed!")